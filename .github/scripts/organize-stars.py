@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""Automated GitHub star organizer: file new stars into GitHub Lists.
+
+Stars are paged newest-first through the GraphQL ``starredRepositories``
+connection (100 per page, cursor-driven) and paging stops at the first star
+at or before ``last_starred_at`` in ``.github/star-organizer-state.json``, so
+a scheduled run costs one page per hundred new stars instead of a walk over
+the whole starred set. Each repo is categorized from its topics, primary
+language and name (RULES, first match wins) and the list-membership
+mutations are sent ``--batch`` at a time as aliased ``updateUserListsForItem``
+calls in a single GraphQL request.
+
+``updateUserListsForItem`` sets the item's full list membership. New stars
+are normally in no list, so they are filed into their category alone.
+``--all`` / ``PROCESS_ALL=true`` re-files every star into its current
+category (e.g. after a RULES change), replacing any manual list membership.
+Add ``--skip-listed`` / ``SKIP_LISTED=true`` to read current memberships first
+and leave repos already in any list alone.
+
+The watermark only advances past stars whose mutation succeeded; a failed
+batch is retried on the next run. A category with no matching list is
+logged and skipped (it would never succeed on retry).
+
+Requires the ``gh`` CLI authenticated with a token that can manage lists
+(``GH_TOKEN``). Log lines go to stdout and ``/tmp/star-organizer.log``.
+
+Usage:
+    python3 .github/scripts/organize-stars.py [--all [--skip-listed]] [--dry-run]
+        [--batch N] [--state FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+STATE_FILE = Path(".github/star-organizer-state.json")
+LOG_FILE = Path("/tmp/star-organizer.log")
+PAGE_SIZE = 100
+TOPICS_PER_REPO = 20
+DEFAULT_BATCH = 20
+DEFAULT_CATEGORY = "Utilities"
+
+STARS_QUERY = """
+query($cursor: String) {
+  viewer {
+    starredRepositories(first: %d, after: $cursor, orderBy: {field: STARRED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      edges {
+        starredAt
+        node {
+          id
+          nameWithOwner
+          primaryLanguage { name }
+          repositoryTopics(first: %d) { nodes { topic { name } } }
+        }
+      }
+    }
+  }
+}
+""" % (PAGE_SIZE, TOPICS_PER_REPO)
+
+LISTS_QUERY = """
+query($cursor: String) {
+  viewer {
+    lists(first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes { id name }
+    }
+  }
+}
+"""
+
+LIST_ITEMS_QUERY = """
+query($id: ID!, $cursor: String) {
+  node(id: $id) {
+    ... on UserList {
+      items(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { ... on Repository { id } }
+      }
+    }
+  }
+}
+"""
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One category; matches when any given condition holds (all, with all_of)."""
+
+    category: str
+    topics: str | None = None           # regex over lowercased, comma-joined topics
+    languages: frozenset[str] = frozenset()
+    name: str | None = None             # regex over owner/name
+    all_of: bool = False
+
+
+# First match wins; the order is the precedence.
+RULES = (
+    Rule("MCP", topics=r"mcp", name=r"-mcp"),
+    Rule("Stable Diffusion", topics=r"stable-diffusion|diffusion|sd-webui|comfyui"),
+    Rule("GenAI", topics=r"openai|chatgpt|llm|machine-learning|langchain"),
+    Rule("Kubernetes", topics=r"kubernetes|k8s|helm|kubectl"),
+    Rule("Infrastructure", topics=r"docker|terraform|ansible|devops|github-actions|container|cicd"),
+    Rule("Neovim plugins - untested", topics=r"neovim|nvim|vim-plugin", languages=frozenset({"Vim Script"})),
+    Rule("Obsidian", topics=r"obsidian"),
+    Rule("IoT & Home Automation", topics=r"iot|esp32|arduino|home-assistant|zigbee|mqtt|esphome"),
+    Rule("Game related", topics=r"game|gamedev|game-engine|bevy|godot"),
+    Rule("Rust", languages=frozenset({"Rust"})),
+    Rule("Python", topics=r"python", languages=frozenset({"Python"}), all_of=True),
+    Rule("macos", topics=r"macos|osx"),
+    Rule("zsh", topics=r"zsh|fish-shell|oh-my-zsh"),
+    Rule(
+        "Web Development",
+        topics=r"react|vue|angular|frontend|nextjs|svelte",
+        languages=frozenset({"TypeScript", "JavaScript"}),
+    ),
+    Rule("CLI Tools", topics=r"command-line|terminal"),
+    Rule("Awesome lists", name=r"awesome"),
+    Rule("Dotfiles", topics=r"dotfiles"),
+)
+
+
+@dataclass
+class Star:
+    id: str
+    name: str
+    starred_at: str
+    language: str
+    topics: list[str]
+
+
+def categorize(star: Star) -> str:
+    topics = ",".join(star.topics).lower()
+    for rule in RULES:
+        checks = []
+        if rule.topics is not None:
+            checks.append(bool(re.search(rule.topics, topics)))
+        if rule.languages:
+            checks.append(star.language in rule.languages)
+        if rule.name is not None:
+            checks.append(bool(re.search(rule.name, star.name)))
+        if (all if rule.all_of else any)(checks):
+            return rule.category
+    return DEFAULT_CATEGORY
+
+
+def log(level: str, message: str) -> None:
+    line = f"[{datetime.now(timezone.utc):%Y-%m-%d %H:%M:%S} UTC] {level}: {message}"
+    print(line, flush=True)
+    with LOG_FILE.open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def graphql(query: str, **variables: str | None) -> dict:
+    """Run a query via ``gh api graphql``; returns the full payload.
+
+    gh exits non-zero on partial GraphQL errors but still prints the payload,
+    so stdout is parsed whenever it is JSON.
+    """
+    argv = ["gh", "api", "graphql", "-f", f"query={query}"]
+    for key, value in variables.items():
+        if value is not None:
+            argv += ["-f", f"{key}={value}"]
+    result = subprocess.run(argv, capture_output=True, text=True)
+    try:
+        payload = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        raise RuntimeError(result.stderr.strip() or f"gh exited {result.returncode}") from None
+    if not payload.get("data") and payload.get("errors"):
+        raise RuntimeError("; ".join(e.get("message", "?") for e in payload["errors"]))
+    return payload
+
+
+def fetch_new_stars(since: str | None) -> tuple[list[Star], int]:
+    """Stars newer than ``since``, oldest first, and the number of pages read."""
+    stars: list[Star] = []
+    cursor, pages = None, 0
+    while True:
+        conn = graphql(STARS_QUERY, cursor=cursor)["data"]["viewer"]["starredRepositories"]
+        pages += 1
+        for edge in conn["edges"]:
+            if since and edge["starredAt"] <= since:
+                return stars[::-1], pages
+            node = edge["node"]
+            stars.append(Star(
+                id=node["id"],
+                name=node["nameWithOwner"],
+                starred_at=edge["starredAt"],
+                language=(node.get("primaryLanguage") or {}).get("name") or "None",
+                topics=[t["topic"]["name"] for t in node["repositoryTopics"]["nodes"]],
+            ))
+        if not conn["pageInfo"]["hasNextPage"]:
+            return stars[::-1], pages
+        cursor = conn["pageInfo"]["endCursor"]
+
+
+def fetch_lists() -> dict[str, str]:
+    """List name -> list ID."""
+    lists: dict[str, str] = {}
+    cursor = None
+    while True:
+        conn = graphql(LISTS_QUERY, cursor=cursor)["data"]["viewer"]["lists"]
+        lists.update({n["name"]: n["id"] for n in conn["nodes"]})
+        if not conn["pageInfo"]["hasNextPage"]:
+            return lists
+        cursor = conn["pageInfo"]["endCursor"]
+
+
+def fetch_listed_repos(list_ids: list[str]) -> set[str]:
+    """IDs of repos already in any of the lists."""
+    listed: set[str] = set()
+    for list_id in list_ids:
+        cursor = None
+        while True:
+            conn = graphql(LIST_ITEMS_QUERY, id=list_id, cursor=cursor)["data"]["node"]["items"]
+            listed.update(n["id"] for n in conn["nodes"] if n)
+            if not conn["pageInfo"]["hasNextPage"]:
+                break
+            cursor = conn["pageInfo"]["endCursor"]
+    return listed
+
+
+def add_batch(batch: list[tuple[Star, str]]) -> set[str]:
+    """Send one aliased mutation per (star, list ID); returns failed star IDs."""
+    fields = [
+        f"m{i}: updateUserListsForItem(input: {{itemId: {json.dumps(star.id)}, "
+        f"listIds: [{json.dumps(list_id)}]}}) {{ clientMutationId }}"
+        for i, (star, list_id) in enumerate(batch)
+    ]
+    try:
+        payload = graphql("mutation {\n" + "\n".join(fields) + "\n}")
+    except RuntimeError as exc:
+        log("ERROR", f"Batch of {len(batch)} failed: {exc}")
+        return {star.id for star, _ in batch}
+    data = payload.get("data") or {}
+    failed = set()
+    for i, (star, _) in enumerate(batch):
+        if data.get(f"m{i}") is None:
+            failed.add(star.id)
+    for error in payload.get("errors", []):
+        log("ERROR", f"{error.get('path', ['?'])[0]}: {error.get('message', '?')}")
+    return failed
+
+
+def load_state(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {"last_run": None, "last_starred_at": None}
+
+
+def save_state(path: Path, last_starred_at: str | None) -> None:
+    state = {
+        "last_run": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "last_starred_at": last_starred_at,
+    }
+    path.write_text(json.dumps(state, indent=2) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--all", action="store_true", default=os.environ.get("PROCESS_ALL") == "true",
+                    help="process every star, ignoring state (env: PROCESS_ALL=true)")
+    ap.add_argument("--skip-listed", action="store_true", default=os.environ.get("SKIP_LISTED") == "true",
+                    help="leave repos already in any list alone (env: SKIP_LISTED=true)")
+    ap.add_argument("--dry-run", action="store_true", help="categorize and log without mutating or saving")
+    ap.add_argument("--batch", type=int, default=DEFAULT_BATCH, help="mutations per GraphQL request")
+    ap.add_argument("--state", type=Path, default=STATE_FILE, help="state file")
+    args = ap.parse_args()
+
+    log("INFO", "Starting GitHub star organization")
+    state = load_state(args.state)
+    since = None if args.all else state.get("last_starred_at")
+    if args.all:
+        log("INFO", "Processing ALL starred repos (ignoring state)")
+    elif since:
+        log("INFO", f"Processing stars since: {since}")
+    else:
+        log("INFO", "No previous state - processing all stars")
+
+    stars, pages = fetch_new_stars(since)
+    log("INFO", f"Found {len(stars)} repos to process ({pages} page(s) fetched)")
+    if not stars:
+        log("INFO", "No new starred repos to process")
+        return 0
+
+    lists = fetch_lists()
+    listed = fetch_listed_repos(list(lists.values())) if args.skip_listed else set()
+
+    plan: list[tuple[Star, str]] = []
+    unmatched = already = 0
+    for star in stars:
+        category = categorize(star)
+        if star.id in listed:
+            already += 1
+            continue
+        if category not in lists:
+            log("WARN", f"List '{category}' not found for {star.name}")
+            unmatched += 1
+            continue
+        plan.append((star, category))
+
+    failed: set[str] = set()
+    for start in range(0, len(plan), max(args.batch, 1)):
+        batch = plan[start:start + max(args.batch, 1)]
+        if args.dry_run:
+            for star, category in batch:
+                log("INFO", f"[dry-run] {star.name} -> '{category}'")
+            continue
+        failed |= add_batch([(star, lists[category]) for star, category in batch])
+        for star, category in batch:
+            if star.id in failed:
+                log("ERROR", f"Failed to add {star.name} to '{category}'")
+            else:
+                log("INFO", f"Added {star.name} to '{category}'")
+
+    # Advance only up to the newest star older than the first failure, so the
+    # next run retries from there.
+    watermark = since
+    for star in stars:
+        if star.id in failed:
+            break
+        watermark = star.starred_at
+    if not args.dry_run:
+        save_state(args.state, watermark)
+
+    log("INFO", "==========================================")
+    log("INFO", "SUMMARY")
+    log("INFO", "==========================================")
+    log("INFO", f"Total processed: {len(stars)}")
+    log("INFO", f"Success: {len(plan) - len(failed)}")
+    log("INFO", f"Failed: {len(failed) + unmatched}")
+    if already:
+        log("INFO", f"Already in a list: {already}")
+    log("INFO", f"Last starred at: {watermark or 'N/A'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,15 +7,28 @@ This helper assumes a local AIQ server running with REQUIRE_AUTH=false.
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import contextlib
+import gzip
+import hashlib
+import http.client
 import json
 import os
 import re
+import select
+import shutil
+import socket
+import ssl
+import statistics
 import sys
+import tempfile
+import threading
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from typing import Any
 
 _CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f\x7f]")
@@ -49,6 +62,9 @@ HEALTH_TIMEOUT_SECONDS = _int_const("10")
 DEFAULT_API_TIMEOUT_SECONDS = _int_const("120")
 DEFAULT_LONG_HTTP_TIMEOUT_SECONDS = _int_const("3600")
 JOB_POLL_INTERVAL_SECONDS = _int_const("15")
+JOB_POLL_INITIAL_INTERVAL_SECONDS = 1
+JOB_POLL_BACKOFF_FACTOR = 2
+NO_TIME_LEFT = 0
 STATUS_CHECK_MAX_ATTEMPTS = _int_const("3")
 POLL_MAX_CONSECUTIVE_ERRORS = _int_const("3")
 JSON_INDENT_SPACES = 2
@@ -59,18 +75,60 @@ MIN_COMMAND_ARG_COUNT = 2
 COMMAND_NAME_POSITION = 1
 COMMAND_ARGS_START_POSITION = 2
 OPENAI_FIRST_CHOICE_POSITION = 0
-DATA_PREFIX = "data:"
-EVENT_PREFIX = "event:"
 JOB_ID_HEX_DASH_LENGTH = _int_const("36")
 NO_CONSECUTIVE_ERRORS = 0
 ERROR_INCREMENT = 1
 FIRST_RETRY_ATTEMPT = 1
 CAPTURE_GROUP_JOB_ID = 1
+BATCH_DEFAULT_CONCURRENCY = _int_const("8")
+BATCH_MIN_CONCURRENCY = 1
+FIRST_LINE_NUMBER = 1
+OPTION_VALUE_OFFSET = 1
+OPTION_PAIR_LENGTH = 2
+STDIN_PATH = "-"
+HTTP_SUCCESS_STATUS_MIN = _int_const("200")
+HTTP_NO_CONTENT = _int_const("204")
+HTTP_NOT_MODIFIED = _int_const("304")
+HTTP_REDIRECT_STATUS_MIN = _int_const("300")
+HTTP_ERROR_STATUS_MIN = _int_const("400")
+POOL_MAX_IDLE_CONNECTIONS = _int_const("4")
+HTTP_DEFAULT_PORT = _int_const("80")
+HTTPS_DEFAULT_PORT = _int_const("443")
+HTTP_STATUS_CODE_POSITION = 1
+HTTP_STATUS_LINE_MIN_PARTS = 2
+HTTP_STATUS_LINE_MAX_SPLIT = 2
+CHUNK_SIZE_RADIX = _int_const("16")
+LAST_CHUNK_SIZE = 0
+CHUNK_EXTENSION_SEPARATOR = b";"
+CHUNK_SIZE_FIELD = 0
+STREAM_READ_BYTES = _int_const("65536")
+NO_BYTES_REMAINING = 0
+SSE_DEFAULT_EVENT_TYPE = "message"
+SSE_DEFAULT_RETRY_MS = _int_const("1000")
+SSE_MAX_RECONNECTS = _int_const("5")
+SSE_MAX_TOTAL_RECONNECTS = _int_const("50")
+MILLISECONDS_PER_SECOND = _int_const("1000")
+MILLISECOND_DECIMALS = 1
+METRICS_FIRST_SAMPLE = 1
+WATCH_MAX_INTERVAL_SECONDS = JOB_POLL_INTERVAL_SECONDS
+WATCH_JOB_ID_CHARS = 8
+WATCH_MIN_SUMMARY_CHARS = _int_const("20")
+WATCH_SUMMARY_INDENT_CHARS = _int_const("14")
+SECONDS_PER_MINUTE = _int_const("60")
+STATUS_FETCH_WORKERS = 2
+CACHE_DEFAULT_MAX_BYTES = _int_const("268435456")
+CACHE_DEFAULT_TTL_SECONDS = _int_const("86400")
+CACHE_NO_QUERY_REUSE = 0
+CACHE_INDEX_VERSION = 1
 
 _DONE_JOB_STATES = frozenset({"completed", "success", "failed", "cancelled", "failure"})
 _SUCCESS_JOB_STATES = frozenset({"completed", "success"})
 _FAILED_JOB_STATES = frozenset({"failed", "failure", "cancelled"})
+_GLOBAL_OPTIONS = frozenset({"--no-cache", "--metrics"})
+_BODYLESS_STATUSES = frozenset({HTTP_NO_CONTENT, HTTP_NOT_MODIFIED})
 _STREAM_TERMINAL_EVENTS = frozenset({"complete", "error", "done"})
+_QUEUED_JOB_STATES = frozenset({"pending", "queued", "submitted", "created"})
+_METRIC_PATH_RE = re.compile(r"^/v1/jobs/async/(?:submit|job/[^/]+(?:/(?P<leaf>state|report|cancel|stream))?)$")
 _CHAT_JOB_ID_RE = re.compile(rf"Job ID:\s*([0-9a-f-]{{{JOB_ID_HEX_DASH_LENGTH}}})", re.IGNORECASE)
 
 
@@ -91,10 +149,247 @@ def _validate_base_url(url: str) -> str:
     return raw.rstrip("/")
 
 
+def _metric_name(method: str, path: str) -> str:
+    """Name the API call a request belongs to, e.g. ``status`` for ``GET /v1/jobs/async/job/<id>``."""
+    match = _METRIC_PATH_RE.match(path)
+    if match is None:
+        return path.strip("/").replace("/", "_") or "root"
+    if path.endswith("/submit"):
+        return "submit"
+    return match.group("leaf") or ("status" if method == "GET" else "job")
+
+
+class _Metrics:
+    """Opt-in client-side timings, summarised on exit.
+
+    Records every HTTP exchange by API call (``submit``, ``status``, ``report``...), event-stream connects and event
+    counts, and per-job phase timestamps: submitted, first seen running (queue time), terminal state, and report
+    downloaded, plus a ``jobs_<state>`` count of each job's terminal state. Job states are only seen when a poll or
+    stream event reports them, so phase boundaries are accurate to the poll interval. Thread-safe for ``batch``.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self._timings: dict[str, list[float]] = {}
+        self._counters: dict[str, int] = {}
+        self._jobs: dict[str, dict[str, float]] = {}
+        self._outcomes: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._timings.setdefault(name, []).append(seconds)
+
+    def count(self, name: str, amount: int = METRICS_FIRST_SAMPLE) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def job_phase(self, job_id: str, phase: str) -> None:
+        """Record the first time a job reaches a phase."""
+        with self._lock:
+            self._jobs.setdefault(job_id, {}).setdefault(phase, time.monotonic())
+
+    def job_state(self, job_id: str, state: str | None) -> None:
+        """Translate an observed job state into phase marks."""
+        if not state:
+            return
+        if state in _DONE_JOB_STATES:
+            self.job_phase(job_id, "terminal")
+            with self._lock:
+                first = job_id not in self._outcomes
+                self._outcomes.setdefault(job_id, state)
+            if first:
+                self.count(f"jobs_{state}")
+        elif state not in _QUEUED_JOB_STATES:
+            self.job_phase(job_id, "running")
+
+    def summary(self) -> dict[str, float | int]:
+        """Flatten everything recorded into metric name -> value (milliseconds for durations)."""
+        with self._lock:
+            timings = {name: list(samples) for name, samples in self._timings.items()}
+            values: dict[str, float | int] = dict(self._counters)
+            jobs = [dict(phases) for phases in self._jobs.values()]
+        values["wall_ms"] = _ms(time.monotonic() - self.started)
+        phase_spans = {
+            "job_queue": ("submitted", "running"),
+            "job_run": ("submitted", "terminal"),
+            "job_report": ("terminal", "reported"),
+        }
+        for name, (start, end) in phase_spans.items():
+            spans = [phases[end] - phases[start] for phases in jobs if start in phases and end in phases]
+            if spans:
+                timings[name] = spans
+        for name, samples in sorted(timings.items()):
+            values[f"{name}_count"] = len(samples)
+            values[f"{name}_total_ms"] = _ms(sum(samples))
+            values[f"{name}_p50_ms"] = _ms(statistics.median(samples))
+            values[f"{name}_max_ms"] = _ms(max(samples))
+        stream_seconds = sum(timings.get("stream_open", []))
+        if stream_seconds and values.get("stream_events"):
+            values["stream_events_per_sec"] = round(values["stream_events"] / stream_seconds, MILLISECOND_DECIMALS)
+        return values
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * MILLISECONDS_PER_SECOND, MILLISECOND_DECIMALS)
+
+
+_METRICS: _Metrics | None = None
+
+
+def _emit_metrics(command: str) -> None:
+    """Print the metrics summary as KEY=VALUE lines on stderr, or append it as one JSON line to AIQ_METRICS_FILE."""
+    if _METRICS is None:
+        return
+    values = _METRICS.summary()
+    metrics_file = os.environ.get("AIQ_METRICS_FILE")
+    if metrics_file:
+        record = {"timestamp": time.time(), "command": command, "server": AIQ_SERVER_URL, "metrics": values}
+        try:
+            with open(metrics_file, "a", encoding="utf-8") as handle:
+                handle.write(json.dumps(record) + "\n")
+        except OSError as exc:
+            print(f"Cannot append metrics to {metrics_file}: {exc}", file=sys.stderr)
+        return
+    print(f"METRICS_COMMAND={command}", file=sys.stderr)
+    for name, value in values.items():
+        print(f"METRIC_{name.upper()}={value}", file=sys.stderr)
+
+
+# A reused keep-alive connection the server already closed fails with one of these before any response arrives.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+# Methods safe to resend after a stale connection failed mid-exchange.
+_IDEMPOTENT_METHODS = frozenset({"GET"})
+
+
+def _connection_dropped(sock: socket.socket) -> bool:
+    """An idle keep-alive socket that is readable has been closed by the server (or is out of sync)."""
+    try:
+        readable, _writable, _errors = select.select([sock], [], [], NO_TIME_LEFT)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class _Backend:
+    """Validated AI-Q base URL plus a small pool of keep-alive HTTP connections.
+
+    The base URL is validated and parsed once; every request then reuses an idle connection instead of repeating the
+    TCP (and TLS) handshake. A reused connection the server has since closed is replaced transparently, except that a
+    non-idempotent request is only resent when it failed before it was fully sent.
+    """
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = _validate_base_url(base_url)
+        parsed = urllib.parse.urlparse(self.base_url)
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname or ""
+        self._port = parsed.port
+        self._path_prefix = parsed.path
+        self._ssl_context = ssl.create_default_context() if parsed.scheme == "https" else None
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        """Return the absolute URL for a validated API path."""
+        return f"{self.base_url}{path}"
+
+    def target(self, path: str) -> str:
+        """Return the request target for a validated API path, including any base-URL path prefix."""
+        return f"{self._path_prefix}{path}"
+
+    def connect(self, timeout: float) -> http.client.HTTPConnection:
+        """Open a new, unpooled connection to the backend."""
+        if self._ssl_context is not None:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+
+    def _checkout(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused) — an idle pooled connection when one is still open."""
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                return self.connect(timeout), False
+            if conn.sock is not None and not _connection_dropped(conn.sock):
+                break
+            conn.close()
+        conn.timeout = timeout
+        conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _checkin(self, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the idle pool, closing it when the pool is full."""
+        with self._lock:
+            if len(self._idle) < POOL_MAX_IDLE_CONNECTIONS:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, bytes]:
+        """Send one request over a pooled connection and return (status, body bytes)."""
+        target = self.target(path)
+        while True:
+            conn, reused = self._checkout(timeout)
+            started = time.monotonic()
+            sent = False
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                payload = resp.read()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                # Once a POST is out the server may have acted on it; resending could submit a job twice.
+                if reused and (not sent or method in _IDEMPOTENT_METHODS):
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(conn)
+            if _METRICS is not None:
+                _METRICS.observe(f"http_{_metric_name(method, path)}", time.monotonic() - started)
+                _METRICS.count("http_requests")
+                _METRICS.count("http_bytes_received", len(payload))
+                if reused:
+                    _METRICS.count("http_connections_reused")
+            return resp.status, payload
+
+
+_BACKENDS: dict[str, _Backend] = {}
+_BACKENDS_LOCK = threading.Lock()
+
+
+def _backend() -> _Backend:
+    """Return the shared backend for the configured AIQ_SERVER_URL, validating it on first use."""
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(AIQ_SERVER_URL)
+        if backend is None:
+            backend = _BACKENDS[AIQ_SERVER_URL] = _Backend(AIQ_SERVER_URL)
+        return backend
+
+
 def _show_query_target(api_path: str) -> None:
     """Disclose the destination before transmitting user-provided query text."""
     print(
-        f"Sending user query text to configured AI-Q backend: {_validate_base_url(AIQ_SERVER_URL)}{api_path}",
+        f"Sending user query text to configured AI-Q backend: {_backend().url(api_path)}",
         file=sys.stderr,
     )
 
@@ -135,25 +430,37 @@ def _api_request(
         raise RuntimeError(f"Unsupported HTTP method: {method!r}")
     _validate_api_path(path)
 
-    url = f"{_validate_base_url(AIQ_SERVER_URL)}{path}"
+    backend = _backend()
+    url = backend.url(path)
     data = None if body is None else json.dumps(body).encode("utf-8")
-    if method == "POST":
-        request_payload = {"url": url, "headers": dict(_HEADLESS_HEADERS), "method": method, "data": data}
-    else:
-        request_payload = {"url": url, "method": method}
-    req = urllib.request.Request(**request_payload)
+    headers = dict(_HEADLESS_HEADERS) if method == "POST" else {}
 
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            payload = resp.read().decode("utf-8")
-    except urllib.error.HTTPError as exc:
-        error_body = exc.read().decode("utf-8", errors="replace")
-        print(f"HTTP {exc.code}: {error_body[:ERROR_BODY_PREVIEW_CHARS]}", file=sys.stderr)
-        raise RuntimeError(f"HTTP {exc.code}") from exc
-    except urllib.error.URLError as exc:
-        print(f"Connection failed for {url}: {exc.reason}", file=sys.stderr)
-        raise RuntimeError(f"Connection failed: {exc.reason}") from exc
-
+        status, raw = backend.request(method, path, body=data, headers=headers, timeout=timeout)
+    except (OSError, http.client.HTTPException) as exc:
+        print(f"Connection failed for {url}: {exc}", file=sys.stderr)
+        raise RuntimeError(f"Connection failed: {exc}") from exc
+    _raise_for_status(status, raw)
+    return _decode_json_payload(raw)
+
+
+def _raise_for_status(status: int, raw: bytes) -> None:
+    """Report an HTTP error or redirect response on stderr and raise RuntimeError.
+
+    Redirects are not followed: their body is not the API response, and resending a POST elsewhere is not safe.
+    """
+    if HTTP_REDIRECT_STATUS_MIN <= status < HTTP_ERROR_STATUS_MIN:
+        print(f"HTTP {status}: redirect not followed; point AIQ_SERVER_URL at the final URL", file=sys.stderr)
+        raise RuntimeError(f"HTTP {status} redirect")
+    if status >= HTTP_ERROR_STATUS_MIN:
+        error_body = raw.decode("utf-8", errors="replace")
+        print(f"HTTP {status}: {error_body[:ERROR_BODY_PREVIEW_CHARS]}", file=sys.stderr)
+        raise RuntimeError(f"HTTP {status}")
+
+
+def _decode_json_payload(raw: bytes) -> dict[str, Any]:
+    """Decode a JSON API response body; an empty body is an empty object."""
+    payload = raw.decode("utf-8")
     if not payload:
         return {}
     try:
@@ -163,23 +470,206 @@ def _api_request(
         raise RuntimeError(f"Invalid JSON in API response: {exc}") from exc
 
 
-def _stream_request(path: str, *, timeout: int = DEFAULT_LONG_HTTP_TIMEOUT_SECONDS) -> Iterator[str]:
-    """Yield stripped text lines from an AI-Q streaming endpoint."""
+@dataclass(frozen=True)
+class SSEEvent:
+    """One dispatched server-sent event.
+
+    ``id`` is the stream's last event ID when it was dispatched; ``own_id`` is the ``id:`` field of this event's own
+    block, or None when it carried none and merely inherits ``id``.
+    """
+
+    event: str
+    data: str
+    id: str | None
+    own_id: str | None = None
+
+
+_SSE_LINE_END_RE = re.compile(rb"\r\n|\r|\n")
+
+
+class SSEParser:
+    """Incremental ``text/event-stream`` parser following the WHATWG HTML event-stream interpretation rules.
+
+    Feed raw bytes in arbitrary chunks; complete events come back as ``SSEEvent`` objects. Multi-line ``data:`` fields
+    are joined with newlines, ``id:`` updates ``last_event_id`` (for ``Last-Event-ID`` on reconnect), ``retry:`` updates
+    ``retry_ms``, comment lines are ignored, and CR, LF, or CRLF line endings are accepted even when split across chunks.
+    """
+
+    def __init__(self) -> None:
+        self.last_event_id: str | None = None
+        self.retry_ms: int | None = None
+        self._buffer = b""
+        self._skip_lf = False
+        self._bom_checked = False
+        self._event_type = ""
+        self._event_id: str | None = None
+        self._data: list[str] = []
+
+    def feed(self, chunk: bytes) -> list[SSEEvent]:
+        """Consume a chunk of the stream and return every event it completes."""
+        buffer = self._buffer + chunk
+        if self._skip_lf and buffer:
+            self._skip_lf = False
+            if buffer.startswith(b"\n"):
+                buffer = buffer[1:]
+        if not self._bom_checked:
+            if len(buffer) < len(codecs.BOM_UTF8) and codecs.BOM_UTF8.startswith(buffer):
+                self._buffer = buffer
+                return []
+            self._bom_checked = True
+            buffer = buffer.removeprefix(codecs.BOM_UTF8)
+
+        events = []
+        start = 0
+        for match in _SSE_LINE_END_RE.finditer(buffer):
+            event = self._process_line(buffer[start : match.start()])
+            if event is not None:
+                events.append(event)
+            start = match.end()
+        # A trailing CR may be the first half of a CRLF split across chunks.
+        self._skip_lf = start == len(buffer) and buffer.endswith(b"\r")
+        self._buffer = buffer[start:]
+        return events
+
+    def _process_line(self, raw: bytes) -> SSEEvent | None:
+        if not raw:
+            return self._dispatch()
+        line = raw.decode("utf-8", errors="replace")
+        if line.startswith(":"):
+            return None
+        name, separator, value = line.partition(":")
+        if separator and value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            self._event_type = value
+        elif name == "data":
+            self._data.append(value)
+        elif name == "id" and "\0" not in value:
+            self.last_event_id = self._event_id = value
+        elif name == "retry" and value.isascii() and value.isdigit():
+            self.retry_ms = int(value)
+        return None
+
+    def _dispatch(self) -> SSEEvent | None:
+        data, event_type, own_id = self._data, self._event_type, self._event_id
+        self._data, self._event_type, self._event_id = [], "", None
+        if not data:
+            return None
+        return SSEEvent(
+            event=event_type or SSE_DEFAULT_EVENT_TYPE, data="\n".join(data), id=self.last_event_id, own_id=own_id
+        )
+
+
+def _sse_headers(parser: SSEParser) -> dict[str, str]:
+    """Request headers for (re)connecting an event stream, resuming after the last seen event ID."""
+    headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+    if parser.last_event_id:
+        headers["Last-Event-ID"] = parser.last_event_id
+    return headers
+
+
+def _sse_reconnect_delay(parser: SSEParser) -> float:
+    """Seconds to wait before reconnecting, honouring the server's ``retry:`` field."""
+    retry_ms = SSE_DEFAULT_RETRY_MS if parser.retry_ms is None else parser.retry_ms
+    return retry_ms / MILLISECONDS_PER_SECOND
+
+
+class _StreamProgress:
+    """Reconnect bookkeeping shared by the blocking and asyncio event-stream readers.
+
+    Only an event carrying its own ID not seen before counts as progress and resets the consecutive-reconnect budget;
+    events a server replays after ignoring ``Last-Event-ID`` are dropped rather than yielded twice. Events without an
+    ``id:`` field of their own are always accepted, since the ID they inherit says nothing about replay. Reconnects are also capped in
+    total, and a clean end of stream after a terminal event ends the stream instead of reconnecting.
+    """
+
+    def __init__(self) -> None:
+        self.reconnects = NO_CONSECUTIVE_ERRORS
+        self.total_reconnects = NO_CONSECUTIVE_ERRORS
+        self.terminal = False
+        self._seen_ids: set[str] = set()
+
+    def accept(self, event: SSEEvent) -> bool:
+        """Record an event; False for a replay of one already delivered."""
+        if event.own_id:
+            if event.own_id in self._seen_ids:
+                return False
+            self._seen_ids.add(event.own_id)
+            self.reconnects = NO_CONSECUTIVE_ERRORS
+        self.terminal = self.terminal or _event_terminal_state(event)[0]
+        return True
+
+    def exhausted(self) -> bool:
+        return self.reconnects >= SSE_MAX_RECONNECTS or self.total_reconnects >= SSE_MAX_TOTAL_RECONNECTS
+
+    def retry(self) -> None:
+        self.reconnects += ERROR_INCREMENT
+        self.total_reconnects += ERROR_INCREMENT
+
+
+def _stream_events(path: str, *, deadline: float | None = None, verbose: bool = True) -> Iterator[SSEEvent]:
+    """Yield events from an AI-Q event stream, reconnecting with ``Last-Event-ID`` when an established stream drops.
+
+    A failed first connection or an HTTP error raises RuntimeError. After a drop, up to ``SSE_MAX_RECONNECTS``
+    consecutive reconnects without a new event (``SSE_MAX_TOTAL_RECONNECTS`` overall) are attempted; the stream then
+    ends (or raises if the last attempt failed to connect). A stream the server closes cleanly after a terminal event
+    ends there. The caller stops iterating once it sees the event it is waiting for.
+    """
     _validate_api_path(path)
-    url = f"{_validate_base_url(AIQ_SERVER_URL)}{path}"
-    req = urllib.request.Request(url, method="GET")
-
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            for raw_line in resp:
-                yield raw_line.decode("utf-8", errors="replace").strip()
-    except urllib.error.HTTPError as exc:
-        error_body = exc.read().decode("utf-8", errors="replace")
-        print(f"HTTP {exc.code}: {error_body[:ERROR_BODY_PREVIEW_CHARS]}", file=sys.stderr)
-        raise RuntimeError(f"HTTP {exc.code}") from exc
-    except urllib.error.URLError as exc:
-        print(f"Connection failed for {url}: {exc.reason}", file=sys.stderr)
-        raise RuntimeError(f"Connection failed: {exc.reason}") from exc
+    backend = _backend()
+    url = backend.url(path)
+    parser = SSEParser()
+    established = False
+    progress = _StreamProgress()
+    while True:
+        remaining = DEFAULT_LONG_HTTP_TIMEOUT_SECONDS if deadline is None else deadline - time.time()
+        error: Exception | None = None
+        conn = backend.connect(max(int(remaining), HEALTH_TIMEOUT_SECONDS))
+        started = time.monotonic()
+        try:
+            try:
+                conn.request("GET", backend.target(path), headers=_sse_headers(parser))
+                resp = conn.getresponse()
+            except (OSError, http.client.HTTPException) as exc:
+                error = exc
+            else:
+                if resp.status >= HTTP_REDIRECT_STATUS_MIN:
+                    _raise_for_status(resp.status, resp.read())
+                established = True
+                if _METRICS is not None:
+                    _METRICS.observe("stream_connect", time.monotonic() - started)
+                try:
+                    while chunk := resp.read1(STREAM_READ_BYTES):
+                        for event in parser.feed(chunk):
+                            if not progress.accept(event):
+                                continue
+                            if _METRICS is not None:
+                                _METRICS.count("stream_events")
+                            yield event
+                except (OSError, http.client.HTTPException) as exc:
+                    error = exc
+        finally:
+            conn.close()
+            if _METRICS is not None and established:
+                _METRICS.observe("stream_open", time.monotonic() - started)
+
+        if error is None and progress.terminal:
+            return
+        if not established or progress.exhausted():
+            if error is None:
+                return
+            print(f"Connection failed for {url}: {error}", file=sys.stderr)
+            raise RuntimeError(f"Connection failed: {error}") from error
+        delay = _sse_reconnect_delay(parser)
+        if deadline is not None and time.time() + delay >= deadline:
+            return
+        progress.retry()
+        if _METRICS is not None:
+            _METRICS.count("stream_reconnects")
+        if verbose:
+            resume = f" after event {parser.last_event_id}" if parser.last_event_id else ""
+            print(f"  Event stream dropped, reconnecting{resume} ({progress.reconnects}/{SSE_MAX_RECONNECTS})...", file=sys.stderr)
+        time.sleep(delay)
 
 
 def health() -> dict[str, Any]:
@@ -201,7 +691,10 @@ def submit_job(query: str, agent_type: str = DEFAULT_AGENT_TYPE) -> dict[str, An
     """Submit an explicit async research job to AI-Q."""
     body = {"agent_type": _validate_agent_type(agent_type), "input": query}
     _show_query_target("/v1/jobs/async/submit")
-    return _api_request("POST", "/v1/jobs/async/submit", body=body, timeout=DEFAULT_LONG_HTTP_TIMEOUT_SECONDS)
+    result = _api_request("POST", "/v1/jobs/async/submit", body=body, timeout=DEFAULT_LONG_HTTP_TIMEOUT_SECONDS)
+    if _METRICS is not None and isinstance(result.get("job_id"), str):
+        _METRICS.job_phase(result["job_id"], "submitted")
+    return result
 
 
 def get_job_status(job_id: str) -> dict[str, Any]:
@@ -225,13 +718,10 @@ def cancel_job(job_id: str) -> dict[str, Any]:
 
 
 def stream_job(job_id: str) -> None:
-    """Print server-sent event payloads for an async AI-Q job."""
-    for line in _stream_request(f"/v1/jobs/async/job/{_validate_job_id(job_id)}/stream"):
-        if line.startswith(DATA_PREFIX):
-            data = line[len(DATA_PREFIX) :].strip()
-            if data:
-                print(data, flush=True)
-        elif line.startswith(EVENT_PREFIX) and line[len(EVENT_PREFIX) :].strip() in _STREAM_TERMINAL_EVENTS:
+    """Print server-sent event payloads for an async AI-Q job until a terminal event."""
+    for event in _stream_events(f"/v1/jobs/async/job/{_validate_job_id(job_id)}/stream"):
+        print(event.data, flush=True)
+        if _event_terminal_state(event)[0]:
             break
 
 
@@ -242,15 +732,27 @@ def chat_request(query: str) -> dict[str, Any]:
     return _api_request("POST", "/chat", body=body, timeout=DEFAULT_LONG_HTTP_TIMEOUT_SECONDS)
 
 
+def _next_poll_interval(interval: float) -> float:
+    """Return the next exponential-backoff poll interval, capped at the legacy fixed interval."""
+    return min(interval * JOB_POLL_BACKOFF_FACTOR, JOB_POLL_INTERVAL_SECONDS)
+
+
 def poll_until_complete(
     job_id: str,
     *,
     timeout: int = DEFAULT_LONG_HTTP_TIMEOUT_SECONDS,
     max_consecutive_errors: int = POLL_MAX_CONSECUTIVE_ERRORS,
+    verbose: bool = True,
 ) -> dict[str, Any]:
-    """Poll a job until it reaches a terminal state or timeout."""
+    """Poll a job with adaptive exponential backoff until it reaches a terminal state or timeout.
+
+    The interval starts at JOB_POLL_INITIAL_INTERVAL_SECONDS, doubles up to JOB_POLL_INTERVAL_SECONDS, and resets
+    whenever the job changes state, so short jobs finish promptly and long jobs make few status calls.
+    """
     deadline = time.time() + timeout
     consecutive_errors = NO_CONSECUTIVE_ERRORS
+    interval: float = JOB_POLL_INITIAL_INTERVAL_SECONDS
+    last_state = None
     while time.time() < deadline:
         try:
             status = get_job_status(job_id)
@@ -269,19 +771,742 @@ def poll_until_complete(
             continue
 
         state = status.get("status", "UNKNOWN").lower()
+        if _METRICS is not None:
+            _METRICS.job_state(job_id, state)
         if state in _DONE_JOB_STATES:
             return status
-        print(f"  Status: {state}", file=sys.stderr, flush=True)
-        time.sleep(JOB_POLL_INTERVAL_SECONDS)
+        if state != last_state:
+            if verbose:
+                print(f"  Status: {state}", file=sys.stderr, flush=True)
+            interval = JOB_POLL_INITIAL_INTERVAL_SECONDS
+            last_state = state
+        time.sleep(max(min(interval, deadline - time.time()), NO_TIME_LEFT))
+        interval = _next_poll_interval(interval)
 
     print("  Timed out waiting for job.", file=sys.stderr)
     return {"status": "TIMEOUT"}
 
 
-def _poll_until_success_or_exit(job_id: str) -> None:
-    """Poll a job, print its report on success, and exit on failure."""
+def _event_job_state(data: str) -> str | None:
+    """Return the lower-cased job status carried by an SSE data payload, if any."""
     try:
-        final = poll_until_complete(job_id)
+        payload = json.loads(data)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    status = payload.get("status") or payload.get("state")
+    return status.lower() if isinstance(status, str) else None
+
+
+def _event_terminal_state(event: SSEEvent) -> tuple[bool, str | None]:
+    """Return (is_terminal, job_state) for one event of a job stream."""
+    state = _event_job_state(event.data)
+    return event.event in _STREAM_TERMINAL_EVENTS or state in _DONE_JOB_STATES, state
+
+
+def _stream_until_terminal(job_id: str, *, deadline: float, verbose: bool = True) -> bool:
+    """Follow a job's SSE stream until a terminal event; return False if the stream ends first."""
+    path = f"/v1/jobs/async/job/{_validate_job_id(job_id)}/stream"
+    last_state = None
+    for event in _stream_events(path, deadline=deadline, verbose=verbose):
+        terminal, state = _event_terminal_state(event)
+        if _METRICS is not None:
+            _METRICS.job_state(job_id, state)
+            if terminal:
+                _METRICS.job_phase(job_id, "terminal")
+        if terminal:
+            return True
+        if state and state != last_state and verbose:
+            print(f"  Status: {state}", file=sys.stderr, flush=True)
+            last_state = state
+        if time.time() >= deadline:
+            return False
+    return False
+
+
+def wait_for_completion(
+    job_id: str,
+    *,
+    timeout: int = DEFAULT_LONG_HTTP_TIMEOUT_SECONDS,
+    verbose: bool = True,
+) -> dict[str, Any]:
+    """Wait for a job via its SSE stream, falling back to adaptive polling if the stream drops.
+
+    A terminal stream event triggers a single status fetch; the report can then be requested immediately instead of
+    after the next fixed poll interval.
+    """
+    deadline = time.time() + timeout
+    try:
+        if _stream_until_terminal(job_id, deadline=deadline, verbose=verbose):
+            status = get_job_status(job_id)
+            if _METRICS is not None:
+                _METRICS.job_state(job_id, str(status.get("status", "")).lower())
+            if status.get("status", "").lower() in _DONE_JOB_STATES:
+                return status
+        else:
+            print("  Event stream ended before the job finished, falling back to polling.", file=sys.stderr)
+    except (RuntimeError, OSError) as exc:
+        print(f"  Event stream unavailable ({exc}), falling back to polling.", file=sys.stderr)
+    return poll_until_complete(job_id, timeout=max(int(deadline - time.time()), NO_TIME_LEFT), verbose=verbose)
+
+
+_AsyncConnection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncAIQClient:
+    """Asyncio AI-Q client for multiplexing many job polls and streams on one event loop.
+
+    Applies the same validation as the blocking helpers (base URL, API path, job ID, agent type) and keeps a small pool
+    of keep-alive connections. Typical use::
+
+        async with AsyncAIQClient() as client:
+            reports = await asyncio.gather(*(client.research(q) for q in queries))
+
+    Cancelling a ``research()`` task also cancels its job server-side via ``cancel_job``.
+    """
+
+    def __init__(self, base_url: str | None = None) -> None:
+        self.base_url = _validate_base_url(AIQ_SERVER_URL if base_url is None else base_url)
+        parsed = urllib.parse.urlparse(self.base_url)
+        https = parsed.scheme == "https"
+        self._host = parsed.hostname or ""
+        self._port = parsed.port or (HTTPS_DEFAULT_PORT if https else HTTP_DEFAULT_PORT)
+        self._host_header = parsed.netloc
+        self._path_prefix = parsed.path
+        self._ssl = ssl.create_default_context() if https else None
+        self._idle: list[_AsyncConnection] = []
+
+    async def __aenter__(self) -> AsyncAIQClient:
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every idle pooled connection."""
+        idle, self._idle = self._idle, []
+        for _reader, writer in idle:
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+    async def _open(self) -> _AsyncConnection:
+        return await asyncio.open_connection(self._host, self._port, ssl=self._ssl)
+
+    async def _send(
+        self, writer: asyncio.StreamWriter, method: str, path: str, body: bytes | None, headers: dict[str, str]
+    ) -> None:
+        lines = [f"{method} {self._path_prefix}{path} HTTP/1.1", f"Host: {self._host_header}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await writer.drain()
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> tuple[int, dict[str, str]]:
+        status_line = await reader.readline()
+        parts = status_line.decode("latin-1").split(maxsplit=HTTP_STATUS_LINE_MAX_SPLIT)
+        if len(parts) < HTTP_STATUS_LINE_MIN_PARTS:
+            raise ConnectionResetError("connection closed before a response arrived")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return int(parts[HTTP_STATUS_CODE_POSITION]), headers
+
+    @staticmethod
+    def _has_body(method: str, status: int) -> bool:
+        """Whether a response carries a body at all (RFC 9112 section 6.3): never for HEAD, 1xx, 204 or 304."""
+        return method != "HEAD" and status >= HTTP_SUCCESS_STATUS_MIN and status not in _BODYLESS_STATUSES
+
+    @staticmethod
+    async def _iter_body(
+        reader: asyncio.StreamReader, headers: dict[str, str], *, method: str = "GET", status: int = HTTP_SUCCESS_STATUS_MIN
+    ) -> AsyncIterator[bytes]:
+        """Yield response body bytes, handling bodyless, chunked, sized, and read-to-close framing."""
+        if not AsyncAIQClient._has_body(method, status):
+            return
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(CHUNK_EXTENSION_SEPARATOR)[CHUNK_SIZE_FIELD].strip() or b"0", CHUNK_SIZE_RADIX)
+                if size == LAST_CHUNK_SIZE:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return
+                yield await reader.readexactly(size)
+                await reader.readline()
+        elif "content-length" in headers:
+            remaining = int(headers["content-length"])
+            while remaining > NO_BYTES_REMAINING:
+                chunk = await reader.read(min(remaining, STREAM_READ_BYTES))
+                if not chunk:
+                    raise ConnectionResetError("connection closed mid-response")
+                remaining -= len(chunk)
+                yield chunk
+        else:
+            while chunk := await reader.read(STREAM_READ_BYTES):
+                yield chunk
+
+    async def _exchange(
+        self, method: str, path: str, body: bytes | None, headers: dict[str, str]
+    ) -> tuple[int, bytes]:
+        while True:
+            reused = bool(self._idle)
+            reader, writer = self._idle.pop() if reused else await self._open()
+            if reused and (reader.at_eof() or writer.is_closing()):
+                # The server closed this idle connection; don't spend a non-idempotent request on it.
+                writer.close()
+                continue
+            sent = False
+            try:
+                await self._send(writer, method, path, body, headers)
+                sent = True
+                status, response_headers = await self._read_head(reader)
+                chunks = self._iter_body(reader, response_headers, method=method, status=status)
+                raw = b"".join([chunk async for chunk in chunks])
+            except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError):
+                writer.close()
+                # Once a POST is out the server may have acted on it; resending could submit a job twice.
+                if reused and (not sent or method in _IDEMPOTENT_METHODS):
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            framed = (
+                "content-length" in response_headers
+                or "transfer-encoding" in response_headers
+                or not self._has_body(method, status)
+            )
+            if framed and response_headers.get("connection", "").lower() != "close" and (
+                len(self._idle) < POOL_MAX_IDLE_CONNECTIONS
+            ):
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+            return status, raw
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any] | None = None,
+        *,
+        timeout: int = DEFAULT_API_TIMEOUT_SECONDS,
+    ) -> dict[str, Any]:
+        """Send a JSON API request; same validation and error reporting as ``_api_request``."""
+        if method not in _ALLOWED_METHODS:
+            raise RuntimeError(f"Unsupported HTTP method: {method!r}")
+        _validate_api_path(path)
+        data = None if body is None else json.dumps(body).encode("utf-8")
+        headers = dict(_HEADLESS_HEADERS) if method == "POST" else {}
+        try:
+            status, raw = await asyncio.wait_for(self._exchange(method, path, data, headers), timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as exc:
+            # ValueError: malformed status line or framing, the asyncio counterpart of http.client.HTTPException.
+            print(f"Connection failed for {self.base_url}{path}: {exc!r}", file=sys.stderr)
+            raise RuntimeError(f"Connection failed: {exc!r}") from exc
+        _raise_for_status(status, raw)
+        return _decode_json_payload(raw)
+
+    async def stream_events(self, path: str) -> AsyncIterator[SSEEvent]:
+        """Yield events from an event stream, reconnecting with ``Last-Event-ID`` like ``_stream_events``."""
+        _validate_api_path(path)
+        parser = SSEParser()
+        established = False
+        progress = _StreamProgress()
+        while True:
+            error: Exception | None = None
+            try:
+                reader, writer = await self._open()
+            except OSError as exc:
+                error, writer = exc, None
+            if writer is not None:
+                try:
+                    await self._send(writer, "GET", path, None, {**_sse_headers(parser), "Connection": "close"})
+                    status, headers = await self._read_head(reader)
+                    if status >= HTTP_REDIRECT_STATUS_MIN:
+                        body = self._iter_body(reader, headers, status=status)
+                        _raise_for_status(status, b"".join([chunk async for chunk in body]))
+                    established = True
+                    async for chunk in self._iter_body(reader, headers, status=status):
+                        for event in parser.feed(chunk):
+                            if progress.accept(event):
+                                yield event
+                except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+                    error = exc
+                finally:
+                    writer.close()
+            if error is None and progress.terminal:
+                return
+            if not established or progress.exhausted():
+                if error is None:
+                    return
+                print(f"Connection failed for {self.base_url}{path}: {error!r}", file=sys.stderr)
+                raise RuntimeError(f"Connection failed: {error!r}") from error
+            progress.retry()
+            await asyncio.sleep(_sse_reconnect_delay(parser))
+
+    async def health(self) -> dict[str, Any]:
+        """Return the first successful AI-Q health response."""
+        for path in ("/health", "/v1/health"):
+            try:
+                return await self._request("GET", path, timeout=HEALTH_TIMEOUT_SECONDS)
+            except RuntimeError:
+                continue
+        return await self._request("GET", "/", timeout=HEALTH_TIMEOUT_SECONDS)
+
+    async def list_agents(self) -> dict[str, Any]:
+        """List async agent types registered by the AI-Q backend."""
+        return await self._request("GET", "/v1/jobs/async/agents")
+
+    async def submit_job(self, query: str, agent_type: str = DEFAULT_AGENT_TYPE) -> dict[str, Any]:
+        """Submit an explicit async research job to AI-Q."""
+        body = {"agent_type": _validate_agent_type(agent_type), "input": query}
+        print(
+            f"Sending user query text to configured AI-Q backend: {self.base_url}/v1/jobs/async/submit",
+            file=sys.stderr,
+        )
+        return await self._request(
+            "POST", "/v1/jobs/async/submit", body=body, timeout=DEFAULT_LONG_HTTP_TIMEOUT_SECONDS
+        )
+
+    async def get_job_status(self, job_id: str) -> dict[str, Any]:
+        """Fetch the top-level status for an async AI-Q job."""
+        return await self._request("GET", f"/v1/jobs/async/job/{_validate_job_id(job_id)}")
+
+    async def get_job_state(self, job_id: str) -> dict[str, Any]:
+        """Fetch event-store artifacts for an async AI-Q job."""
+        return await self._request("GET", f"/v1/jobs/async/job/{_validate_job_id(job_id)}/state")
+
+    async def get_report(self, job_id: str) -> dict[str, Any]:
+        """Fetch the final report for a completed async AI-Q job."""
+        return await self._request("GET", f"/v1/jobs/async/job/{_validate_job_id(job_id)}/report")
+
+    async def cancel_job(self, job_id: str) -> dict[str, Any]:
+        """Request cancellation for a running async AI-Q job."""
+        return await self._request("POST", f"/v1/jobs/async/job/{_validate_job_id(job_id)}/cancel")
+
+    async def stream_job(self, job_id: str) -> AsyncIterator[SSEEvent]:
+        """Yield server-sent events for an async AI-Q job, ending after the terminal event."""
+        async for event in self.stream_events(f"/v1/jobs/async/job/{_validate_job_id(job_id)}/stream"):
+            yield event
+            if _event_terminal_state(event)[0]:
+                return
+
+    async def _stream_until_terminal(self, job_id: str) -> bool:
+        async for event in self.stream_events(f"/v1/jobs/async/job/{_validate_job_id(job_id)}/stream"):
+            terminal, _state = _event_terminal_state(event)
+            if terminal:
+                return True
+        return False
+
+    async def poll_until_complete(
+        self, job_id: str, *, max_consecutive_errors: int = POLL_MAX_CONSECUTIVE_ERRORS
+    ) -> dict[str, Any]:
+        """Poll a job with the same adaptive backoff and error tolerance as ``poll_until_complete`` (no timeout)."""
+        consecutive_errors = NO_CONSECUTIVE_ERRORS
+        interval: float = JOB_POLL_INITIAL_INTERVAL_SECONDS
+        last_state = None
+        while True:
+            try:
+                status = await self.get_job_status(job_id)
+                consecutive_errors = NO_CONSECUTIVE_ERRORS
+            except RuntimeError as exc:
+                consecutive_errors += ERROR_INCREMENT
+                if consecutive_errors >= max_consecutive_errors:
+                    print(f"  Status check failed {consecutive_errors} times in a row: {exc}", file=sys.stderr)
+                    raise
+                print(
+                    f"  Status check failed ({exc}), retrying... ({consecutive_errors}/{max_consecutive_errors})",
+                    file=sys.stderr,
+                    flush=True,
+                )
+                await asyncio.sleep(JOB_POLL_INTERVAL_SECONDS)
+                continue
+            state = status.get("status", "UNKNOWN").lower()
+            if state in _DONE_JOB_STATES:
+                return status
+            if state != last_state:
+                interval, last_state = JOB_POLL_INITIAL_INTERVAL_SECONDS, state
+            await asyncio.sleep(interval)
+            interval = _next_poll_interval(interval)
+
+    async def wait_for_completion(
+        self, job_id: str, *, timeout: int = DEFAULT_LONG_HTTP_TIMEOUT_SECONDS
+    ) -> dict[str, Any]:
+        """Wait for a job via its SSE stream, falling back to adaptive polling; TIMEOUT status on expiry."""
+
+        async def _wait() -> dict[str, Any]:
+            try:
+                if await self._stream_until_terminal(job_id):
+                    status = await self.get_job_status(job_id)
+                    if status.get("status", "").lower() in _DONE_JOB_STATES:
+                        return status
+            except (RuntimeError, OSError, asyncio.IncompleteReadError):
+                pass
+            return await self.poll_until_complete(job_id)
+
+        try:
+            return await asyncio.wait_for(_wait(), timeout)
+        except asyncio.TimeoutError:
+            return {"status": "TIMEOUT"}
+
+    async def research(
+        self,
+        query: str,
+        agent_type: str = DEFAULT_AGENT_TYPE,
+        *,
+        timeout: int = DEFAULT_LONG_HTTP_TIMEOUT_SECONDS,
+    ) -> dict[str, Any]:
+        """Submit a job, wait for it, and return its report; cancelling the task cancels the job server-side."""
+        submitted = await self.submit_job(query, agent_type=agent_type)
+        job_id = submitted.get("job_id")
+        if not job_id:
+            raise RuntimeError(f"No job_id in response: {submitted}")
+        try:
+            final = await self.wait_for_completion(job_id, timeout=timeout)
+        except asyncio.CancelledError:
+            with contextlib.suppress(RuntimeError):
+                await asyncio.shield(self.cancel_job(job_id))
+            raise
+        state = final.get("status", "UNKNOWN").lower()
+        if state not in _SUCCESS_JOB_STATES:
+            raise RuntimeError(f"Job {job_id} did not complete: {state}")
+        return await self.get_report(job_id)
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace so trivially reformatted queries share a cache entry."""
+    return " ".join(query.split())
+
+
+class _ReportCache:
+    """Local content-addressed store of compressed report JSON.
+
+    Reports are stored once per content digest as ``objects/<sha256>.json.gz``. ``index.json`` maps lookup keys (job ID,
+    or backend + agent type + normalized query) to digests and tracks object sizes and last use, so the store can be
+    evicted least-recently-used once it grows past ``max_bytes``. Query entries older than ``ttl_seconds`` are misses
+    (``0`` turns query reuse off); job entries never expire because a finished job's report does not change. Any cache
+    I/O problem is a miss.
+    """
+
+    def __init__(self, root: str, *, max_bytes: int, ttl_seconds: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._index_path = os.path.join(root, "index.json")
+        self._objects_dir = os.path.join(root, "objects")
+        self._index: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def job_key(job_id: str) -> str:
+        return f"job:{_validate_job_id(job_id)}"
+
+    @staticmethod
+    def query_key(agent_type: str, query: str) -> str:
+        material = json.dumps([_backend().base_url, agent_type, _normalize_query(query)])
+        return f"query:{hashlib.sha256(material.encode('utf-8')).hexdigest()}"
+
+    def _load(self) -> dict[str, Any]:
+        if self._index is None:
+            try:
+                with open(self._index_path, encoding="utf-8") as handle:
+                    index = json.load(handle)
+                if index.get("version") != CACHE_INDEX_VERSION:
+                    raise ValueError("stale cache index")
+            except (OSError, ValueError, AttributeError):
+                index = {"version": CACHE_INDEX_VERSION, "keys": {}, "objects": {}}
+            self._index = index
+        return self._index
+
+    def _save(self, index: dict[str, Any]) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".index-")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(index, handle)
+        os.replace(tmp, self._index_path)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._objects_dir, f"{digest}.json.gz")
+
+    def locate(self, key: str) -> tuple[str, dict[str, Any]] | None:
+        """Return (compressed object path, entry) for a fresh key and mark it used, or None on a miss."""
+        with self._lock:
+            try:
+                index = self._load()
+                entry = index["keys"].get(key)
+                if entry is None or entry["object"] not in index["objects"]:
+                    return None
+                now = time.time()
+                expired = self.ttl_seconds == CACHE_NO_QUERY_REUSE or now - entry["stored_at"] > self.ttl_seconds
+                if key.startswith("query:") and expired:
+                    return None
+                index["objects"][entry["object"]]["last_used"] = now
+                self._save(index)
+            except (OSError, ValueError, KeyError, TypeError):
+                return None
+            return self._object_path(entry["object"]), entry
+
+    def get(self, key: str) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """Return (report, entry) for a key, or None on a miss."""
+        found = self.locate(key)
+        if found is None:
+            return None
+        path, entry = found
+        try:
+            with gzip.open(path, "rb") as handle:
+                return json.load(handle), entry
+        except (OSError, ValueError, EOFError):
+            return None
+
+    def put(self, report: dict[str, Any], keys: list[str], *, job_id: str) -> None:
+        """Store a report under every key, then evict least-recently-used objects past the size bound."""
+        payload = json.dumps(report, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        for _chunk in self.tee([payload], keys, job_id=job_id):
+            pass
+
+    def tee(self, chunks: Iterable[bytes], keys: list[str], *, job_id: str) -> Iterator[bytes]:
+        """Yield ``chunks`` unchanged while compressing them into the store; commit only if the stream completes."""
+        digest = hashlib.sha256()
+        try:
+            os.makedirs(self._objects_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._objects_dir, prefix=".object-")
+        except OSError as exc:
+            print(f"Report cache write skipped: {exc}", file=sys.stderr)
+            yield from chunks
+            return
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as handle:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    handle.write(chunk)
+                    yield chunk
+            self._commit(tmp, digest.hexdigest(), keys, job_id)
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+
+    def _commit(self, tmp: str, digest: str, keys: list[str], job_id: str) -> None:
+        with self._lock:
+            try:
+                index = self._load()
+                if digest not in index["objects"]:
+                    os.replace(tmp, self._object_path(digest))
+                    index["objects"][digest] = {"size": os.path.getsize(self._object_path(digest))}
+                now = time.time()
+                index["objects"][digest]["last_used"] = now
+                for key in keys:
+                    index["keys"][key] = {"object": digest, "job_id": job_id, "stored_at": now}
+                self._evict(index)
+                self._save(index)
+            except OSError as exc:
+                print(f"Report cache write skipped: {exc}", file=sys.stderr)
+
+    def _evict(self, index: dict[str, Any]) -> None:
+        objects = index["objects"]
+        total = sum(meta["size"] for meta in objects.values())
+        for digest in sorted(objects, key=lambda item: objects[item]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= objects.pop(digest)["size"]
+            with contextlib.suppress(OSError):
+                os.remove(self._object_path(digest))
+        index["keys"] = {key: entry for key, entry in index["keys"].items() if entry["object"] in objects}
+
+
+_REPORT_CACHE: _ReportCache | None = None
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a non-negative integer environment variable."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    if not raw.isdigit():
+        raise RuntimeError(f"{name} must be a non-negative integer, got {raw!r}")
+    return int(raw)
+
+
+def _enable_report_cache() -> None:
+    """Configure the shared report cache from AIQ_CACHE_* environment variables."""
+    global _REPORT_CACHE
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    _REPORT_CACHE = _ReportCache(
+        os.environ.get("AIQ_CACHE_DIR") or os.path.join(cache_home, "aiq-research"),
+        max_bytes=_env_int("AIQ_CACHE_MAX_BYTES", CACHE_DEFAULT_MAX_BYTES),
+        ttl_seconds=_env_int("AIQ_CACHE_TTL_SECONDS", CACHE_DEFAULT_TTL_SECONDS),
+    )
+
+
+def _fetch_report(job_id: str, *, agent_type: str | None = None, query: str | None = None) -> dict[str, Any]:
+    """Return a job's report from the local cache, or download and cache it."""
+    if _REPORT_CACHE is None:
+        return get_report(job_id)
+    key = _REPORT_CACHE.job_key(job_id)
+    hit = _REPORT_CACHE.get(key)
+    if hit is not None:
+        print(f"Report for {job_id} served from cache.", file=sys.stderr)
+        report, _entry = hit
+        return report
+    report = get_report(job_id)
+    keys = [key]
+    if agent_type is not None and query is not None:
+        keys.append(_REPORT_CACHE.query_key(agent_type, query))
+    _REPORT_CACHE.put(report, keys, job_id=job_id)
+    return report
+
+
+def _cached_query_job(query: str, agent_type: str) -> str | None:
+    """Return the job ID whose report answers a previously researched query, if cached and fresh."""
+    if _REPORT_CACHE is None:
+        return None
+    found = _REPORT_CACHE.locate(_REPORT_CACHE.query_key(_validate_agent_type(agent_type), query))
+    if found is None:
+        return None
+    _path, entry = found
+    return entry["job_id"]
+
+
+def _download_report(job_id: str) -> Iterator[bytes]:
+    """Yield a job's raw report bytes in chunks over a dedicated connection, without decoding them."""
+    path = f"/v1/jobs/async/job/{_validate_job_id(job_id)}/report"
+    backend = _backend()
+    conn = backend.connect(DEFAULT_API_TIMEOUT_SECONDS)
+    started = time.monotonic()
+    try:
+        try:
+            conn.request("GET", backend.target(path))
+            resp = conn.getresponse()
+            if resp.status >= HTTP_REDIRECT_STATUS_MIN:
+                _raise_for_status(resp.status, resp.read())
+            while chunk := resp.read(STREAM_READ_BYTES):
+                if _METRICS is not None:
+                    _METRICS.count("http_bytes_received", len(chunk))
+                yield chunk
+            if _METRICS is not None:
+                _METRICS.observe("http_report", time.monotonic() - started)
+                _METRICS.count("http_requests")
+        except (OSError, http.client.HTTPException) as exc:
+            print(f"Connection failed for {backend.url(path)}: {exc}", file=sys.stderr)
+            raise RuntimeError(f"Connection failed: {exc}") from exc
+    finally:
+        conn.close()
+
+
+def _report_chunks(job_id: str, *, agent_type: str | None = None, query: str | None = None) -> Iterator[bytes]:
+    """Yield a job's report bytes from the cache or the backend, caching a completed download."""
+    if _REPORT_CACHE is None:
+        yield from _download_report(job_id)
+        return
+    key = _REPORT_CACHE.job_key(job_id)
+    found = _REPORT_CACHE.locate(key)
+    if found is not None:
+        print(f"Report for {job_id} served from cache.", file=sys.stderr)
+        path, _entry = found
+        with gzip.open(path, "rb") as handle:
+            while chunk := handle.read(STREAM_READ_BYTES):
+                yield chunk
+        return
+    keys = [key]
+    if agent_type is not None and query is not None:
+        keys.append(_REPORT_CACHE.query_key(agent_type, query))
+    yield from _REPORT_CACHE.tee(_download_report(job_id), keys, job_id=job_id)
+
+
+@dataclass(frozen=True)
+class _ReportSink:
+    """Where and how a command writes a report.
+
+    By default the report is parsed and printed as indented JSON. ``raw`` (implied by ``output`` unless ``pretty`` is
+    set) copies the report bytes through in fixed-size chunks instead, so memory stays flat for very large reports.
+    """
+
+    output: str | None = None
+    raw: bool = False
+    pretty: bool = False
+
+    @property
+    def streaming(self) -> bool:
+        return self.raw or (self.output is not None and not self.pretty)
+
+
+def _pop_report_sink(args: list[str], usage: str) -> _ReportSink:
+    """Remove ``--output FILE``, ``--raw`` and ``--pretty`` from args."""
+    output = _pop_option(args, "--output")
+    flags = {}
+    for flag in ("--raw", "--pretty"):
+        flags[flag] = flag in args
+        if flags[flag]:
+            args.remove(flag)
+    if flags["--raw"] and flags["--pretty"]:
+        print(usage, file=sys.stderr)
+        sys.exit(EXIT_FAILURE)
+    return _ReportSink(output=output, raw=flags["--raw"], pretty=flags["--pretty"])
+
+
+@contextlib.contextmanager
+def _atomic_output(path: str, *, binary: bool) -> Iterator[Any]:
+    """Open a temp file beside ``path`` that replaces it only when the block completes; a failure leaves it untouched."""
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.")
+    except OSError as exc:
+        raise RuntimeError(f"Cannot write report to {path}: {exc}") from exc
+    try:
+        with os.fdopen(fd, "wb" if binary else "w", encoding=None if binary else "utf-8") as handle:
+            yield handle
+        os.replace(tmp, path)
+    except OSError as exc:
+        raise RuntimeError(f"Cannot write report to {path}: {exc}") from exc
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+
+
+def _emit_report(
+    job_id: str, sink: _ReportSink, *, agent_type: str | None = None, query: str | None = None
+) -> None:
+    """Write a job's report to stdout or ``sink.output``, streaming the bytes when the sink allows it."""
+    if sink.output is None:
+        handle = contextlib.nullcontext(sys.stdout.buffer if sink.streaming else sys.stdout)
+    else:
+        handle = _atomic_output(sink.output, binary=sink.streaming)
+    written = NO_BYTES_REMAINING
+    with handle as out:
+        if sink.streaming:
+            sys.stdout.flush()
+            for chunk in _report_chunks(job_id, agent_type=agent_type, query=query):
+                out.write(chunk)
+                written += len(chunk)
+        else:
+            json.dump(_fetch_report(job_id, agent_type=agent_type, query=query), out, indent=JSON_INDENT_SPACES)
+            out.write("\n")
+        out.flush()
+    if _METRICS is not None:
+        _METRICS.job_phase(job_id, "reported")
+    if sink.output is not None:
+        size = f" ({written} bytes)" if sink.streaming else ""
+        print(f"Report written to {sink.output}{size}", file=sys.stderr)
+
+
+def _poll_until_success_or_exit(
+    job_id: str,
+    sink: _ReportSink | None = None,
+    *,
+    agent_type: str | None = None,
+    query: str | None = None,
+) -> None:
+    """Wait for a job, print its report on success, and exit on failure."""
+    try:
+        final = wait_for_completion(job_id)
     except KeyboardInterrupt:
         print(f"\nInterrupted. Job {job_id} is still running server-side.", file=sys.stderr)
         print(f"Resume later: aiq.py research_poll {job_id}", file=sys.stderr)
@@ -292,12 +1517,12 @@ def _poll_until_success_or_exit(job_id: str) -> None:
         print(json.dumps(final, indent=JSON_INDENT_SPACES))
         sys.exit(EXIT_FAILURE)
 
-    print(json.dumps(get_report(job_id), indent=JSON_INDENT_SPACES))
+    _emit_report(job_id, sink or _ReportSink(), agent_type=agent_type, query=query)
 
 
 def _print_usage() -> None:
     """Print CLI usage information."""
-    print("Usage: aiq.py <command> [args]")
+    print("Usage: aiq.py [--no-cache] [--metrics] <command> [args]")
     print()
     print("Commands:")
     print("  health                        Check the local AIQ server")
@@ -310,9 +1535,18 @@ def _print_usage() -> None:
     print("  report <job_id>               Get final report from an async job")
     print("  research <query> [agent_type] Submit async job, poll, and return report")
     print("  research_poll <job_id>        Resume polling an existing async job")
+    print("                                report/research/research_poll accept [--output FILE] [--raw|--pretty]:")
+    print("                                --output and --raw stream report bytes unmodified; --pretty re-indents")
     print("  cancel <job_id>               Cancel a running async job")
+    print("  watch <job_id>... [--interval SECONDS]")
+    print("                                Live one-line status per job, printing only new /state events")
+    print("  batch [file|-] [--concurrency N]")
+    print("                                Run JSONL queries concurrently, emit JSONL reports")
     print()
+    print("Reports from report, research, research_poll, and batch are cached locally; --no-cache bypasses the cache.")
     print(f"Environment: AIQ_SERVER_URL defaults to {DEFAULT_SERVER_URL}")
+    print("             AIQ_CACHE_DIR, AIQ_CACHE_MAX_BYTES, AIQ_CACHE_TTL_SECONDS tune the report cache")
+    print("             AIQ_METRICS=1 is --metrics; AIQ_METRICS_FILE appends the summary there as JSONL")
 
 
 def _require_arg(args: list[str], usage: str, *, position: int = FIRST_ARG_POSITION) -> str:
@@ -357,16 +1591,152 @@ def _command_submit(args: list[str]) -> None:
     print(json.dumps(submit_job(query, agent_type=agent_type), indent=JSON_INDENT_SPACES))
 
 
-def _command_status(args: list[str]) -> None:
-    job_id = _require_arg(args, "Usage: aiq.py status <job_id>")
+def _fetch_status_and_state(job_id: str, pool: ThreadPoolExecutor) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Fetch a job's status and /state artifacts concurrently; a failed state fetch is reported inline."""
+    state_future = pool.submit(get_job_state, job_id)
     job_status = get_job_status(job_id)
     try:
-        job_state = get_job_state(job_id)
+        job_state = state_future.result()
     except RuntimeError as exc:
         job_state = {"_fetch_error": str(exc)}
+    return job_status, job_state
+
+
+def _command_status(args: list[str]) -> None:
+    job_id = _validate_job_id(_require_arg(args, "Usage: aiq.py status <job_id>"))
+    with ThreadPoolExecutor(max_workers=STATUS_FETCH_WORKERS) as pool:
+        job_status, job_state = _fetch_status_and_state(job_id, pool)
     print(json.dumps({"job_status": job_status, "job_state": job_state}, indent=JSON_INDENT_SPACES))
 
 
+def _state_artifacts(job_state: dict[str, Any]) -> list[Any]:
+    """Return the event-like entries of a /state payload: ``artifacts``/``events`` if present, else every list."""
+    for key in ("artifacts", "events"):
+        if isinstance(job_state.get(key), list):
+            return job_state[key]
+    return [item for value in job_state.values() if isinstance(value, list) for item in value]
+
+
+def _artifact_key(artifact: Any) -> str:
+    """Stable identity for one artifact: its ``id`` when it has one, otherwise a digest of its content."""
+    if isinstance(artifact, dict) and isinstance(artifact.get("id"), (str, int)):
+        return f"id:{artifact['id']}"
+    return hashlib.sha256(json.dumps(artifact, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _artifact_summary(artifact: Any, width: int) -> str:
+    """One-line description of an artifact, truncated to ``width`` characters."""
+    text = None
+    if isinstance(artifact, dict):
+        text = next((artifact[key] for key in ("content", "message", "text", "name") if artifact.get(key)), None)
+        kind = artifact.get("type")
+        if isinstance(text, str) and isinstance(kind, str):
+            text = f"[{kind}] {text}"
+    if not isinstance(text, str):
+        text = json.dumps(artifact, default=str)
+    text = " ".join(text.split())
+    return text if len(text) <= width else text[: max(width - 1, NO_TIME_LEFT)] + "…"
+
+
+@dataclass
+class _WatchedJob:
+    job_id: str
+    state: str = "?"
+    seen: set[str] | None = None
+    events: int = NO_CONSECUTIVE_ERRORS
+    new: int = NO_CONSECUTIVE_ERRORS
+    error: str | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.state in _DONE_JOB_STATES
+
+    def line(self, elapsed: float) -> str:
+        minutes, seconds = divmod(int(elapsed), SECONDS_PER_MINUTE)
+        detail = f"  ! {self.error}" if self.error else (f"  +{self.new}" if self.new else "")
+        return f"{self.job_id[:WATCH_JOB_ID_CHARS]}  {self.state:<10} {self.events:>4} events  {minutes}m{seconds:02d}s{detail}"
+
+
+def _refresh_watched(job: _WatchedJob, pool: ThreadPoolExecutor) -> list[Any]:
+    """Fetch one job's status and state; update it and return artifacts not seen before."""
+    try:
+        job_status, job_state = _fetch_status_and_state(job.job_id, pool)
+    except RuntimeError as exc:
+        job.error, job.new = str(exc), NO_CONSECUTIVE_ERRORS
+        return []
+    job.error = job_state.get("_fetch_error")
+    job.state = str(job_status.get("status", "UNKNOWN")).lower()
+    if _METRICS is not None:
+        _METRICS.job_state(job.job_id, job.state)
+    first_fetch = job.seen is None
+    seen = job.seen if job.seen is not None else set()
+    fresh = []
+    for artifact in _state_artifacts(job_state):
+        key = _artifact_key(artifact)
+        if key not in seen:
+            seen.add(key)
+            fresh.append(artifact)
+    job.seen = seen
+    job.events = len(seen)
+    job.new = NO_CONSECUTIVE_ERRORS if first_fetch else len(fresh)
+    return fresh
+
+
+def _command_watch(args: list[str]) -> None:
+    usage = "Usage: aiq.py watch <job_id>... [--interval SECONDS]"
+    args = list(args)
+    raw_interval = _pop_option(args, "--interval") or str(WATCH_MAX_INTERVAL_SECONDS)
+    try:
+        max_interval = float(raw_interval)
+    except ValueError:
+        max_interval = NO_TIME_LEFT
+    if not args or max_interval <= NO_TIME_LEFT:
+        print(usage, file=sys.stderr)
+        sys.exit(EXIT_FAILURE)
+    jobs = [_WatchedJob(_validate_job_id(job_id)) for job_id in dict.fromkeys(args)]
+
+    redraw = sys.stderr.isatty()
+    started = time.monotonic()
+    interval: float = JOB_POLL_INITIAL_INTERVAL_SECONDS
+    drawn_lines = NO_CONSECUTIVE_ERRORS
+    last_snapshot: list[tuple[str, int, str | None]] = []
+    # One request slot per job for status and one for /state, so a whole refresh costs one round trip.
+    pool = ThreadPoolExecutor(max_workers=len(jobs) * STATUS_FETCH_WORKERS)
+    try:
+        while True:
+            active = [job for job in jobs if not job.done]
+            for job in jobs:
+                job.new = NO_CONSECUTIVE_ERRORS
+            refreshed = zip(active, pool.map(lambda job: _refresh_watched(job, pool), active), strict=True)
+            width = shutil.get_terminal_size().columns
+            if redraw and drawn_lines:
+                print(f"\x1b[{drawn_lines}F\x1b[J", end="", file=sys.stderr)
+            for job, artifacts in refreshed:
+                for artifact in artifacts if job.new else []:
+                    summary = _artifact_summary(artifact, max(width - WATCH_SUMMARY_INDENT_CHARS, WATCH_MIN_SUMMARY_CHARS))
+                    print(f"  {job.job_id[:WATCH_JOB_ID_CHARS]}  {summary}", file=sys.stderr)
+            # Without a terminal to redraw on, print the status lines only when something changed.
+            snapshot = [(job.state, job.events, job.error) for job in jobs]
+            if redraw or snapshot != last_snapshot:
+                elapsed = time.monotonic() - started
+                print("\n".join(job.line(elapsed) for job in jobs), file=sys.stderr, flush=True)
+                drawn_lines = len(jobs)
+            last_snapshot = snapshot
+            if all(job.done for job in jobs):
+                break
+            changed = any(job.new or job.error for job in active)
+            interval = JOB_POLL_INITIAL_INTERVAL_SECONDS if changed else min(_next_poll_interval(interval), max_interval)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching; jobs keep running server-side.", file=sys.stderr)
+        sys.exit(EXIT_FAILURE)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    print(json.dumps({job.job_id: job.state for job in jobs}))
+    if any(job.state not in _SUCCESS_JOB_STATES for job in jobs):
+        sys.exit(EXIT_FAILURE)
+
+
 def _command_state(args: list[str]) -> None:
     job_id = _require_arg(args, "Usage: aiq.py state <job_id>")
     print(json.dumps(get_job_state(job_id), indent=JSON_INDENT_SPACES))
@@ -378,13 +1748,23 @@ def _command_stream(args: list[str]) -> None:
 
 
 def _command_report(args: list[str]) -> None:
-    job_id = _require_arg(args, "Usage: aiq.py report <job_id>")
-    print(json.dumps(get_report(job_id), indent=JSON_INDENT_SPACES))
+    usage = "Usage: aiq.py report <job_id> [--output FILE] [--raw|--pretty]"
+    args = list(args)
+    sink = _pop_report_sink(args, usage)
+    _emit_report(_require_arg(args, usage), sink)
 
 
 def _command_research(args: list[str]) -> None:
-    query = _require_arg(args, "Usage: aiq.py research <query> [agent_type]")
+    usage = "Usage: aiq.py research <query> [agent_type] [--output FILE] [--raw|--pretty]"
+    args = list(args)
+    sink = _pop_report_sink(args, usage)
+    query = _require_arg(args, usage)
     agent_type = args[OPTIONAL_AGENT_TYPE_POSITION] if len(args) > OPTIONAL_AGENT_TYPE_POSITION else DEFAULT_AGENT_TYPE
+    cached_job_id = _cached_query_job(query, agent_type)
+    if cached_job_id is not None:
+        print(f"Query already answered by job {cached_job_id} (--no-cache to rerun).", file=sys.stderr)
+        _emit_report(cached_job_id, sink)
+        return
     print(f"Submitting {agent_type} job...", file=sys.stderr)
     result = submit_job(query, agent_type=agent_type)
     job_id = result.get("job_id")
@@ -392,23 +1772,26 @@ def _command_research(args: list[str]) -> None:
         print(f"ERROR: No job_id in response: {result}", file=sys.stderr)
         sys.exit(EXIT_FAILURE)
     print(f"Job submitted: {job_id}", file=sys.stderr)
-    _poll_until_success_or_exit(job_id)
+    _poll_until_success_or_exit(job_id, sink, agent_type=agent_type, query=query)
 
 
 def _command_research_poll(args: list[str]) -> None:
-    job_id = _require_arg(args, "Usage: aiq.py research_poll <job_id>")
+    usage = "Usage: aiq.py research_poll <job_id> [--output FILE] [--raw|--pretty]"
+    args = list(args)
+    sink = _pop_report_sink(args, usage)
+    job_id = _require_arg(args, usage)
     status = _checked_job_status(job_id)
     state = status.get("status", "UNKNOWN").lower()
     print(f"Current status: {state}", file=sys.stderr)
     if state in _SUCCESS_JOB_STATES:
-        print(json.dumps(get_report(job_id), indent=JSON_INDENT_SPACES))
+        _emit_report(job_id, sink)
     elif state in _FAILED_JOB_STATES:
         print(f"Job {job_id} ended with status: {state}", file=sys.stderr)
         print(json.dumps(status, indent=JSON_INDENT_SPACES))
         sys.exit(EXIT_FAILURE)
     else:
         print("Job still running, polling...", file=sys.stderr)
-        _poll_until_success_or_exit(job_id)
+        _poll_until_success_or_exit(job_id, sink)
 
 
 def _checked_job_status(job_id: str) -> dict[str, Any]:
@@ -429,6 +1812,133 @@ def _checked_job_status(job_id: str) -> dict[str, Any]:
     raise RuntimeError("unreachable")
 
 
+def _pop_option(args: list[str], name: str) -> str | None:
+    """Remove ``name VALUE`` from args and return VALUE, exiting with usage when VALUE is missing."""
+    if name not in args:
+        return None
+    index = args.index(name)
+    if index + OPTION_VALUE_OFFSET >= len(args):
+        print(f"Missing value for {name}", file=sys.stderr)
+        sys.exit(EXIT_FAILURE)
+    value = args[index + OPTION_VALUE_OFFSET]
+    del args[index : index + OPTION_PAIR_LENGTH]
+    return value
+
+
+def _read_batch_queries(source: str) -> list[dict[str, str]]:
+    """Parse and validate every JSONL query line before any job is submitted."""
+    try:
+        if source == STDIN_PATH:
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(source, encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+    except OSError as exc:
+        raise RuntimeError(f"Cannot read batch input: {exc}") from exc
+
+    queries = []
+    for line_number, line in enumerate(lines, start=FIRST_LINE_NUMBER):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise RuntimeError(f"Batch line {line_number}: invalid JSON ({exc})") from exc
+        if not isinstance(item, dict) or not isinstance(item.get("query"), str) or not item["query"].strip():
+            raise RuntimeError(f'Batch line {line_number}: expected an object with a non-empty "query"')
+        entry = {
+            "line": line_number,
+            "query": item["query"],
+            "agent_type": _validate_agent_type(str(item.get("agent_type") or DEFAULT_AGENT_TYPE)),
+        }
+        if "id" in item:
+            entry["id"] = item["id"]
+        queries.append(entry)
+    return queries
+
+
+def _run_batch_item(item: dict[str, Any], in_flight: dict[str, dict[str, Any]], lock: threading.Lock) -> dict[str, Any]:
+    """Submit one batch query, wait for it, and return its JSONL result record."""
+    record = {key: item[key] for key in ("id", "line", "query", "agent_type") if key in item}
+    cached_job_id = _cached_query_job(item["query"], item["agent_type"])
+    if cached_job_id is not None:
+        report = _fetch_report(cached_job_id)
+        return {**record, "job_id": cached_job_id, "status": "completed", "cached": True, "report": report}
+    submitted = submit_job(item["query"], agent_type=item["agent_type"])
+    job_id = submitted.get("job_id")
+    if not job_id:
+        return {**record, "status": "submit_failed", "error": f"No job_id in response: {submitted}"}
+    record["job_id"] = job_id
+    with lock:
+        in_flight[job_id] = record
+    try:
+        final = wait_for_completion(job_id, verbose=False)
+        state = final.get("status", "UNKNOWN").lower()
+        record["status"] = state
+        if state in _SUCCESS_JOB_STATES:
+            record["report"] = _fetch_report(job_id, agent_type=item["agent_type"], query=item["query"])
+            if _METRICS is not None:
+                _METRICS.job_phase(job_id, "reported")
+        else:
+            record["final_status"] = final
+    finally:
+        with lock:
+            in_flight.pop(job_id, None)
+    return record
+
+
+def _command_batch(args: list[str]) -> None:
+    usage = "Usage: aiq.py batch [file|-] [--concurrency N]  (N >= 1)"
+    args = list(args)
+    raw_concurrency = _pop_option(args, "--concurrency") or str(BATCH_DEFAULT_CONCURRENCY)
+    if not raw_concurrency.isdigit() or int(raw_concurrency) < BATCH_MIN_CONCURRENCY:
+        print(usage, file=sys.stderr)
+        sys.exit(EXIT_FAILURE)
+    concurrency = int(raw_concurrency)
+    source = args[FIRST_ARG_POSITION] if args else STDIN_PATH
+    queries = _read_batch_queries(source)
+    if not queries:
+        print("No queries in batch input.", file=sys.stderr)
+        return
+
+    print(f"Running {len(queries)} queries with concurrency {concurrency}...", file=sys.stderr)
+    in_flight: dict[str, dict[str, Any]] = {}
+    lock = threading.Lock()
+    failed = 0
+    done = 0
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    futures = {pool.submit(_run_batch_item, item, in_flight, lock): item for item in queries}
+    try:
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                record = future.result()
+            except Exception as exc:  # one failed job must not abort the batch
+                record = {key: item[key] for key in ("id", "line", "query", "agent_type") if key in item}
+                record.update({"status": "error", "error": str(exc) or type(exc).__name__})
+            done += 1
+            if record.get("status") not in _SUCCESS_JOB_STATES:
+                failed += 1
+            print(
+                f"  [{done}/{len(queries)}] line {record['line']}: {record.get('status')} {record.get('job_id', '')}",
+                file=sys.stderr,
+                flush=True,
+            )
+            print(json.dumps(record), flush=True)
+    except KeyboardInterrupt:
+        pool.shutdown(wait=False, cancel_futures=True)
+        with lock:
+            running = sorted(in_flight)
+        print(f"\nInterrupted. {len(running)} job(s) still running server-side:", file=sys.stderr)
+        for job_id in running:
+            print(f"  aiq.py research_poll {job_id}", file=sys.stderr)
+        os._exit(EXIT_FAILURE)
+    pool.shutdown()
+    if failed:
+        print(f"{failed} of {len(queries)} batch queries did not succeed.", file=sys.stderr)
+        sys.exit(EXIT_FAILURE)
+
+
 def _command_cancel(args: list[str]) -> None:
     job_id = _require_arg(args, "Usage: aiq.py cancel <job_id>")
     print(json.dumps(cancel_job(job_id), indent=JSON_INDENT_SPACES))
@@ -436,11 +1946,21 @@ def _command_cancel(args: list[str]) -> None:
 
 def main() -> None:
     """Dispatch the command-line interface."""
-    if len(sys.argv) < MIN_COMMAND_ARG_COUNT:
+    global _METRICS
+    argv = list(sys.argv)
+    # Global options come before the command; later "--no-cache" text belongs to the command (e.g. a query).
+    options = set()
+    while len(argv) > COMMAND_NAME_POSITION and argv[COMMAND_NAME_POSITION] in _GLOBAL_OPTIONS:
+        options.add(argv.pop(COMMAND_NAME_POSITION))
+    use_cache = "--no-cache" not in options
+    want_metrics = (
+        "--metrics" in options or os.environ.get("AIQ_METRICS") == "1" or bool(os.environ.get("AIQ_METRICS_FILE"))
+    )
+    if len(argv) < MIN_COMMAND_ARG_COUNT:
         _print_usage()
         sys.exit(EXIT_FAILURE)
 
-    cmd = sys.argv[COMMAND_NAME_POSITION]
+    cmd = argv[COMMAND_NAME_POSITION]
     commands = {
         "health": _command_health,
         "chat": _command_chat,
@@ -453,17 +1973,25 @@ def main() -> None:
         "research": _command_research,
         "research_poll": _command_research_poll,
         "cancel": _command_cancel,
+        "batch": _command_batch,
+        "watch": _command_watch,
     }
     handler = commands.get(cmd)
     if handler is None:
         print(f"Unknown command: {cmd}", file=sys.stderr)
         _print_usage()
         sys.exit(EXIT_FAILURE)
+    if want_metrics:
+        _METRICS = _Metrics()
     try:
-        handler(sys.argv[COMMAND_ARGS_START_POSITION:])
+        if use_cache:
+            _enable_report_cache()
+        handler(argv[COMMAND_ARGS_START_POSITION:])
     except RuntimeError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         sys.exit(EXIT_FAILURE)
+    finally:
+        _emit_metrics(cmd)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Reproducible aiq.py benchmarks against the bundled local stub server.
+
+Starts ``aiq_stub.py`` in-process, runs each workload as a separate ``aiq.py`` process, and reports the median
+time-to-report, HTTP requests served by the stub, and the client's peak RSS:
+
+    python3 aiq_bench.py                      # table on stdout
+    python3 aiq_bench.py --runs 10 --json     # customSmallerIsBetter JSON (github-action-benchmark)
+    python3 aiq_bench.py --workload batch --batch-size 32 --report-bytes 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from aiq_stub import StubConfig, StubServer, serve_in_thread
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+AIQ = SCRIPT_DIR / "aiq.py"
+DEFAULT_RUNS = 5
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_JOB_SECONDS = 1.0
+DEFAULT_REPORT_BYTES = 1_000_000
+KIB_PER_MIB = 1024
+STATS_PATH_PREFIX = "GET /_stub"
+
+
+@dataclass
+class Sample:
+    seconds: float
+    requests: int
+    max_rss_kib: int
+    exit_code: int
+
+
+@dataclass(frozen=True)
+class Workload:
+    name: str
+    description: str
+    command: Callable[[StubServer], tuple[list[str], str | None]]
+
+
+def _requests_served(server: StubServer) -> int:
+    with server.lock:
+        return sum(count for route, count in server.stats.items() if not route.startswith(STATS_PATH_PREFIX))
+
+
+def _run_client(server: StubServer, args: list[str], stdin: str | None, cache_dir: str) -> Sample:
+    """Run one aiq.py process and measure its wall time, requests served, and peak RSS (via wait4)."""
+    env = {**os.environ, "AIQ_SERVER_URL": server.url, "AIQ_CACHE_DIR": cache_dir}
+    env.pop("AIQ_METRICS", None)
+    env.pop("AIQ_METRICS_FILE", None)
+    before = _requests_served(server)
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, str(AIQ), *args],
+        stdin=subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+    if stdin is not None:
+        assert proc.stdin is not None
+        proc.stdin.write(stdin.encode("utf-8"))
+        proc.stdin.close()
+    _pid, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    elapsed = time.perf_counter() - started
+    return Sample(elapsed, _requests_served(server) - before, usage.ru_maxrss, proc.returncode)
+
+
+def _research(_server: StubServer) -> tuple[list[str], str | None]:
+    return ["--no-cache", "research", "benchmark query"], None
+
+
+def _stream(server: StubServer) -> tuple[list[str], str | None]:
+    job = server.create_job("benchmark stream", "shallow_researcher")
+    return ["stream", job.job_id], None
+
+
+def _report(server: StubServer, *, raw: bool) -> tuple[list[str], str | None]:
+    job = server.create_job("benchmark report", "shallow_researcher")
+    job.created -= server.config.queue_seconds + server.config.job_seconds
+    return ["--no-cache", "report", job.job_id, *(["--raw"] if raw else [])], None
+
+
+def _batch(size: int) -> Callable[[StubServer], tuple[list[str], str | None]]:
+    def command(_server: StubServer) -> tuple[list[str], str | None]:
+        lines = [json.dumps({"id": index, "query": f"benchmark batch {index}"}) for index in range(size)]
+        return ["--no-cache", "batch", "-"], "\n".join(lines) + "\n"
+
+    return command
+
+
+def _workloads(batch_size: int) -> dict[str, Workload]:
+    workloads = [
+        Workload("research", "submit, stream to completion, download report", _research),
+        Workload("stream", "follow one job's SSE stream to its terminal event", _stream),
+        Workload("report", "download a finished report and pretty-print it", lambda s: _report(s, raw=False)),
+        Workload("report-raw", "download a finished report with --raw streaming", lambda s: _report(s, raw=True)),
+        Workload("batch", f"{batch_size} concurrent research jobs via batch", _batch(batch_size)),
+    ]
+    return {workload.name: workload for workload in workloads}
+
+
+def run(workloads: list[Workload], server: StubServer, runs: int) -> dict[str, list[Sample]]:
+    results: dict[str, list[Sample]] = {}
+    with tempfile.TemporaryDirectory(prefix="aiq-bench-") as cache_dir:
+        for workload in workloads:
+            samples = []
+            for _ in range(runs):
+                args, stdin = workload.command(server)
+                samples.append(_run_client(server, args, stdin, cache_dir))
+            results[workload.name] = samples
+            failed = sum(1 for sample in samples if sample.exit_code)
+            print(f"  {workload.name}: {runs} runs{f', {failed} failed' if failed else ''}", file=sys.stderr)
+    return results
+
+
+def summarize(results: dict[str, list[Sample]]) -> dict[str, dict[str, float]]:
+    summary = {}
+    for name, samples in results.items():
+        seconds = [sample.seconds for sample in samples]
+        summary[name] = {
+            "median_s": statistics.median(seconds),
+            "min_s": min(seconds),
+            "max_s": max(seconds),
+            "requests": statistics.median(sample.requests for sample in samples),
+            "max_rss_mib": statistics.median(sample.max_rss_kib for sample in samples) / KIB_PER_MIB,
+            "failures": sum(1 for sample in samples if sample.exit_code),
+        }
+    return summary
+
+
+def benchmark_json(summary: dict[str, dict[str, float]]) -> list[dict[str, object]]:
+    """Entries in github-action-benchmark's customSmallerIsBetter format."""
+    entries: list[dict[str, object]] = []
+    for name, stats in summary.items():
+        entries.append({"name": f"aiq {name} time", "unit": "seconds", "value": round(stats["median_s"], 4)})
+        entries.append({"name": f"aiq {name} requests", "unit": "requests", "value": stats["requests"]})
+        entries.append({"name": f"aiq {name} peak RSS", "unit": "MiB", "value": round(stats["max_rss_mib"], 1)})
+    return entries
+
+
+def print_table(summary: dict[str, dict[str, float]], workloads: dict[str, Workload]) -> None:
+    print(f"{'workload':<12} {'median':>8} {'min':>8} {'max':>8} {'requests':>9} {'rss MiB':>8}  description")
+    for name, stats in summary.items():
+        failed = f"  ({stats['failures']:.0f} failed)" if stats["failures"] else ""
+        print(
+            f"{name:<12} {stats['median_s']:>7.3f}s {stats['min_s']:>7.3f}s {stats['max_s']:>7.3f}s "
+            f"{stats['requests']:>9.0f} {stats['max_rss_mib']:>8.1f}  {workloads[name].description}{failed}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark aiq.py against the local AI-Q stub server.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="runs per workload (median reported)")
+    parser.add_argument("--workload", action="append", help="workload to run (repeatable; default: all)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--job-seconds", type=float, default=DEFAULT_JOB_SECONDS)
+    parser.add_argument("--report-bytes", type=int, default=DEFAULT_REPORT_BYTES)
+    parser.add_argument("--drop-stream-after", type=int, default=0, help="make the stub drop SSE streams")
+    parser.add_argument("--json", action="store_true", help="print customSmallerIsBetter JSON instead of a table")
+    args = parser.parse_args()
+
+    available = _workloads(args.batch_size)
+    unknown = sorted(set(args.workload or []) - set(available))
+    if unknown:
+        parser.error(f"unknown workload(s): {', '.join(unknown)}; choose from {', '.join(available)}")
+    selected = [available[name] for name in (args.workload or available)]
+
+    config = StubConfig(
+        job_seconds=args.job_seconds,
+        report_bytes=args.report_bytes,
+        drop_stream_after=args.drop_stream_after,
+    )
+    server = serve_in_thread(config)
+    print(f"Benchmarking against stub at {server.url} ({args.runs} runs per workload)", file=sys.stderr)
+    try:
+        summary = summarize(run(selected, server, args.runs))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if args.json:
+        print(json.dumps(benchmark_json(summary), indent=2))
+    else:
+        print_table(summary, available)
+    if any(stats["failures"] for stats in summary.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""Local AI-Q stub server for offline testing and benchmarking of aiq.py.
+
+Implements the subset of the AI-Q Blueprint API the helper uses: ``/health``, ``/chat``, and ``/v1/jobs/async/*``
+including SSE streaming with event IDs and ``Last-Event-ID`` resume. Job timing, report size, and failures are
+configurable; ``GET /_stub/stats`` returns per-route request counts.
+
+    python3 aiq_stub.py --port 8765 --job-seconds 2 --report-bytes 1000000
+    AIQ_SERVER_URL=http://127.0.0.1:8765 python3 aiq.py research "anything"
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE_SECONDS = 0.2
+DEFAULT_JOB_SECONDS = 2.0
+DEFAULT_EVENT_INTERVAL_SECONDS = 0.25
+DEFAULT_REPORT_BYTES = 4096
+NO_DROP = 0
+HTTP_OK = 200
+HTTP_NOT_FOUND = 404
+HTTP_CONFLICT = 409
+HTTP_SERVER_ERROR = 500
+AGENT_TYPES = ("shallow_researcher", "deep_researcher")
+REPORT_FILLER = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. "
+
+_JOB_PATH_RE = re.compile(r"^/v1/jobs/async/job/(?P<job_id>[0-9a-f-]{36})(?:/(?P<leaf>state|report|cancel|stream))?$")
+_DEEP_CHAT_RE = re.compile(r"\bdeep\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class StubConfig:
+    """Behaviour knobs for the stub; rates are probabilities in [0, 1]."""
+
+    queue_seconds: float = DEFAULT_QUEUE_SECONDS
+    job_seconds: float = DEFAULT_JOB_SECONDS
+    event_interval: float = DEFAULT_EVENT_INTERVAL_SECONDS
+    report_bytes: int = DEFAULT_REPORT_BYTES
+    job_failure_rate: float = 0.0
+    http_error_rate: float = 0.0
+    drop_stream_after: int = NO_DROP
+    seed: int | None = None
+    verbose: bool = False
+
+
+@dataclass
+class _Job:
+    job_id: str
+    agent_type: str
+    query: str
+    created: float
+    fails: bool
+    cancelled_at: float | None = None
+
+    def state(self, config: StubConfig, now: float) -> str:
+        elapsed = now - self.created
+        if self.cancelled_at is not None:
+            return "cancelled"
+        if elapsed < config.queue_seconds:
+            return "queued"
+        if elapsed < config.queue_seconds + config.job_seconds:
+            return "running"
+        return "failed" if self.fails else "success"
+
+    def progress_steps(self, config: StubConfig, now: float) -> int:
+        """Number of progress artifacts produced so far (one per event interval while running)."""
+        end = now if self.cancelled_at is None else self.cancelled_at
+        running = min(end - self.created - config.queue_seconds, config.job_seconds)
+        return max(int(running / config.event_interval), 0)
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding stub jobs and request counters."""
+
+    def __init__(self, address: tuple[str, int], config: StubConfig) -> None:
+        super().__init__(address, _Handler)
+        self.daemon_threads = True
+        self.config = config
+        self.jobs: dict[str, _Job] = {}
+        self.stats: dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.random = random.Random(config.seed)
+        self._report = (REPORT_FILLER * (config.report_bytes // len(REPORT_FILLER) + 1))[: config.report_bytes]
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def roll(self, rate: float) -> bool:
+        with self.lock:
+            return rate > 0 and self.random.random() < rate
+
+    def count(self, route: str) -> None:
+        with self.lock:
+            self.stats[route] = self.stats.get(route, 0) + 1
+
+    def create_job(self, query: str, agent_type: str) -> _Job:
+        job = _Job(str(uuid.uuid4()), agent_type, query, time.monotonic(), self.roll(self.config.job_failure_rate))
+        with self.lock:
+            self.jobs[job.job_id] = job
+        return job
+
+    def report_for(self, job: _Job) -> dict[str, Any]:
+        return {"job_id": job.job_id, "agent_type": job.agent_type, "query": job.query, "report": self._report}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - BaseHTTPRequestHandler signature
+        if self.server.config.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _send_json(self, payload: Any, status: int = HTTP_OK) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _dispatch(self, method: str) -> None:
+        path = self.path.split("?", 1)[0]
+        body = self._read_json() if method == "POST" else {}
+        match = _JOB_PATH_RE.match(path)
+        route = f"{method} {path}" if match is None else f"{method} job/{match.group('leaf') or 'status'}"
+        self.server.count(route)
+        if path == "/_stub/stats":
+            with self.server.lock:
+                self._send_json(dict(self.server.stats))
+            return
+        if self.server.roll(self.server.config.http_error_rate):
+            self._send_json({"detail": "injected failure"}, HTTP_SERVER_ERROR)
+            return
+        if match is not None:
+            self._job_route(method, match.group("job_id"), match.group("leaf"))
+        elif method == "GET" and path in ("/health", "/v1/health"):
+            self._send_json({"status": "healthy", "stub": True})
+        elif method == "GET" and path == "/v1/jobs/async/agents":
+            self._send_json({"agents": [{"agent_type": name} for name in AGENT_TYPES]})
+        elif method == "POST" and path == "/v1/jobs/async/submit":
+            job = self.server.create_job(str(body.get("input", "")), str(body.get("agent_type", AGENT_TYPES[0])))
+            self._send_json({"job_id": job.job_id, "status": "submitted"})
+        elif method == "POST" and path == "/chat":
+            self._chat(body)
+        else:
+            self._send_json({"detail": "Not Found"}, HTTP_NOT_FOUND)
+
+    def _chat(self, body: dict[str, Any]) -> None:
+        messages = body.get("messages") or [{}]
+        query = str(messages[-1].get("content", ""))
+        if _DEEP_CHAT_RE.search(query):
+            job = self.server.create_job(query, "deep_researcher")
+            content = f"Started deep research. Job ID: {job.job_id}"
+        else:
+            content = f"Stub answer for: {query}"
+        self._send_json({"choices": [{"message": {"role": "assistant", "content": content}}]})
+
+    def _job_route(self, method: str, job_id: str, leaf: str | None) -> None:
+        with self.server.lock:
+            job = self.server.jobs.get(job_id)
+        if job is None:
+            self._send_json({"detail": f"Job {job_id} not found"}, HTTP_NOT_FOUND)
+            return
+        config = self.server.config
+        now = time.monotonic()
+        state = job.state(config, now)
+        if method == "POST" and leaf == "cancel":
+            if job.cancelled_at is None and state in ("queued", "running"):
+                job.cancelled_at = now
+            self._send_json({"job_id": job_id, "status": job.state(config, now)})
+        elif method != "GET":
+            self._send_json({"detail": "Method Not Allowed"}, HTTP_NOT_FOUND)
+        elif leaf is None:
+            self._send_json({"job_id": job_id, "status": state, "agent_type": job.agent_type})
+        elif leaf == "state":
+            steps = job.progress_steps(config, now)
+            artifacts = [{"id": step, "type": "progress", "content": f"step {step}"} for step in range(1, steps + 1)]
+            self._send_json({"job_id": job_id, "status": state, "artifacts": artifacts})
+        elif leaf == "report":
+            if state != "success":
+                self._send_json({"detail": f"Job is {state}"}, HTTP_CONFLICT)
+            else:
+                self._send_json(self.server.report_for(job))
+        else:
+            self._stream(job)
+
+    def _stream(self, job: _Job) -> None:
+        """Emit one status event per interval with sequential IDs, resuming after ``Last-Event-ID``."""
+        config = self.server.config
+        self.send_response(HTTP_OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        last_id = self.headers.get("Last-Event-ID", "")
+        seq = int(last_id) if last_id.isdigit() else 0
+        sent = 0
+        retry_ms = int(config.event_interval * 1000)
+        try:
+            self.wfile.write(f"retry: {retry_ms}\n: stub stream for {job.job_id}\n\n".encode())
+            while True:
+                seq += 1
+                state = job.state(config, time.monotonic())
+                terminal = state not in ("queued", "running")
+                event = "complete" if terminal else "status"
+                data = json.dumps({"job_id": job.job_id, "status": state, "seq": seq})
+                self.wfile.write(f"id: {seq}\nevent: {event}\ndata: {data}\n\n".encode())
+                self.wfile.flush()
+                sent += 1
+                if terminal or (config.drop_stream_after and sent >= config.drop_stream_after):
+                    return
+                time.sleep(config.event_interval)
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+
+def serve_in_thread(config: StubConfig, host: str = DEFAULT_HOST, port: int = 0) -> StubServer:
+    """Start a stub server on a background thread (port 0 picks a free port); call ``shutdown()`` to stop it."""
+    server = StubServer((host, port), config)
+    threading.Thread(target=server.serve_forever, name="aiq-stub", daemon=True).start()
+    return server
+
+
+def main() -> None:
+    """Run the stub server in the foreground."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="0 picks a free port")
+    parser.add_argument("--queue-seconds", type=float, default=DEFAULT_QUEUE_SECONDS)
+    parser.add_argument("--job-seconds", type=float, default=DEFAULT_JOB_SECONDS)
+    parser.add_argument("--event-interval", type=float, default=DEFAULT_EVENT_INTERVAL_SECONDS)
+    parser.add_argument("--report-bytes", type=int, default=DEFAULT_REPORT_BYTES)
+    parser.add_argument("--job-failure-rate", type=float, default=0.0, help="fraction of jobs that end failed")
+    parser.add_argument("--http-error-rate", type=float, default=0.0, help="fraction of requests answered HTTP 500")
+    parser.add_argument("--drop-stream-after", type=int, default=NO_DROP, help="close SSE streams after N events")
+    parser.add_argument("--seed", type=int, default=None, help="seed for failure injection")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        queue_seconds=args.queue_seconds,
+        job_seconds=args.job_seconds,
+        event_interval=args.event_interval,
+        report_bytes=args.report_bytes,
+        job_failure_rate=args.job_failure_rate,
+        http_error_rate=args.http_error_rate,
+        drop_stream_after=args.drop_stream_after,
+        seed=args.seed,
+        verbose=args.verbose,
+    )
+    server = StubServer((args.host, args.port), config)
+    print(f"AIQ_SERVER_URL={server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Stub stopped.", file=sys.stderr)
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,5 +2,14 @@ return {
   {
     "mrjones2014/smart-splits.nvim",
     build = "./kitty/install-kittens.bash",
+    -- Not lazy: smart-splits sets the IS_NVIM kitty user var at startup, which
+    -- kitty's neighboring_window.py kitten uses to forward alt+arrows here.
+    lazy = false,
+    keys = {
+      { "<A-Left>", "<cmd>lua require('smart-splits').move_cursor_left()<cr>", desc = "Move to left split" },
+      { "<A-Down>", "<cmd>lua require('smart-splits').move_cursor_down()<cr>", desc = "Move to lower split" },
+      { "<A-Up>", "<cmd>lua require('smart-splits').move_cursor_up()<cr>", desc = "Move to upper split" },
+      { "<A-Right>", "<cmd>lua require('smart-splits').move_cursor_right()<cr>", desc = "Move to right split" },
+    },
   },
 }
@@ -1,11 +1,70 @@
+"""Move focus to the neighboring window, passing the keypress through to
+programs that manage their own panes.
+
+    map ctrl+left kitten neighboring_window.py left alt+left
+
+arg1 is the kitty direction; arg2 is the key forwarded into the child when
+the foreground program has its own splits (see MATCHERS). Otherwise kitty's
+neighboring_window action moves focus between kitty windows.
+
+Resolving the foreground program means reading its cmdline from /proc, so
+the result is cached per window and only recomputed when the terminal's
+foreground process group changes (one tcgetpgrp per keypress). The cache
+lives on the Boss because kitty re-executes this file on every invocation.
+
+The forwarded bytes are cached the same way, keyed by mapping and the
+window's keyboard mode (kitty keyboard protocol flags plus DECCKM), so a
+program that pushes or pops key-encoding flags gets freshly encoded keys
+while repeated navigation skips parse_shortcut and KeyEvent entirely.
+"""
+
+import os
+import re
+
 from kitty.key_encoding import KeyEvent, parse_shortcut
 from kittens.tui.handler import result_handler
 
+# tmux's default set-titles-string is '#S:#I:#W - "#T" ...'; dot_tmux.conf
+# enables set-titles, so a remote tmux announces itself in the window title.
+REMOTE_TMUX_TITLE_RE = re.compile(r'^[^:\s]+:\d+:.* - "')
+
+# smart-splits.nvim sets this user var while nvim runs in a kitty window. nvim
+# is matched on it rather than on its executable: only smart-splits maps the
+# forwarded keys, so a bare nvim (--clean, -u NONE) must not swallow them.
+NVIM_USER_VAR = "IS_NVIM"
+NVIM_MATCHER = "nvim"
+
+
+def _remote_runs_tmux(window):
+    return bool(REMOTE_TMUX_TITLE_RE.match(window.title or ""))
+
+
+# name, foreground executables, extra per-keypress check (None = always).
+# First match wins; a match forwards arg2 into the child instead of moving
+# between kitty windows. NVIM_MATCHER applies when none of these match.
+MATCHERS = (
+    ("tmux", frozenset({"tmux"}), None),
+    ("ssh", frozenset({"ssh", "mosh-client", "et"}), _remote_runs_tmux),
+)
+MATCHER_CHECKS = {name: check for name, _executables, check in MATCHERS}
+MATCHER_CHECKS[NVIM_MATCHER] = None
+NO_MATCH = None
+CACHE_ATTR = "_neighboring_window_cache"
+
 
 def main():
     pass
 
 
+def _key_mode(window):
+    """The window state encoded_key depends on; None when it can't be read."""
+    try:
+        screen = window.screen
+        return screen.current_key_encoding_flags(), bool(screen.cursor_key_mode)
+    except Exception:
+        return None
+
+
 def encode_key_mapping(window, key_mapping):
     mods, key = parse_shortcut(key_mapping)
     event = KeyEvent(
@@ -22,14 +81,74 @@ def encode_key_mapping(window, key_mapping):
     return window.encoded_key(event)
 
 
+def _cache(boss):
+    cache = getattr(boss, CACHE_ATTR, None)
+    if cache is None:
+        cache = {"matchers": {}, "keys": {}}
+        setattr(boss, CACHE_ATTR, cache)
+    return cache
+
+
+def _encoded_key(boss, window, key_mapping):
+    """encode_key_mapping, cached per (mapping, keyboard mode)."""
+    mode = _key_mode(window)
+    if mode is None:
+        return encode_key_mapping(window, key_mapping)
+    keys = _cache(boss).setdefault("keys", {})
+    cache_key = (key_mapping, mode)
+    encoded = keys.get(cache_key)
+    if encoded is None:
+        encoded = keys[cache_key] = encode_key_mapping(window, key_mapping)
+    return encoded
+
+
+def _foreground_pgrp(window):
+    try:
+        return os.tcgetpgrp(window.child.child_fd)
+    except Exception:
+        return None
+
+
+def _resolve_matcher(window):
+    try:
+        cmdline = window.child.foreground_cmdline
+    except Exception:
+        cmdline = None
+    exe = os.path.basename(cmdline[0]) if cmdline else ""
+    for name, executables, _check in MATCHERS:
+        if exe in executables:
+            return name
+    return NO_MATCH
+
+
+def _matcher_for(boss, window):
+    """The MATCHERS name for window's foreground program, cached per process group."""
+    matchers = _cache(boss)["matchers"]
+    if len(matchers) > len(boss.window_id_map):
+        for window_id in matchers.keys() - boss.window_id_map.keys():
+            del matchers[window_id]
+    pgrp = _foreground_pgrp(window)
+    cached = matchers.get(window.id)
+    if pgrp is None or cached is None or cached[0] != pgrp:
+        cached = matchers[window.id] = (pgrp, _resolve_matcher(window))
+    matcher = cached[1]
+    if matcher is NO_MATCH and getattr(window, "user_vars", {}).get(NVIM_USER_VAR):
+        return NVIM_MATCHER
+    return matcher
+
+
 @result_handler(no_ui=True)
 def handle_result(args, result, target_window_id, boss):
     window = boss.window_id_map.get(target_window_id)
+    if window is None:
+        # The window closed between the keypress and now; nothing to forward to.
+        _cache(boss)["matchers"].pop(target_window_id, None)
+        return
 
-    cmd = window.child.foreground_cmdline[0]
-    if cmd == 'tmux':
-        keymap = args[2]
-        encoded = encode_key_mapping(window, keymap)
-        window.write_to_child(encoded)
-    else:
-        boss.active_tab.neighboring_window(args[1])
+    matcher = _matcher_for(boss, window)
+    if matcher is not NO_MATCH:
+        check = MATCHER_CHECKS[matcher]
+        if check is None or check(window):
+            window.write_to_child(_encoded_key(boss, window, args[2]))
+            return
+    boss.active_tab.neighboring_window(args[1])
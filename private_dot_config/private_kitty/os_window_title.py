@@ -15,20 +15,175 @@ fires on:
 Only the globally-active window is allowed to write the titlebar, so a
 background tab emitting a title never clobbers what you're looking at.
 
+Events only record which window should drive each OS window's titlebar; a
+single one-shot timer flushes them once per COALESCE_SECONDS, so a burst of
+OSC titles (vim redraws, ssh prompts) costs one label computation. The cwd
+is read from /proc once per window and re-read only after a command
+finishes. The title is set on every flush, even when the label is
+unchanged: kitty resets the OS window title itself on tab and title
+changes, so the watcher has to reassert it.
+
+The label comes from TITLE_TEMPLATE (or $KITTY_OS_WINDOW_TITLE_TEMPLATE in
+kitty's environment), a tab_title_template-style f-string compiled once at
+load. Fields:
+  - {cwd}        cwd basename ("~" when unknown)
+  - {cwd_path}   full cwd, with $HOME shown as ~
+  - {title}      the window title
+  - {git_branch} branch (or short detached sha) of the repo containing cwd
+  - {fg_process} basename of the foreground process
+  - {ssh_host}   host of a foreground ssh session, else ""
+Only fields the template references are computed. git_branch reads
+.git/HEAD directly (no subprocess), cached per cwd and revalidated by the
+HEAD file's mtime; repo discovery for a cwd is redone after each command.
+
 See: kitty.conf `watcher os_window_title.py`.
 """
 
 import os
-
-from kitty.fast_data_types import set_os_window_title
+import sys
+
+from kitty.fast_data_types import add_timer, set_os_window_title
+
+TITLE_TEMPLATE = "{cwd}{f' · {title}' if title and title != cwd else ''}"
+
+# About one frame at 60 Hz: long enough to swallow a title storm, short
+# enough that a tab switch still feels immediate.
+COALESCE_SECONDS = 0.016
+
+# ssh options that consume the following argument (from ssh(1) SYNOPSIS).
+SSH_OPTIONS_WITH_VALUE = frozenset("BbcDEeFIiJLlmOoPpQRSWw")
+HEAD_REF_PREFIX = "ref: refs/heads/"
+GITDIR_PREFIX = "gitdir:"
+SHORT_SHA_LENGTH = 7
+
+_pending = {}  # os_window_id -> window_id whose title should drive it
+_cwds = {}  # window_id -> cwd path (invalidated on cmd start/stop)
+_git_heads = {}  # cwd path -> .git/HEAD path, or None outside a repo
+_branches = {}  # .git/HEAD path -> (mtime_ns, branch)
+_flush_scheduled = False
+
+
+def _compile(template):
+    # Same wrapping kitty applies to tab_title_template.
+    code = compile(f'f"""{template}"""', "<os_window_title template>", "eval")
+    names = set()
+    stack = [code]
+    while stack:
+        current = stack.pop()
+        names.update(current.co_names)
+        stack.extend(const for const in current.co_consts if hasattr(const, "co_names"))
+    return code, names
+
+
+try:
+    _TEMPLATE, _TEMPLATE_NAMES = _compile(os.environ.get("KITTY_OS_WINDOW_TITLE_TEMPLATE") or TITLE_TEMPLATE)
+except SyntaxError as exc:
+    print(f"os_window_title: invalid title template ({exc}); using the default", file=sys.stderr)
+    _TEMPLATE, _TEMPLATE_NAMES = _compile(TITLE_TEMPLATE)
+_DEFAULT_TEMPLATE, _ = _compile(TITLE_TEMPLATE)
+
+
+def _cwd_path(window):
+    cwd = _cwds.get(window.id)
+    if cwd is None:
+        try:
+            cwd = window.cwd_of_child or ""
+        except Exception:
+            cwd = ""
+        cwd = _cwds[window.id] = cwd.rstrip("/") or cwd
+    return cwd
+
+
+def _find_git_head(cwd):
+    directory = cwd
+    while directory:
+        dot_git = os.path.join(directory, ".git")
+        if os.path.isdir(dot_git):
+            return os.path.join(dot_git, "HEAD")
+        if os.path.isfile(dot_git):  # worktree or submodule: "gitdir: <path>"
+            try:
+                with open(dot_git) as f:
+                    line = f.readline().strip()
+            except OSError:
+                return None
+            if line.startswith(GITDIR_PREFIX):
+                gitdir = os.path.join(directory, line[len(GITDIR_PREFIX) :].strip())
+                return os.path.join(gitdir, "HEAD")
+            return None
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+    return None
+
+
+def _git_branch(cwd):
+    if cwd not in _git_heads:
+        _git_heads[cwd] = _find_git_head(cwd)
+    head = _git_heads[cwd]
+    if head is None:
+        return ""
+    try:
+        mtime = os.stat(head).st_mtime_ns
+    except OSError:
+        return ""
+    cached = _branches.get(head)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(head) as f:
+            content = f.read().strip()
+    except OSError:
+        return ""
+    branch = content[len(HEAD_REF_PREFIX) :] if content.startswith(HEAD_REF_PREFIX) else content[:SHORT_SHA_LENGTH]
+    _branches[head] = (mtime, branch)
+    return branch
 
 
-def _cwd_base(window):
+def _foreground_cmdline(window):
     try:
-        cwd = window.cwd_of_child or ""
+        return list(window.child.foreground_cmdline or ())
     except Exception:
-        cwd = ""
-    return os.path.basename(cwd.rstrip("/")) or "~"
+        return []
+
+
+def _ssh_host(cmdline):
+    if not cmdline or os.path.basename(cmdline[0]) != "ssh":
+        return ""
+    args = iter(cmdline[1:])
+    for arg in args:
+        if arg == "--":
+            return next(args, "").rpartition("@")[2]
+        if arg.startswith("-") and len(arg) > 1:
+            # Flags bundle getopt-style (-vp 22, -vp22): the first one that
+            # takes a value owns the rest of the arg, or the next arg if none.
+            for position, flag in enumerate(arg[1:], start=2):
+                if flag in SSH_OPTIONS_WITH_VALUE:
+                    if position == len(arg):
+                        next(args, None)
+                    break
+            continue
+        return arg.rpartition("@")[2]
+    return ""
+
+
+def _fields(window):
+    cwd_path = _cwd_path(window)
+    fields = {
+        "cwd": os.path.basename(cwd_path) or "~",
+        "title": (window.title or "").strip(),
+    }
+    if "cwd_path" in _TEMPLATE_NAMES:
+        home = os.path.expanduser("~")
+        in_home = cwd_path == home or cwd_path.startswith(home + os.sep)
+        fields["cwd_path"] = "~" + cwd_path[len(home) :] if in_home else cwd_path or "~"
+    if "git_branch" in _TEMPLATE_NAMES:
+        fields["git_branch"] = _git_branch(cwd_path) if cwd_path else ""
+    if "fg_process" in _TEMPLATE_NAMES or "ssh_host" in _TEMPLATE_NAMES:
+        cmdline = _foreground_cmdline(window)
+        fields["fg_process"] = os.path.basename(cmdline[0]) if cmdline else ""
+        fields["ssh_host"] = _ssh_host(cmdline)
+    return fields
 
 
 def _is_active(boss, window):
@@ -39,26 +194,62 @@ def _is_active(boss, window):
         return True
 
 
-def _apply(window, title):
-    base = _cwd_base(window)
-    title = (title or "").strip()
-    label = f"{base} · {title}" if title and title != base else base
+def _label(window):
+    fields = _fields(window)
     try:
-        set_os_window_title(window.os_window_id, label)
+        return eval(_TEMPLATE, fields)  # noqa: S307 - the user's own template, compiled once
     except Exception:
-        pass
+        return eval(_DEFAULT_TEMPLATE, fields)  # noqa: S307
+
+
+def _flush(boss):
+    global _flush_scheduled
+    _flush_scheduled = False
+    pending = list(_pending.items())
+    _pending.clear()
+    for os_window_id, window_id in pending:
+        window = boss.window_id_map.get(window_id)
+        if window is None or not _is_active(boss, window):
+            continue
+        try:
+            set_os_window_title(os_window_id, _label(window))
+        except Exception:
+            continue
+
+
+def _schedule(boss, window):
+    """Queue a titlebar refresh for window's OS window, flushed once per frame."""
+    global _flush_scheduled
+    _pending[window.os_window_id] = window.id
+    if _flush_scheduled:
+        return
+    _flush_scheduled = True
+    try:
+        add_timer(lambda _timer_id: _flush(boss), COALESCE_SECONDS, False)
+    except Exception:
+        _flush(boss)
 
 
 def on_focus_change(boss, window, data):
     if data.get("focused"):
-        _apply(window, window.title)
+        _schedule(boss, window)
 
 
 def on_title_change(boss, window, data):
     if _is_active(boss, window):
-        _apply(window, data.get("title") or window.title)
+        _schedule(boss, window)
 
 
 def on_cmd_startstop(boss, window, data):
+    # The command may have changed directory or created/removed a repo.
+    cwd = _cwds.pop(window.id, None)
+    if cwd is not None:
+        _git_heads.pop(cwd, None)
     if _is_active(boss, window):
-        _apply(window, window.title)
+        _schedule(boss, window)
+
+
+def on_close(boss, window, data):
+    _cwds.pop(window.id, None)
+    if _pending.get(window.os_window_id) == window.id:
+        del _pending[window.os_window_id]
@@ -8,21 +8,43 @@ Extracts every ``owner/repo`` plugin spec from the lazy.nvim Lua files under
 ``private_dot_config/nvim/lua/exact_plugins``, queries GitHub in a single
 batched GraphQL call (via the ``gh`` CLI, reusing existing auth), classifies
 each plugin by last-activity age and archival status, and — for stale or
-archived plugins — scans the README for deprecation / successor cues.
-
-Output is a grouped, color-coded terminal table, worst-first.
+archived plugins — scores every README line carrying deprecation / successor
+cues. Every successor ``owner/repo`` the best-scoring line names is resolved
+in one more batched query (archived / stars / last push), so the hint points
+at a live replacement rather than the first changelog line that says
+"deprecated". A successor that does not resolve is reported, not fatal.
+
+Output is a grouped, color-coded terminal table, worst-first, or — with
+``--format json|csv`` — machine-readable rows. The JSON form is a snapshot of
+the status groups; feed it back with ``--baseline FILE`` to report only plugins
+whose status changed since then (``--update-baseline`` rewrites the file), so a
+scheduled run can alert on transitions without anyone reading the full table;
+``--fail-on-change`` makes such a run exit 1 when there are any.
+
+With ``--startuptime N`` it also runs ``nvim --headless --startuptime`` N times,
+attributes the median self-time of every ``sourcing``/``require`` entry to the
+lazy.nvim plugin directory it came from, and prints one ranked startup-cost
+table next to the freshness groups. Plugins whose spec has no ``event`` /
+``cmd`` / ``ft`` / ``keys`` trigger (and no ``lazy = true``) are flagged EAGER.
 
 Usage:
-    uv run scripts/audit-nvim-plugins.py [--nvim-dir PATH]
+    uv run scripts/audit-nvim-plugins.py [--nvim-dir PATH] [--startuptime N]
+        [--format table|json|csv]
+        [--baseline FILE [--update-baseline] [--fail-on-change]]
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
 import json
+import os
 import re
+import statistics
 import subprocess
 import sys
+import tempfile
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -38,33 +60,108 @@ RESET = "\033[0m"
 # First-position quoted "owner/repo" on a Lua line (the plugin spec / dependency).
 SPEC_RE = re.compile(r'^\s*"([\w.-]+/[\w.-]+)"')
 
-# Case-insensitive cues that a plugin is deprecated / has a successor.
-HINT_CUES = [
-    "deprecat",
-    "no longer maintained",
-    "unmaintained",
-    "archived",
-    "superseded",
-    "successor",
-    "moved to",
-    "replaced by",
-]
-USE_INSTEAD_RE = re.compile(r"use\b.*\binstead", re.IGNORECASE)
+# Case-insensitive cues that a plugin is deprecated / has a successor, weighted
+# by how strongly they point at a replacement (vs. merely "it's old").
+HINT_CUES = {
+    "deprecat": 2,
+    "no longer maintained": 3,
+    "unmaintained": 3,
+    "archived": 2,
+    "superseded": 4,
+    "successor": 4,
+    "moved to": 3,
+    "replaced by": 4,
+}
+USE_INSTEAD_WEIGHT = 3
+# Every cue in one alternation, so a README line is scanned once for all of them.
+HINT_RE = re.compile(
+    "|".join(f"(?P<c{i}>{re.escape(cue)})" for i, cue in enumerate(HINT_CUES))
+    + r"|(?P<instead>use\b.*?\binstead)",
+    re.IGNORECASE,
+)
+HINT_CUE_WEIGHTS = {f"c{i}": w for i, w in enumerate(HINT_CUES.values())} | {
+    "instead": USE_INSTEAD_WEIGHT
+}
 # A GitHub URL or [[owner/repo]]-style reference inside a hint line.
 SUCCESSOR_REF_RE = re.compile(
     r"(?:github\.com/([\w.-]+/[\w.-]+))|(?:\[\[?([\w.-]+/[\w.-]+)\]?\])"
 )
+# github.com/<owner>/… paths that are site pages, not repositories.
+NON_REPO_OWNERS = frozenset({"sponsors", "orgs", "features", "marketplace", "settings", "topics"})
+# Release-history lines mention "deprecated" constantly; they are rarely the
+# project's own successor notice.
+CHANGELOG_LINE_RE = re.compile(
+    r"^(?:[-*+]\s*)?(?:v?\d+\.\d+(?:\.\d+)?\b|\d{4}-\d{2}-\d{2})|\bbreaking change",
+    re.IGNORECASE,
+)
+CHANGELOG_HEADING_RE = re.compile(r"^#+\s*.*\b(?:changelog|release notes|history|news)\b", re.IGNORECASE)
+# Scoring: a concrete successor reference dominates; a notice near the top of
+# the README (banner / admonition / heading) beats one buried further down.
+SCORE_REF = 3
+SCORE_NOTICE = 1
+SCORE_TOP = 2
+SCORE_CHANGELOG = -4
+TOP_LINES = 30
+
+# Status groups, worst-first; also the key order of the JSON snapshot.
+STATUSES = ("ARCHIVED", "DORMANT", "STALE", "ACTIVE", "UNRESOLVED")
+COLOR = {
+    "ARCHIVED": RED,
+    "DORMANT": RED,
+    "STALE": YELLOW,
+    "ACTIVE": GREEN,
+    "UNRESOLVED": DIM,
+}
+ICON = {
+    "ARCHIVED": "📦",
+    "DORMANT": "💤",
+    "STALE": "⚠️ ",
+    "ACTIVE": "✓",
+    "UNRESOLVED": "❓",
+}
+# (repo, age_days, hint, url, successor) — one plugin within a status group.
+Row = tuple[str, int | None, str, str, str]
 
 # Classification thresholds in days.
 ONE_YEAR = 365
 TWO_YEARS = 730
 
+# lazy.nvim spec keys that defer loading until the trigger fires.
+LAZY_TRIGGERS = ("event", "cmd", "ft", "keys")
+REPO_RE = re.compile(r"^[\w.-]+/[\w.-]+$")
+# Just enough of Lua to follow spec tables: comments, strings, braces and
+# `key =` assignments (optionally `lazy = true|false`). Long strings / block
+# comments are not modelled — plugin specs don't put braces in them.
+LUA_TOKEN_RE = re.compile(
+    r"(?P<comment>--.*)"
+    r"|(?P<str>\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*')"
+    r"|(?P<open>\{)|(?P<close>\})"
+    r"|(?P<key>\b[A-Za-z_]\w*)\s*=(?!=)\s*(?P<bool>true|false)?"
+)
+# `--startuptime` entry: clock, self+sourced, self, label (3-number rows only).
+STARTUPTIME_RE = re.compile(
+    r"^\s*[\d.]+\s+[\d.]+\s+(?P<self>[\d.]+):\s+(?P<label>.+)$"
+)
+STARTUPTIME_CLOCK_RE = re.compile(r"^\s*(?P<clock>[\d.]+)\s")
+REQUIRE_RE = re.compile(r"require\('([^'.]+)")
+LAZY_DIR_RE = re.compile(r"/lazy/([^/]+)/")
+
+
+def spec_texts(nvim_dir: Path) -> list[str]:
+    """Contents of the plugin spec files, in a stable order."""
+    return [f.read_text(encoding="utf-8") for f in sorted(nvim_dir.glob("*.lua"))]
+
 
 def extract_repos(nvim_dir: Path) -> list[str]:
     """Return a deduped, sorted list of ``owner/repo`` specs from the Lua files."""
+    return repos_from_texts(spec_texts(nvim_dir))
+
+
+def repos_from_texts(texts: list[str]) -> list[str]:
+    """extract_repos over already-loaded spec file contents."""
     repos: set[str] = set()
-    for lua_file in sorted(nvim_dir.glob("*.lua")):
-        for line in lua_file.read_text(encoding="utf-8").splitlines():
+    for text in texts:
+        for line in text.splitlines():
             if line.lstrip().startswith("--"):
                 continue
             match = SPEC_RE.match(line)
@@ -73,85 +170,367 @@ def extract_repos(nvim_dir: Path) -> list[str]:
     return sorted(repos)
 
 
-def build_graphql_query(repos: list[str]) -> str:
+@dataclass
+class _SpecFrame:
+    """One open Lua table while walking a plugin spec file."""
+
+    key: str | None
+    in_deps: bool
+    repo: str | None = None
+    fresh: bool = True
+    keys: set[str] = field(default_factory=set)
+    lazy: bool | None = None
+    optional: bool = False
+
+
+def extract_spec_triggers(nvim_dir: Path) -> dict[str, str]:
+    """spec_triggers_from_texts over the spec files in nvim_dir."""
+    return spec_triggers_from_texts(spec_texts(nvim_dir))
+
+
+def spec_triggers_from_texts(texts: list[str]) -> dict[str, str]:
+    """Map each plugin spec to its lazy-load trigger summary.
+
+    Fragments of the same plugin (e.g. a ``specs = {…}`` override) are merged
+    the way lazy.nvim merges them: an explicit ``lazy = false`` wins, otherwise
+    any trigger makes the plugin lazy. Values are the sorted trigger keys
+    (``"cmd,keys"``), ``"lazy"`` for a bare ``lazy = true``, ``"lazy=false"``
+    for an explicit eager opt-out,
+    ``"dependency"`` for repos only pulled in via ``dependencies``,
+    ``"optional"`` when every fragment is ``optional = true`` (lazy.nvim then
+    does not install it at all), or ``"EAGER"`` when nothing defers the load.
+    """
+    triggers: dict[str, set[str]] = {}
+    lazy: dict[str, bool] = {}
+    deps: set[str] = set()
+    required: set[str] = set()  # named by at least one non-optional spec
+
+    for text in texts:
+        stack: list[_SpecFrame] = []
+        for line in text.splitlines():
+            pending_key: str | None = None
+            for m in LUA_TOKEN_RE.finditer(line):
+                kind = m.lastgroup if m.lastgroup != "bool" else "key"
+                if kind == "comment":
+                    break
+                top = stack[-1] if stack else None
+                if kind == "open":
+                    parent_deps = top.in_deps if top else False
+                    stack.append(
+                        _SpecFrame(pending_key, parent_deps or pending_key == "dependencies")
+                    )
+                    if top:
+                        top.fresh = False
+                elif kind == "close":
+                    if stack:
+                        frame = stack.pop()
+                        if frame.repo and not frame.in_deps:
+                            triggers.setdefault(frame.repo, set()).update(
+                                k for k in frame.keys if k in LAZY_TRIGGERS
+                            )
+                            if not frame.optional:
+                                required.add(frame.repo)
+                            if frame.lazy is not None:
+                                lazy[frame.repo] = lazy.get(frame.repo, True) and frame.lazy
+                        elif frame.repo:
+                            deps.add(frame.repo)
+                elif kind == "str" and top:
+                    value = m.group("str")[1:-1]
+                    if REPO_RE.match(value):
+                        if top.fresh and top.key is None:
+                            top.repo = value
+                        elif top.in_deps:
+                            deps.add(value)
+                        elif len(stack) == 1 and pending_key is None:
+                            # `"owner/repo",` directly in the returned spec
+                            # list: a whole spec with no triggers.
+                            triggers.setdefault(value, set())
+                            required.add(value)
+                    top.fresh = False
+                elif kind == "key" and top:
+                    # Only `key =` at table level (after `{`, `,` or line start);
+                    # assignments inside inline functions are not spec keys.
+                    before = line[: m.start()].rstrip()
+                    if before and before[-1] not in "{,":
+                        pending_key = None
+                        continue
+                    name = m.group("key")
+                    top.keys.add(name)
+                    top.fresh = False
+                    if name == "lazy" and m.group("bool"):
+                        top.lazy = m.group("bool") == "true"
+                    elif name == "optional":
+                        top.optional = m.group("bool") == "true"
+                    pending_key = None if m.group("bool") else name
+                    continue
+                pending_key = None
+
+    summary: dict[str, str] = {}
+    for repo in sorted(set(triggers) | deps):
+        if repo not in triggers:
+            summary[repo] = "dependency"
+        elif repo not in required and repo not in deps:
+            summary[repo] = "optional"
+        elif lazy.get(repo) is False:
+            summary[repo] = "lazy=false"
+        elif triggers[repo]:
+            summary[repo] = ",".join(sorted(triggers[repo]))
+        elif lazy.get(repo):
+            summary[repo] = "lazy"
+        else:
+            summary[repo] = "EAGER"
+    return summary
+
+
+def lazy_root() -> Path:
+    """lazy.nvim's install root (``stdpath("data")/lazy``)."""
+    data_home = os.environ.get("XDG_DATA_HOME") or str(Path.home() / ".local/share")
+    return Path(data_home) / "nvim" / "lazy"
+
+
+def build_module_index(root: Path) -> dict[str, str]:
+    """Map each top-level Lua module name to the plugin directory providing it."""
+    index: dict[str, str] = {}
+    if not root.is_dir():
+        return index
+    for plugin_dir in sorted(root.iterdir()):
+        lua_dir = plugin_dir / "lua"
+        if not lua_dir.is_dir():
+            continue
+        for entry in lua_dir.iterdir():
+            index.setdefault(entry.stem if entry.suffix == ".lua" else entry.name, plugin_dir.name)
+    return index
+
+
+def parse_startuptime(text: str, module_index: dict[str, str]) -> tuple[dict[str, float], float]:
+    """Sum self-time (ms) per plugin directory for one ``--startuptime`` log.
+
+    Returns (per_plugin_ms, total_ms); total is the last clock value.
+    """
+    per_plugin: dict[str, float] = {}
+    total = 0.0
+    for line in text.splitlines():
+        clock = STARTUPTIME_CLOCK_RE.match(line)
+        if clock:
+            total = float(clock.group("clock"))
+        m = STARTUPTIME_RE.match(line)
+        if not m:
+            continue
+        label = m.group("label")
+        plugin = None
+        if label.startswith("sourcing "):
+            d = LAZY_DIR_RE.search(label)
+            plugin = d.group(1) if d else None
+        else:
+            r = REQUIRE_RE.match(label)
+            plugin = module_index.get(r.group(1)) if r else None
+        if plugin:
+            per_plugin[plugin] = per_plugin.get(plugin, 0.0) + float(m.group("self"))
+    return per_plugin, total
+
+
+def profile_startup(runs: int, nvim: str = "nvim") -> tuple[dict[str, float], float]:
+    """Run headless nvim ``runs`` times; return median ms per plugin dir and overall."""
+    module_index = build_module_index(lazy_root())
+    samples: list[dict[str, float]] = []
+    totals: list[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "startuptime.log"
+        for _ in range(runs):
+            log.unlink(missing_ok=True)
+            result = subprocess.run(
+                [nvim, "--headless", "--startuptime", str(log), "+qa"],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0 or not log.exists():
+                sys.stderr.write(f"{RED}nvim --startuptime failed:{RESET}\n{result.stderr}\n")
+                sys.exit(1)
+            per_plugin, total = parse_startuptime(log.read_text(encoding="utf-8"), module_index)
+            samples.append(per_plugin)
+            totals.append(total)
+
+    plugins = {name for sample in samples for name in sample}
+    medians = {
+        name: statistics.median(sample.get(name, 0.0) for sample in samples) for name in plugins
+    }
+    return medians, statistics.median(totals)
+
+
+def build_graphql_query(repos: list[str], *, readme: bool = True) -> str:
     """Build a single GraphQL query aliasing each repo as ``r<N>``."""
     nodes = []
     for i, repo in enumerate(repos):
         owner, name = repo.split("/", 1)
         nodes.append(
             f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ '
-            "isArchived pushedAt url description "
-            'readme: object(expression: "HEAD:README.md") { ... on Blob { text } } '
-            "}"
+            "isArchived pushedAt url description stargazerCount "
+            + ('readme: object(expression: "HEAD:README.md") { ... on Blob { text } } ' if readme else "")
+            + "}"
         )
     return "query {\n" + "\n".join(nodes) + "\n}"
 
 
-def run_graphql(query: str) -> dict:
-    """Run the GraphQL query via ``gh api graphql`` and return the data map."""
+def run_graphql(query: str, *, partial: bool = False) -> dict:
+    """Run the GraphQL query via ``gh api graphql`` and return the data map.
+
+    gh exits non-zero when any alias errors (a renamed or bogus repo) but still
+    prints the payload. With ``partial`` that payload is used as-is and a
+    failed call degrades to an empty map instead of aborting the audit.
+    """
     result = subprocess.run(
         ["gh", "api", "graphql", "-f", f"query={query}"],
         capture_output=True,
         text=True,
     )
-    if result.returncode != 0:
+    if result.returncode != 0 and not partial:
         sys.stderr.write(f"{RED}gh api graphql failed:{RESET}\n{result.stderr}\n")
         sys.exit(1)
-    payload = json.loads(result.stdout)
+    try:
+        payload = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        sys.stderr.write(f"{YELLOW}gh api graphql returned no data:{RESET}\n{result.stderr}\n")
+        return {}
     # Partial errors (e.g. a renamed repo) are expected; nodes are still returned.
     return payload.get("data") or {}
 
 
-def find_hint(readme_text: str) -> str:
-    """Return the first deprecation/successor snippet found in the README, or ''."""
-    for raw_line in readme_text.splitlines():
+@dataclass
+class HintCandidate:
+    """A README line carrying deprecation/successor cues, with its score."""
+
+    score: int
+    line_no: int
+    snippet: str
+    successors: list[str]
+
+
+def hint_candidates(readme_text: str, repo: str = "") -> list[HintCandidate]:
+    """Score every README line that carries a cue, best first.
+
+    One ``HINT_RE`` scan per line collects all cues; a line's score is the sum
+    of its cue weights plus bonuses for a successor reference and for sitting in
+    the README's opening banner, minus a penalty for changelog entries.
+    """
+    candidates: list[HintCandidate] = []
+    in_changelog = False
+    for line_no, raw_line in enumerate(readme_text.splitlines()):
         line = raw_line.strip()
         if not line:
             continue
-        lower = line.lower()
-        matched = any(cue in lower for cue in HINT_CUES) or USE_INSTEAD_RE.search(line)
-        if not matched:
+        if line.startswith("#"):
+            in_changelog = bool(CHANGELOG_HEADING_RE.match(line))
+        cues = {m.lastgroup for m in HINT_RE.finditer(line)}
+        if not cues:
             continue
-        snippet = line[:120]
-        ref = SUCCESSOR_REF_RE.search(line)
-        if ref:
-            successor = ref.group(1) or ref.group(2)
-            return f"→ {successor}: {snippet}"
-        return snippet
-    return ""
-
-
-def classify(node: dict | None) -> tuple[str, int | None, str]:
-    """Return (status, age_days, hint) for a repository node."""
+        score = sum(HINT_CUE_WEIGHTS[c] for c in cues)
+
+        successors: list[str] = []
+        for ref in SUCCESSOR_REF_RE.finditer(line):
+            successor = (ref.group(1) or ref.group(2)).removesuffix(".git").rstrip(".")
+            owner = successor.split("/", 1)[0]
+            if (
+                successor.lower() != repo.lower()
+                and owner.lower() not in NON_REPO_OWNERS
+                and successor not in successors
+            ):
+                successors.append(successor)
+        if successors:
+            score += SCORE_REF
+        if line_no < TOP_LINES:
+            score += SCORE_TOP
+        if line.startswith((">", "#", "**", "[!")):
+            score += SCORE_NOTICE
+        if in_changelog or CHANGELOG_LINE_RE.match(line):
+            score += SCORE_CHANGELOG
+        if score > 0:
+            candidates.append(HintCandidate(score, line_no, line[:120], successors))
+    candidates.sort(key=lambda c: (-c.score, c.line_no))
+    return candidates
+
+
+def find_hint(readme_text: str, repo: str = "") -> tuple[str, list[str]]:
+    """Return (best-scoring snippet, the successor refs on that line)."""
+    candidates = hint_candidates(readme_text, repo)
+    if not candidates:
+        return "", []
+    return candidates[0].snippet, candidates[0].successors
+
+
+def classify(node: dict | None, repo: str = "") -> tuple[str, int | None, str, list[str]]:
+    """Return (status, age_days, hint, successors) for a repository node."""
     if node is None:
-        return "UNRESOLVED", None, "repo not found (renamed/deleted?)"
+        return "UNRESOLVED", None, "repo not found (renamed/deleted?)", []
 
+    age_days = node_age_days(node)
     if node.get("isArchived"):
         status = "ARCHIVED"
+    elif age_days is None:
+        return "UNRESOLVED", None, "", []
+    elif age_days > TWO_YEARS:
+        status = "DORMANT"
+    elif age_days > ONE_YEAR:
+        status = "STALE"
     else:
-        pushed_at = node.get("pushedAt")
-        if not pushed_at:
-            return "UNRESOLVED", None, ""
-        pushed = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
-        age_days = (datetime.now(timezone.utc) - pushed).days
-        if age_days > TWO_YEARS:
-            status = "DORMANT"
-        elif age_days > ONE_YEAR:
-            status = "STALE"
-        else:
-            status = "ACTIVE"
-
-    pushed_at = node.get("pushedAt")
-    age_days = None
-    if pushed_at:
-        pushed = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
-        age_days = (datetime.now(timezone.utc) - pushed).days
+        status = "ACTIVE"
 
-    hint = ""
+    hint, successors = "", []
     if status in ("ARCHIVED", "DORMANT", "STALE"):
         readme = node.get("readme") or {}
-        hint = find_hint(readme.get("text") or "")
-    return status, age_days, hint
+        hint, successors = find_hint(readme.get("text") or "", repo)
+    return status, age_days, hint, successors
+
+
+def node_age_days(node: dict) -> int | None:
+    """Days since the repository node was last pushed to."""
+    pushed_at = node.get("pushedAt")
+    if not pushed_at:
+        return None
+    pushed = datetime.fromisoformat(pushed_at.replace("Z", "+00:00"))
+    return (datetime.now(timezone.utc) - pushed).days
+
+
+def resolve_successors(
+    successors_of: dict[str, list[str]], data: dict[str, dict | None]
+) -> dict[str, dict | None]:
+    """Fetch archived/stars/pushedAt for every successor in one batched query.
+
+    Successors that are themselves configured plugins reuse ``data`` (keyed by
+    repo) instead of being queried again. A successor GitHub answered with
+    null maps to None (not found); one the query never answered is absent.
+    """
+    wanted = sorted({s for succ in successors_of.values() for s in succ if s not in data})
+    resolved: dict[str, dict | None] = {repo: node for repo, node in data.items() if node}
+    if wanted:
+        fetched = run_graphql(build_graphql_query(wanted, readme=False), partial=True)
+        for i, repo in enumerate(wanted):
+            if f"r{i}" in fetched:
+                resolved[repo] = fetched[f"r{i}"]
+    return resolved
+
+
+def pick_successor(successors: list[str], resolved: dict[str, dict | None]) -> str:
+    """The most actionable successor: live (exists, not archived), then README order."""
+    found = [s for s in successors if resolved.get(s)]
+    live = [s for s in found if not resolved[s].get("isArchived")]
+    return (live or found or successors or [""])[0]
+
+
+def fmt_successor(repo: str, resolved: dict[str, dict | None]) -> str:
+    """``owner/repo (★1.2k, 3mo)`` — or ``(archived)`` / ``(not found)`` / ``(unknown)``."""
+    if repo not in resolved:
+        return f"{repo} (unknown)"
+    node = resolved[repo]
+    if node is None:
+        return f"{repo} (not found)"
+    if node.get("isArchived"):
+        return f"{repo} (archived)"
+    return f"{repo} (★{fmt_stars(node.get('stargazerCount') or 0)}, {fmt_age(node_age_days(node))})"
+
+
+def fmt_stars(count: int) -> str:
+    """Compact star count (1234 → 1.2k)."""
+    return f"{count / 1000:.1f}k" if count >= 1000 else str(count)
 
 
 def fmt_age(age_days: int | None) -> str:
@@ -166,6 +545,144 @@ def fmt_age(age_days: int | None) -> str:
     return f"{years:.1f}y"
 
 
+def startup_rows(runs: int, spec_triggers: dict[str, str]) -> tuple[list[tuple[str, float, str]], float]:
+    """Rank plugins by median startup self-time; EAGER specs are always listed.
+
+    Returns ([(repo, median_ms, trigger), …] worst-first, median total ms).
+    """
+    medians, total = profile_startup(runs)
+    # lazy.nvim clones into a directory named after the repo.
+    repo_of_dir = {repo.split("/", 1)[1]: repo for repo in spec_triggers}
+    rows: dict[str, tuple[float, str]] = {}
+    for plugin_dir, ms in medians.items():
+        repo = repo_of_dir.get(plugin_dir, plugin_dir)
+        rows[repo] = (ms, spec_triggers.get(repo, ""))
+    for repo, trigger in spec_triggers.items():
+        if trigger == "EAGER":
+            rows.setdefault(repo, (0.0, trigger))
+    ranked = sorted(rows.items(), key=lambda r: (-r[1][0], r[0].lower()))
+    return [(repo, ms, trigger) for repo, (ms, trigger) in ranked], total
+
+
+def print_startup_table(
+    runs: int, ranked: list[tuple[str, float, str]], total: float, status_of: dict[str, str]
+) -> None:
+    """Print the ranked startup-cost table, flagging EAGER specs."""
+    print(f"{BOLD}⏱  STARTUP COST ({len(ranked)}){RESET} {DIM}— median of {runs} runs, {total:.1f}ms total{RESET}")
+    for rank, (repo, ms, trigger) in enumerate(ranked, start=1):
+        status = status_of.get(repo, "")
+        c = RED if trigger == "EAGER" else DIM
+        line = f"  {rank:>3}. {repo:<40} {ms:>7.2f}ms  {DIM}{status:<10}{RESET}"
+        if trigger:
+            line += f" {c}{trigger}{RESET}"
+        print(line)
+    print()
+
+
+def snapshot(groups: dict[str, list[Row]], previous: dict[str, str] | None = None) -> dict:
+    """Serialise ``groups`` as the JSON snapshot that ``--baseline`` reads back.
+
+    With ``previous`` (a baseline), each row also carries its prior status.
+    """
+    out: dict[str, list[dict]] = {}
+    for status in STATUSES:
+        out[status] = []
+        for repo, age_days, hint, url, successor in sorted(groups[status], key=lambda r: r[0].lower()):
+            row = {"repo": repo, "age_days": age_days, "hint": hint, "url": url, "successor": successor}
+            if previous is not None:
+                row["previous"] = previous.get(repo)
+            out[status].append(row)
+    return {
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "groups": out,
+    }
+
+
+def load_baseline(path: Path) -> dict[str, str]:
+    """Return ``{repo: status}`` from a snapshot written by ``--format json``."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        sys.stderr.write(f"{RED}unreadable baseline {path}: {exc}{RESET}\n")
+        sys.exit(1)
+    return {
+        row["repo"]: status
+        for status, rows in (payload.get("groups") or {}).items()
+        for row in rows
+    }
+
+
+def diff_groups(
+    groups: dict[str, list[Row]], previous: dict[str, str]
+) -> tuple[dict[str, list[Row]], list[str]]:
+    """Keep only rows whose status differs from ``previous`` (new repos included).
+
+    Returns (changed_groups, removed_repos).
+    """
+    changed: dict[str, list[Row]] = {status: [] for status in STATUSES}
+    current: set[str] = set()
+    for status, rows in groups.items():
+        for row in rows:
+            current.add(row[0])
+            if previous.get(row[0]) != status:
+                changed[status].append(row)
+    removed = sorted(set(previous) - current, key=str.lower)
+    return changed, removed
+
+
+def write_csv(
+    groups: dict[str, list[Row]],
+    previous: dict[str, str] | None,
+    startup: list[tuple[str, float, str]] | None = None,
+) -> None:
+    """Write one CSV row per plugin (``previous`` column only with a baseline).
+
+    With ``startup`` rows also carry ``startup_ms`` / ``trigger``; profiled
+    plugins outside the report follow with an empty status.
+    """
+    fields = ["status", "repo", "age_days", "hint", "url", "successor"]
+    if previous is not None:
+        fields.append("previous")
+    cost = {repo: (ms, trigger) for repo, ms, trigger in startup or []}
+    if startup is not None:
+        fields += ["startup_ms", "trigger"]
+    writer = csv.DictWriter(sys.stdout, fieldnames=fields)
+    writer.writeheader()
+    for status, rows in snapshot(groups, previous)["groups"].items():
+        for row in rows:
+            if startup is not None:
+                ms, trigger = cost.pop(row["repo"], (None, ""))
+                row |= {"startup_ms": ms, "trigger": trigger}
+            writer.writerow({"status": status, **row})
+    for repo, (ms, trigger) in cost.items():
+        writer.writerow({"status": "", "repo": repo, "startup_ms": ms, "trigger": trigger})
+
+
+def print_table(groups: dict[str, list[Row]], previous: dict[str, str] | None) -> None:
+    """Print the grouped, color-coded table (only transitions with a baseline)."""
+    # Detailed groups worst-first; ACTIVE is a count unless it is a transition.
+    detailed = STATUSES if previous is not None else ("ARCHIVED", "DORMANT", "STALE", "UNRESOLVED")
+    for status in detailed:
+        rows = sorted(groups[status], key=lambda r: r[0].lower())
+        if not rows:
+            continue
+        c = COLOR[status]
+        print(f"{c}{BOLD}{ICON[status]} {status} ({len(rows)}){RESET}")
+        for repo, age_days, hint, _url, _successor in rows:
+            line = f"  {c}{repo:<40}{RESET} {DIM}{fmt_age(age_days):>6}{RESET}"
+            if previous is not None:
+                line += f"  {DIM}was {previous.get(repo) or 'NEW'}{RESET}"
+            if hint:
+                line += f"  {CYAN}{hint}{RESET}"
+            print(line)
+        print()
+
+    if previous is None:
+        # Active summary count only.
+        active = groups["ACTIVE"]
+        print(f"{GREEN}{BOLD}✓ ACTIVE ({len(active)}){RESET} {DIM}— pushed within 1 year{RESET}\n")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     default_dir = (
@@ -178,71 +695,120 @@ def main() -> None:
         default=default_dir,
         help="Directory of lazy.nvim plugin spec Lua files.",
     )
+    parser.add_argument(
+        "--startuptime",
+        type=int,
+        default=0,
+        metavar="RUNS",
+        help="Also profile headless nvim startup over RUNS iterations.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("table", "json", "csv"),
+        default="table",
+        help="Output format; json is the snapshot format --baseline reads.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Previous json snapshot; report only plugins whose status changed.",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="After diffing, overwrite --baseline with the full current snapshot.",
+    )
+    parser.add_argument(
+        "--fail-on-change",
+        action="store_true",
+        help="Exit 1 when an existing --baseline shows status changes (for alerting).",
+    )
     args = parser.parse_args()
 
     if not args.nvim_dir.is_dir():
         sys.stderr.write(f"{RED}nvim dir not found: {args.nvim_dir}{RESET}\n")
         sys.exit(1)
+    if (args.update_baseline or args.fail_on_change) and not args.baseline:
+        parser.error("--update-baseline and --fail-on-change require --baseline")
 
     repos = extract_repos(args.nvim_dir)
-    print(f"{BOLD}🔍 Auditing {len(repos)} Neovim plugins…{RESET}\n")
+    banner = sys.stdout if args.format == "table" else sys.stderr
+    print(f"{BOLD}🔍 Auditing {len(repos)} Neovim plugins…{RESET}\n", file=banner)
 
     query = build_graphql_query(repos)
     data = run_graphql(query)
 
     # Collect results per status group.
-    groups: dict[str, list[tuple[str, int | None, str, str]]] = {
-        "ARCHIVED": [],
-        "DORMANT": [],
-        "STALE": [],
-        "ACTIVE": [],
-        "UNRESOLVED": [],
-    }
-    for i, repo in enumerate(repos):
-        node = data.get(f"r{i}")
-        status, age_days, hint = classify(node)
-        url = (node or {}).get("url", "")
-        groups[status].append((repo, age_days, hint, url))
-
-    color = {
-        "ARCHIVED": RED,
-        "DORMANT": RED,
-        "STALE": YELLOW,
-        "ACTIVE": GREEN,
-        "UNRESOLVED": DIM,
-    }
-    icon = {
-        "ARCHIVED": "📦",
-        "DORMANT": "💤",
-        "STALE": "⚠️ ",
-        "ACTIVE": "✓",
-        "UNRESOLVED": "❓",
-    }
-
-    # Detailed groups worst-first.
-    for status in ("ARCHIVED", "DORMANT", "STALE", "UNRESOLVED"):
-        rows = sorted(groups[status], key=lambda r: r[0].lower())
-        if not rows:
-            continue
-        c = color[status]
-        print(f"{c}{BOLD}{icon[status]} {status} ({len(rows)}){RESET}")
-        for repo, age_days, hint, _url in rows:
-            line = f"  {c}{repo:<40}{RESET} {DIM}{fmt_age(age_days):>6}{RESET}"
-            if hint:
-                line += f"  {CYAN}{hint}{RESET}"
-            print(line)
-        print()
-
-    # Active summary count only.
-    active = groups["ACTIVE"]
-    print(f"{GREEN}{BOLD}✓ ACTIVE ({len(active)}){RESET} {DIM}— pushed within 1 year{RESET}\n")
-
-    flagged = sum(len(groups[s]) for s in ("ARCHIVED", "DORMANT", "STALE", "UNRESOLVED"))
-    if flagged:
-        print(
-            f"{DIM}For replacement research on flagged plugins, see "
-            f"https://dotfyle.com (browse by category / popularity).{RESET}"
-        )
+    groups: dict[str, list[Row]] = {status: [] for status in STATUSES}
+    nodes = {repo: data.get(f"r{i}") for i, repo in enumerate(repos)}
+    classified = {repo: classify(node, repo) for repo, node in nodes.items()}
+
+    # Second (and last) round-trip: resolve every successor the READMEs name.
+    successors_of = {repo: c[3] for repo, c in classified.items() if c[3]}
+    resolved = resolve_successors(successors_of, nodes) if successors_of else {}
+
+    for repo, (status, age_days, hint, successors) in classified.items():
+        successor = pick_successor(successors, resolved) if successors else ""
+        if successor:
+            others = len(successors) - 1
+            more = f" (+{others} more)" if others else ""
+            hint = f"→ {fmt_successor(successor, resolved)}{more}: {hint}"
+        url = (nodes[repo] or {}).get("url", "")
+        groups[status].append((repo, age_days, hint, url, successor))
+
+    previous = None
+    removed: list[str] = []
+    report = groups
+    changed = False
+    if args.baseline and args.baseline.exists():
+        previous = load_baseline(args.baseline)
+        report, removed = diff_groups(groups, previous)
+        changed = any(report.values()) or bool(removed)
+    elif args.baseline:
+        # First scheduled run: no snapshot yet, so every plugin is "new".
+        previous = {}
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(snapshot(groups), indent=2) + "\n", encoding="utf-8")
+
+    startup: tuple[list[tuple[str, float, str]], float] | None = None
+    if args.startuptime > 0:
+        startup = startup_rows(args.startuptime, extract_spec_triggers(args.nvim_dir))
+
+    if args.format == "json":
+        payload = snapshot(report, previous)
+        if previous is not None:
+            payload["removed"] = removed
+        if startup:
+            ranked, total = startup
+            payload["startup"] = {
+                "runs": args.startuptime,
+                "total_ms": total,
+                "plugins": [{"repo": r, "median_ms": ms, "trigger": t} for r, ms, t in ranked],
+            }
+        print(json.dumps(payload, indent=2))
+    elif args.format == "csv":
+        write_csv(report, previous, startup[0] if startup else None)
+    else:
+        print_table(report, previous)
+        if previous is not None:
+            for repo in removed:
+                print(f"  {DIM}{repo:<40} removed since baseline{RESET}")
+            if not changed:
+                print(f"{GREEN}No status changes since {args.baseline}.{RESET}\n")
+
+        if startup:
+            status_of = {row[0]: status for status, rows in groups.items() for row in rows}
+            print_startup_table(args.startuptime, *startup, status_of)
+
+        flagged = sum(len(report[s]) for s in ("ARCHIVED", "DORMANT", "STALE", "UNRESOLVED"))
+        if flagged:
+            print(
+                f"{DIM}For replacement research on flagged plugins, see "
+                f"https://dotfyle.com (browse by category / popularity).{RESET}"
+            )
+
+    if changed and args.fail_on_change:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
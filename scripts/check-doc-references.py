@@ -42,14 +42,7 @@ import sys
 from fnmatch import fnmatch
 from pathlib import Path
 
-# chezmoi source-name attribute prefixes / suffix. A doc that references a
-# managed file by its *rendered* name (e.g. hooks/foo.sh) must still resolve
-# against its source form (hooks/executable_foo.sh, dot_foo -> .foo, …).
-CHEZMOI_PREFIXES = (
-    "encrypted_", "private_", "readonly_", "empty_", "executable_", "exact_",
-    "literal_", "symlink_", "run_once_", "run_onchange_", "run_", "create_",
-    "modify_", "before_", "after_", "once_", "onchange_",
-)
+from chezmoi_source import SourceIndex
 
 MD_LINK = re.compile(r"\[[^\]]*\]\(([^)]+)\)")
 INLINE_CODE = re.compile(r"`([^`]+)`")
@@ -79,29 +72,17 @@ def load_allowlist(root: Path) -> list[str]:
     ]
 
 
-def _rendered_name(src_name: str) -> str:
-    """Map a chezmoi source basename to its rendered target basename."""
-    name = src_name[:-5] if src_name.endswith(".tmpl") else src_name
-    changed = True
-    while changed:
-        changed = False
-        for p in CHEZMOI_PREFIXES:
-            if name.startswith(p):
-                name, changed = name[len(p):], True
-        if name.startswith("dot_"):
-            name, changed = "." + name[4:], True
-    return name
-
-
-def managed_exists(root: Path, rel: str) -> bool:
-    """True if `rel` exists literally, or as a chezmoi source of that target."""
-    p = root / rel
-    if p.exists():
+def managed_exists(root: Path, rel: str, index: SourceIndex) -> bool:
+    """True if `rel` exists literally, or as a chezmoi source of that target.
+
+    A doc that references a managed file by its *rendered* name (e.g.
+    hooks/foo.sh) must still resolve against its source form
+    (hooks/executable_foo.sh, dot_foo -> .foo, ...).
+    """
+    if (root / rel).exists():
         return True
-    parent, base = p.parent, p.name
-    if not parent.is_dir():
-        return False
-    return any(_rendered_name(entry.name) == base for entry in parent.iterdir())
+    parent, _, base = rel.rpartition("/")
+    return index.child(parent, base) is not None
 
 
 def strip_fenced_blocks(text: str) -> list[tuple[int, str]]:
@@ -131,14 +112,14 @@ def clean_link_target(target: str) -> str | None:
     return target or None
 
 
-def link_resolves(target: str, doc_path: Path, root: Path) -> bool:
+def link_resolves(target: str, doc_path: Path, root: Path, index: SourceIndex) -> bool:
     base = root if target.startswith("/") else doc_path.parent
     candidate = base / target.lstrip("/") if target.startswith("/") else base / target
     try:
         rel = candidate.resolve().relative_to(root)
     except (OSError, RuntimeError, ValueError):
         return candidate.exists()
-    return managed_exists(root, str(rel))
+    return managed_exists(root, rel.as_posix(), index)
 
 
 def token_is_candidate(tok: str) -> bool:
@@ -151,16 +132,40 @@ def token_is_candidate(tok: str) -> bool:
     return "/" in tok                                       # a path (incl. ./name)
 
 
-def token_resolves(tok: str, root: Path, top_level: set[str]) -> bool:
+def token_resolves(tok: str, root: Path, index: SourceIndex) -> bool:
     had_dot = tok.startswith("./")
     t = tok[2:] if had_dot else tok
     if "/" not in t:
         # single segment: only an explicit `./name` invocation names a repo-root
         # file; a bare filename without `./` is out of v1 scope (prose examples).
-        return managed_exists(root, t) if had_dot else True
-    if t.split("/", 1)[0] not in top_level:   # not anchored to a real repo entry
+        return managed_exists(root, t, index) if had_dot else True
+    if t.split("/", 1)[0] not in index.top_level:   # not anchored to a real repo entry
         return True
-    return managed_exists(root, t.rstrip("/"))
+    return managed_exists(root, t.rstrip("/"), index)
+
+
+def scan_doc(
+    rel: str, lines: list[tuple[int, str]], root: Path, index: SourceIndex,
+) -> list[tuple[str, int, str, str]]:
+    """(doc, lineno, kind, reference) for each dangling reference in one doc."""
+    doc = root / rel
+    findings = []
+    for lineno, line in lines:
+        for m in MD_LINK.finditer(line):
+            target = clean_link_target(m.group(1))
+            if not target or target.lower().startswith(SKIP_PREFIXES):
+                continue
+            if "/" not in target and "." not in target:   # not a filesystem path
+                continue
+            if PLACEHOLDER.search(target):
+                continue
+            if not link_resolves(target, doc, root, index):
+                findings.append((rel, lineno, "link", target))
+        for m in INLINE_CODE.finditer(line):
+            tok = m.group(1)
+            if token_is_candidate(tok) and not token_resolves(tok, root, index):
+                findings.append((rel, lineno, "ref", tok))
+    return findings
 
 
 def main() -> int:
@@ -173,8 +178,8 @@ def main() -> int:
 
     root = repo_root()
     allow = load_allowlist(root)
-    tracked = [ln for ln in _git(root, "ls-files").splitlines() if ln]
-    top_level = {p.split("/", 1)[0] for p in tracked}
+    index = SourceIndex.from_git(root)
+    tracked = index.tracked
 
     if args.files:
         md_files = [os.path.relpath(os.path.abspath(f), root)
@@ -191,23 +196,8 @@ def main() -> int:
         if not doc.exists():
             continue
         checked += 1
-        for lineno, line in strip_fenced_blocks(
-            doc.read_text(encoding="utf-8", errors="replace")
-        ):
-            for m in MD_LINK.finditer(line):
-                target = clean_link_target(m.group(1))
-                if not target or target.lower().startswith(SKIP_PREFIXES):
-                    continue
-                if "/" not in target and "." not in target:   # not a filesystem path
-                    continue
-                if PLACEHOLDER.search(target):
-                    continue
-                if not link_resolves(target, doc, root):
-                    findings.append((rel, lineno, "link", target))
-            for m in INLINE_CODE.finditer(line):
-                tok = m.group(1)
-                if token_is_candidate(tok) and not token_resolves(tok, root, top_level):
-                    findings.append((rel, lineno, "ref", tok))
+        text = doc.read_text(encoding="utf-8", errors="replace")
+        findings.extend(scan_doc(rel, strip_fenced_blocks(text), root, index))
 
     print("=== DOC REFERENCE CHECK ===")
     print(f"DOCS_CHECKED={checked}")
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""Run the repo's static consistency rules over one shared in-memory index.
+
+check-doc-references.py, audit-nvim-plugins.py and
+tests/test-claude-plugin-references.sh each walked and parsed the tree on
+their own (a ``git ls-files``, a markdown pass, a Lua pass and three
+``git grep`` runs per invocation). Here the tree is loaded once into a
+RepoIndex and every check is a rule over it:
+
+- the git index, as a chezmoi SourceIndex (scripts/chezmoi_source.py);
+- the text of every tracked non-binary file, read at most once;
+- markdown with fenced blocks stripped;
+- the lazy.nvim plugin specs (repos and trigger summary);
+- the ``.claude`` / ``.claude-plugin`` JSON documents, parsed.
+
+Each index is built on first use, so ``--only`` runs pay only for what their
+rules touch. Rules are plain functions registered with ``@rule``; adding a
+check means adding one function.
+
+Rules that need the installed plugin marketplace
+(``$CLAUDE_PLUGINS_MARKETPLACE_DIR``, default
+``~/.claude/plugins/marketplaces/laurigates-claude-plugins``) are SKIPPED
+loudly when it is absent rather than passing silently.
+
+Structured KEY=VALUE / STATUS= output. Warnings never fail the run. Exit code:
+- default (advisory): always 0 — the STATUS line is the signal.
+- ``--strict``: exit 1 when any rule reports an error.
+
+Usage:
+    uv run scripts/check-repo-consistency.py [--strict] [--only GLOB]... [--list]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from functools import cached_property
+from pathlib import Path
+from types import ModuleType
+
+from chezmoi_source import SourceIndex
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+NVIM_PLUGIN_DIR = "private_dot_config/nvim/lua/exact_plugins"
+LAZY_LOCK = "lazy-lock.json"
+DEFAULT_MARKETPLACE = Path.home() / ".claude/plugins/marketplaces/laurigates-claude-plugins"
+DEFAULT_ALIAS = "laurigates-claude-plugins"
+CLAUDE_JSON_ROOTS = ("exact_dot_claude/", ".claude-plugin/")
+BINARY_SNIFF_BYTES = 8000
+
+# Plugin-reference scans skip this suite's own fixtures (tests/) and the ADRs
+# (historical record of the deprecated /namespace:command form).
+PLUGIN_SCAN_EXCLUDE = ("tests/", "docs/adrs/")
+# `@alias` pins and `"alias":` JSON keys only; prose that merely ends in
+# -claude-plugins (the configure-claude-plugins skill) is not an alias.
+ALIAS_RE = re.compile(r'(@|")([a-z][a-z0-9_-]*-claude-plugins)("\s*:)?')
+PLUGIN_PIN_RE = re.compile(r"([a-z][a-z0-9-]*-plugin)@[a-z0-9_-]+")
+HEADLESS_CMD_RE = re.compile(r'claude[^"]*-p[^"]*"/([a-z0-9:_-]+)')
+# Built-in slash commands that resolve without a marketplace plugin.
+BUILTIN_COMMANDS = frozenset({
+    "init", "review", "security-review", "code-review", "simplify", "verify", "run", "loop",
+    "schedule", "fewer-permission-prompts", "claude-api", "help",
+})
+# lazy.nvim manages itself; its lock entry has no spec.
+LOCK_ONLY_PLUGINS = frozenset({"lazy.nvim"})
+
+
+def _load_script(filename: str) -> ModuleType:
+    """Import a hyphenated script from scripts/ as a module."""
+    path = SCRIPTS_DIR / filename
+    spec = importlib.util.spec_from_file_location(path.stem.replace("-", "_"), path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"cannot load {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@dataclass
+class Finding:
+    rule: str
+    path: str
+    line: int
+    message: str
+    severity: str = "error"         # error | warning
+
+
+class Skip(Exception):
+    """Raised by a rule whose prerequisites are missing."""
+
+
+class RepoIndex:
+    """Everything the rules read, each part loaded once on first use."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._text: dict[str, str | None] = {}
+
+    @cached_property
+    def sources(self) -> SourceIndex:
+        return SourceIndex.from_git(self.root)
+
+    @property
+    def tracked(self) -> list[str]:
+        return self.sources.tracked
+
+    def text(self, rel: str) -> str | None:
+        """Contents of a tracked file; None when missing or binary."""
+        if rel not in self._text:
+            try:
+                data = (self.root / rel).read_bytes()
+            except OSError:
+                data = None
+            if data is None or b"\0" in data[:BINARY_SNIFF_BYTES]:
+                self._text[rel] = None
+            else:
+                self._text[rel] = data.decode("utf-8", errors="replace")
+        return self._text[rel]
+
+    def grep(self, pattern: re.Pattern[str], exclude: tuple[str, ...] = ()) -> Iterator[tuple[str, int, re.Match[str]]]:
+        """(path, lineno, match) for every match in tracked text files."""
+        for rel in self.tracked:
+            if rel.startswith(exclude):
+                continue
+            text = self.text(rel)
+            if text is None or not pattern.search(text):
+                continue
+            for lineno, line in enumerate(text.splitlines(), start=1):
+                for m in pattern.finditer(line):
+                    yield rel, lineno, m
+
+    @cached_property
+    def doc_refs(self) -> ModuleType:
+        return _load_script("check-doc-references.py")
+
+    @cached_property
+    def markdown(self) -> dict[str, list[tuple[int, str]]]:
+        """Tracked markdown, fenced code blocks stripped."""
+        return {
+            rel: self.doc_refs.strip_fenced_blocks(text)
+            for rel in self.tracked
+            if rel.endswith(".md") and (text := self.text(rel)) is not None
+        }
+
+    @cached_property
+    def nvim_audit(self) -> ModuleType:
+        return _load_script("audit-nvim-plugins.py")
+
+    @cached_property
+    def lua_specs(self) -> list[str]:
+        prefix = f"{NVIM_PLUGIN_DIR}/"
+        return [
+            text for rel in sorted(self.tracked)
+            if rel.startswith(prefix) and rel.endswith(".lua") and "/" not in rel[len(prefix):]
+            and (text := self.text(rel)) is not None
+        ]
+
+    @cached_property
+    def spec_triggers(self) -> dict[str, str]:
+        """owner/repo -> lazy-load trigger summary (audit-nvim-plugins)."""
+        return self.nvim_audit.spec_triggers_from_texts(self.lua_specs)
+
+    @cached_property
+    def plugin_repos(self) -> set[str]:
+        """Every owner/repo named by a spec, as a top-level entry or a dependency."""
+        return set(self.nvim_audit.repos_from_texts(self.lua_specs)) | set(self.spec_triggers)
+
+    @cached_property
+    def claude_json(self) -> dict[str, object]:
+        """Parsed JSON under the Claude roots; a JSONDecodeError for bad files."""
+        docs: dict[str, object] = {}
+        for rel in self.tracked:
+            # modify_ scripts target *.json but are shell scripts, not JSON.
+            if not rel.startswith(CLAUDE_JSON_ROOTS) or not rel.endswith(".json"):
+                continue
+            if self.sources.by_source.get(rel) and self.sources.by_source[rel].kind == "modify":
+                continue
+            text = self.text(rel)
+            if text is None:
+                continue
+            try:
+                docs[rel] = json.loads(text)
+            except json.JSONDecodeError as exc:
+                docs[rel] = exc
+        return docs
+
+    @cached_property
+    def marketplace(self) -> Path | None:
+        path = Path(os.environ.get("CLAUDE_PLUGINS_MARKETPLACE_DIR") or DEFAULT_MARKETPLACE)
+        return path if path.is_dir() else None
+
+    @cached_property
+    def canonical_alias(self) -> str:
+        manifest = self.marketplace / ".claude-plugin/marketplace.json" if self.marketplace else None
+        if manifest and manifest.is_file():
+            try:
+                return json.loads(manifest.read_text(encoding="utf-8")).get("name") or DEFAULT_ALIAS
+            except json.JSONDecodeError:
+                pass
+        return DEFAULT_ALIAS
+
+
+# --- rules ------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    description: str
+    check: Callable[[RepoIndex], Iterable[Finding]]
+
+
+RULES: list[Rule] = []
+
+
+def rule(name: str, description: str) -> Callable[[Callable[[RepoIndex], Iterable[Finding]]], Callable]:
+    def register(fn: Callable[[RepoIndex], Iterable[Finding]]) -> Callable:
+        RULES.append(Rule(name, description, fn))
+        return fn
+    return register
+
+
+@rule("doc-references", "dangling repo-relative paths and links in markdown")
+def doc_references(repo: RepoIndex) -> Iterator[Finding]:
+    refs = repo.doc_refs
+    allow = refs.load_allowlist(repo.root)
+    for rel, lines in sorted(repo.markdown.items()):
+        if any(fnmatch(rel, pat) for pat in allow):
+            continue
+        for doc, lineno, kind, tok in refs.scan_doc(rel, lines, repo.root, repo.sources):
+            yield Finding("doc-references", doc, lineno, f"[{kind}] {tok}")
+
+
+@rule("plugin-alias", "marketplace alias references use the canonical alias")
+def plugin_alias(repo: RepoIndex) -> Iterator[Finding]:
+    for rel, lineno, m in repo.grep(ALIAS_RE, PLUGIN_SCAN_EXCLUDE):
+        if m.group(1) == '"' and not m.group(3):
+            continue
+        if m.group(2) != repo.canonical_alias:
+            yield Finding("plugin-alias", rel, lineno, f"alias {m.group(2)} (expected {repo.canonical_alias})")
+
+
+@rule("plugin-exists", "plugin@alias references name a plugin in the marketplace")
+def plugin_exists(repo: RepoIndex) -> Iterator[Finding]:
+    if repo.marketplace is None:
+        raise Skip("marketplace not installed")
+    for rel, lineno, m in repo.grep(PLUGIN_PIN_RE, PLUGIN_SCAN_EXCLUDE):
+        if not (repo.marketplace / m.group(1)).is_dir():
+            yield Finding("plugin-exists", rel, lineno, f"plugin {m.group(1)} is not in the marketplace")
+
+
+@rule("plugin-commands", "slash commands run headless via claude -p resolve to a real command")
+def plugin_commands(repo: RepoIndex) -> Iterator[Finding]:
+    market = repo.marketplace
+    if market is None:
+        raise Skip("marketplace not installed")
+    names = set(BUILTIN_COMMANDS)
+    names.update(d.name for d in market.glob("*/skills/*/") if d.is_dir())
+    names.update(f.stem for f in market.glob("*/commands/*.md"))
+    for rel, lineno, m in repo.grep(HEADLESS_CMD_RE, PLUGIN_SCAN_EXCLUDE):
+        cmd = m.group(1)
+        if ":" in cmd:
+            plugin, name = cmd.split(":", 1)
+            ok = (market / plugin / "skills" / name).is_dir() or (market / plugin / "commands" / f"{name}.md").is_file()
+        else:
+            ok = cmd in names
+        if not ok:
+            yield Finding("plugin-commands", rel, lineno, f"/{cmd} does not resolve")
+
+
+@rule("claude-json", "Claude settings, plugin and eval JSON parses")
+def claude_json(repo: RepoIndex) -> Iterator[Finding]:
+    for rel, doc in sorted(repo.claude_json.items()):
+        if isinstance(doc, json.JSONDecodeError):
+            yield Finding("claude-json", rel, doc.lineno, f"invalid JSON: {doc.msg}")
+
+
+@rule("nvim-lock", "lazy-lock.json entries match the plugin specs")
+def nvim_lock(repo: RepoIndex) -> Iterator[Finding]:
+    text = repo.text(LAZY_LOCK)
+    if text is None:
+        raise Skip(f"{LAZY_LOCK} not tracked")
+    locked = set(json.loads(text)) - LOCK_ONLY_PLUGINS
+    # optional = true specs are only installed when another spec enables them.
+    triggers = repo.spec_triggers
+    specced = {r.split("/", 1)[1] for r in repo.plugin_repos if triggers.get(r) != "optional"}
+    for name in sorted(locked - specced):
+        yield Finding("nvim-lock", LAZY_LOCK, 0, f"{name} is locked but no spec names it", "warning")
+    for name in sorted(specced - locked):
+        yield Finding("nvim-lock", NVIM_PLUGIN_DIR, 0, f"{name} has a spec but no lock entry", "warning")
+
+
+# --- driver -----------------------------------------------------------------
+
+
+def repo_root() -> Path:
+    return Path(subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True,
+    ).stdout.strip())
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--strict", action="store_true", help="exit 1 when any rule reports an error")
+    ap.add_argument("--only", action="append", metavar="GLOB", help="run only matching rules")
+    ap.add_argument("--list", action="store_true", help="list rules and exit")
+    args = ap.parse_args()
+
+    if args.list:
+        for r in RULES:
+            print(f"{r.name:<16} {r.description}")
+        return 0
+
+    repo = RepoIndex(repo_root())
+    selected = [r for r in RULES if not args.only or any(fnmatch(r.name, g) for g in args.only)]
+    findings: list[Finding] = []
+    skipped: list[tuple[str, str]] = []
+    timings: list[tuple[str, float]] = []
+    for r in selected:
+        start = time.perf_counter()
+        try:
+            findings.extend(r.check(repo))
+        except Skip as exc:
+            skipped.append((r.name, str(exc)))
+        timings.append((r.name, time.perf_counter() - start))
+
+    errors = [f for f in findings if f.severity == "error"]
+    print("=== REPO CONSISTENCY CHECK ===")
+    print(f"FILES_INDEXED={len(repo.tracked)}")
+    print(f"FILES_READ={len(repo._text)}")
+    print(f"RULES_RUN={len(selected) - len(skipped)}")
+    print(f"RULES_SKIPPED={len(skipped)}")
+    print(f"ERROR_COUNT={len(errors)}")
+    print(f"WARNING_COUNT={len(findings) - len(errors)}")
+    print(f"STATUS={'FAIL' if errors else 'OK'}")
+    for name, elapsed in timings:
+        print(f"RULE {name} {elapsed * 1000:.0f}ms")
+    for name, reason in skipped:
+        print(f"SKIPPED {name}: {reason}")
+    for f in findings:
+        where = f"{f.path}:{f.line}" if f.line else f.path
+        print(f"{f.severity.upper()} {f.rule} {where} {f.message}")
+    print("=== END REPO CONSISTENCY CHECK ===")
+    return 1 if (errors and args.strict) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
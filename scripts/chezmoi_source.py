@@ -0,0 +1,258 @@
+# /// script
+# requires-python = ">=3.9"
+# dependencies = []
+# ///
+"""Bidirectional chezmoi source <-> target name index for repo tools.
+
+chezmoi encodes target attributes in source names (``private_dot_config``,
+``executable_foo.sh.tmpl``, ``run_onchange_after_10-x.sh``). Checkers,
+auditors and benchmarks all need to go between the two forms; this builds
+both directions for the whole tree from one ``git ls-files`` pass, so every
+lookup afterwards is a dict hit.
+
+Names are parsed the way chezmoi parses them: a fixed attribute order per
+entry type (https://www.chezmoi.io/reference/source-state-attributes/), not a
+strip-any-known-prefix loop, so ``dot_run_foo`` stays ``.run_foo`` and
+``literal_`` / ``.literal`` stop parsing. Scripts (``run_``) have no target
+path; they are kept with their frequency and phase and sorted in the order
+``chezmoi apply`` runs them. Names starting with ``.`` (``.github``,
+``.chezmoidata``) are not source state and are skipped, except scripts under
+``.chezmoiscripts``. ``.chezmoiignore`` is a template and is not evaluated:
+the index describes names, not what a given machine applies.
+
+Usage:
+    chezmoi_source.py [PATH]...      # map each source or target path
+    chezmoi_source.py --scripts      # run scripts in apply order
+
+    from chezmoi_source import SourceIndex
+    index = SourceIndex.from_git(root)
+    index.source_for(".claude/settings.json")  # "exact_dot_claude/modify_settings.json"
+"""
+
+from __future__ import annotations
+
+import argparse
+import posixpath
+import subprocess
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+SCRIPTS_DIR = ".chezmoiscripts"
+
+# Optional attributes after each entry type's leading prefix, in the only
+# order chezmoi accepts them. Groups like once_|onchange_ are listed
+# back-to-back; at most one of them can match.
+DIR_ATTRS = ("remove_", "external_", "exact_", "private_", "readonly_")
+FILE_ATTRS = ("encrypted_", "private_", "readonly_", "empty_", "executable_")
+TYPE_ATTRS = {
+    "create_": ("encrypted_", "private_", "readonly_", "empty_", "executable_"),
+    "modify_": ("encrypted_", "private_", "readonly_", "executable_"),
+    "remove_": (),
+    "run_": ("once_", "onchange_", "before_", "after_"),
+    "symlink_": (),
+}
+KIND = {"create_": "create", "modify_": "modify", "remove_": "remove", "run_": "script", "symlink_": "symlink"}
+ENCRYPTED_SUFFIXES = (".age", ".asc")
+PHASE_ORDER = {"before": 0, "during": 1, "after": 2}
+
+
+@dataclass(frozen=True)
+class SourceName:
+    """One parsed source path component."""
+
+    name: str                   # target basename
+    kind: str                   # dir, file, create, modify, remove, script, symlink
+    attrs: tuple[str, ...] = ()
+    template: bool = False
+
+
+@dataclass(frozen=True)
+class Entry:
+    source: str                 # repo-relative source path
+    target: str                 # path relative to the destination dir
+    kind: str
+    attrs: tuple[str, ...] = ()
+    template: bool = False
+
+    @property
+    def phase(self) -> str:
+        """before / during / after, for scripts."""
+        return next((a for a in self.attrs if a in ("before", "after")), "during")
+
+
+def _take(name: str, prefixes: Iterable[str], attrs: list[str]) -> tuple[str, bool]:
+    """Strip optional prefixes in order; returns (rest, hit literal_)."""
+    for prefix in prefixes:
+        if name.startswith("literal_"):
+            return name[len("literal_"):], True
+        if name.startswith(prefix):
+            attrs.append(prefix[:-1])
+            name = name[len(prefix):]
+    if name.startswith("literal_"):
+        return name[len("literal_"):], True
+    return name, False
+
+
+@lru_cache(maxsize=None)
+def parse_name(component: str, is_dir: bool = False) -> SourceName:
+    """Parse one source path component into its target name and attributes."""
+    attrs: list[str] = []
+    if is_dir:
+        kind = "dir"
+        name, literal = _take(component, DIR_ATTRS, attrs)
+    else:
+        kind, name, literal = "file", component, False
+        if name.startswith("literal_"):
+            name, literal = name[len("literal_"):], True
+        for prefix, follow in TYPE_ATTRS.items():
+            if not literal and name.startswith(prefix):
+                kind = KIND[prefix]
+                name, literal = _take(name[len(prefix):], follow, attrs)
+                break
+        else:
+            if not literal:
+                name, literal = _take(name, FILE_ATTRS, attrs)
+    if not literal and name.startswith("dot_"):
+        name = "." + name[len("dot_"):]
+
+    template = False
+    if is_dir:
+        pass
+    elif name.endswith(".literal"):
+        name = name[: -len(".literal")]
+    else:
+        if "encrypted" in attrs and name.endswith(ENCRYPTED_SUFFIXES):
+            name = name[:-4]
+        if name.endswith(".tmpl"):
+            name, template = name[: -len(".tmpl")], True
+    return SourceName(name, kind, tuple(attrs), template)
+
+
+def target_name(component: str) -> str:
+    """The rendered target basename of a source file name."""
+    return parse_name(component).name
+
+
+class SourceIndex:
+    """Source and target views of every tracked chezmoi source path."""
+
+    def __init__(self, tracked: Iterable[str], root: str = "") -> None:
+        self.tracked: list[str] = list(tracked)
+        self.root = root.strip("/")             # .chezmoiroot, if any
+        self.by_source: dict[str, Entry] = {}
+        self.by_target: dict[str, Entry] = {}
+        # (source parent dir, target basename) -> source path for every tracked
+        # path: resolves the mixed form docs use ("exact_dot_claude/hooks/foo.sh").
+        self.children: dict[tuple[str, str], str] = {}
+        self.scripts: list[Entry] = []
+        self.top_level = {p.split("/", 1)[0] for p in self.tracked}
+
+        for path in self.tracked:
+            parent = ""
+            parts = path.split("/")
+            for i, part in enumerate(parts):
+                here = posixpath.join(parent, part) if parent else part
+                self.children.setdefault((parent, parse_name(part, i < len(parts) - 1).name), here)
+                parent = here
+
+        prefix = f"{self.root}/" if self.root else ""
+        dirs: dict[str, str] = {self.root: ""}   # source dir -> target dir
+        for path in self.tracked:
+            if not path.startswith(prefix):
+                continue
+            parts = path[len(prefix):].split("/")
+            if parts[0].startswith(".") and not (parts[0] == SCRIPTS_DIR and len(parts) == 2):
+                continue
+            if any(p.startswith(".") for p in parts[1:]):
+                continue
+            self._add(path, parts, dirs)
+        self.scripts.sort(key=lambda e: (PHASE_ORDER[e.phase], e.target))
+
+    def _add(self, path: str, parts: list[str], dirs: dict[str, str]) -> None:
+        src_dir = self.root
+        for part in parts[:-1]:
+            child = posixpath.join(src_dir, part) if src_dir else part
+            if child not in dirs:
+                parsed = parse_name(part, is_dir=True)
+                tgt = posixpath.join(dirs[src_dir], parsed.name) if dirs[src_dir] else parsed.name
+                dirs[child] = tgt
+                if part != SCRIPTS_DIR:
+                    entry = Entry(child, tgt, "dir", parsed.attrs)
+                    self.by_source[child] = entry
+                    self.by_target.setdefault(tgt, entry)
+            src_dir = child
+
+        parsed = parse_name(parts[-1])
+        parent_target = "" if parts[0] == SCRIPTS_DIR else dirs[src_dir]
+        tgt = posixpath.join(parent_target, parsed.name) if parent_target else parsed.name
+        entry = Entry(path, tgt, parsed.kind, parsed.attrs, parsed.template)
+        self.by_source[path] = entry
+        if parsed.kind == "script":
+            self.scripts.append(entry)
+        else:
+            self.by_target[tgt] = entry
+
+    @classmethod
+    def from_git(cls, repo: Path) -> "SourceIndex":
+        out = subprocess.run(
+            ["git", "ls-files", "-z"], cwd=repo, capture_output=True, text=True, check=True,
+        ).stdout
+        tracked = [p for p in out.split("\0") if p]
+        root_file = repo / ".chezmoiroot"
+        root = root_file.read_text(encoding="utf-8").strip() if ".chezmoiroot" in tracked else ""
+        return cls(tracked, root)
+
+    def target_for(self, source: str) -> str | None:
+        entry = self.by_source.get(source.strip("/"))
+        return entry.target if entry else None
+
+    def source_for(self, target: str) -> str | None:
+        """Source path for a target path (``~/`` and ``./`` prefixes allowed)."""
+        for lead in ("~/", "./"):
+            if target.startswith(lead):
+                target = target[len(lead):]
+        entry = self.by_target.get(target.strip("/"))
+        return entry.source if entry else None
+
+    def child(self, source_dir: str, name: str) -> str | None:
+        """Source path in source_dir whose target basename is name."""
+        return self.children.get((source_dir.strip("/"), name))
+
+
+def repo_root() -> Path:
+    return Path(subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True,
+    ).stdout.strip())
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("paths", nargs="*", help="source or target paths to map")
+    ap.add_argument("--scripts", action="store_true", help="list run scripts in apply order")
+    args = ap.parse_args()
+
+    index = SourceIndex.from_git(repo_root())
+    if args.scripts:
+        for entry in index.scripts:
+            attrs = ",".join(a for a in entry.attrs if a not in ("before", "after")) or "always"
+            print(f"{entry.phase:<6} {attrs:<9} {entry.source}")
+    missing = 0
+    home = f"{Path.home()}/"
+    for path in args.paths:
+        if path.startswith(home):
+            path = path[len(home):]
+        if path in index.by_source:
+            print(f"{path} -> {index.target_for(path)}")
+        elif index.source_for(path):
+            print(f"{path} <- {index.source_for(path)}")
+        else:
+            print(f"{path}: not in the source state", file=sys.stderr)
+            missing += 1
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
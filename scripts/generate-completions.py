@@ -0,0 +1,229 @@
+# /// script
+# requires-python = ">=3.9"
+# dependencies = []
+# ///
+"""Generate zsh completions into ~/.zfunc, regenerating only stale entries.
+
+Driven by ``packages.completion_tools.zsh_completions`` in
+``.chezmoidata/completions.toml`` (tool name -> generator command). The
+completions run script pipes that table in as JSON (``--data -``); the package
+update script and standalone runs read the TOML directly (Python 3.11+).
+
+Each entry is cached in ``--cache`` keyed by a fingerprint of the tool binary
+that will actually run (its resolved path, size and mtime; a mise shim is
+resolved through ``mise which``) plus the generator command. Tool upgrades land
+at a new path (mise installs dirs, brew Cellar) or a new mtime, so only those
+entries are stale. Stale entries are regenerated in parallel, written
+atomically, and a failed or empty generation keeps the previous file.
+
+Every file written is lazily autoloadable: it starts with ``#compdef <tool>``,
+so compinit only registers it and the body loads on the first completion of
+that command. Generators that emit a self-registering script instead
+(``compdef _fn tool`` at top level, e.g. npm and pip) are wrapped in a shim
+that runs the script on first use and then dispatches to the function it
+registered. When anything changes the compinit dump is removed so the next
+shell rebuilds it.
+
+Usage:
+    generate-completions.py [--data FILE|-] [--source DIR] [--dir ~/.zfunc]
+        [--cache FILE] [--jobs N] [--force] [--only TOOL]...
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DIR = Path.home() / ".zfunc"
+DEFAULT_CACHE = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "zfunc-completions.json"
+CACHE_VERSION = 1
+GENERATE_TIMEOUT_SECONDS = 60
+COMPDEF_HEADER = "#compdef"
+MISE_SHIMS_MARKER = "/mise/shims/"
+
+SHIM_TEMPLATE = """\
+#compdef {tool}
+# Lazy shim written by scripts/generate-completions.py: `{command}` emits a
+# script that registers itself with compdef, so run it on first completion of
+# {tool} and hand this request to whatever it registered.
+{body}
+if [[ ${{_comps[{tool}]}} != _{tool} ]] && (( $+functions[${{_comps[{tool}]}}] )); then
+  "${{_comps[{tool}]}}" "$@"
+fi
+"""
+
+_print_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    with _print_lock:
+        print(message, flush=True)
+
+
+def load_source_data(source: Path) -> dict[str, str]:
+    import tomllib  # noqa: PLC0415 - only needed without --data
+
+    data = tomllib.loads((source / ".chezmoidata" / "completions.toml").read_text(encoding="utf-8"))
+    return data["packages"]["completion_tools"]["zsh_completions"]
+
+
+def resolve_binary(tool: str) -> str | None:
+    """Path of the binary that runs for tool, seeing through mise shims."""
+    path = shutil.which(tool)
+    if path is None:
+        return None
+    if MISE_SHIMS_MARKER in path and shutil.which("mise"):
+        proc = subprocess.run(["mise", "which", tool], capture_output=True, text=True)
+        if proc.returncode == 0 and proc.stdout.strip():
+            path = proc.stdout.strip()
+    return os.path.realpath(path)
+
+
+def fingerprint(binary: str, command: str) -> str:
+    st = os.stat(binary)
+    key = f"{CACHE_VERSION}\0{binary}\0{st.st_size}\0{st.st_mtime_ns}\0{command}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def lazy_body(tool: str, command: str, output: str) -> str:
+    """The generated script as an autoloadable ``_tool`` function file."""
+    if output.lstrip().startswith(COMPDEF_HEADER):
+        return output if output.endswith("\n") else output + "\n"
+    return SHIM_TEMPLATE.format(tool=tool, command=command, body=output.rstrip("\n"))
+
+
+def write_atomic(path: Path, text: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def generate(tool: str, command: str, target: Path) -> str | None:
+    """Run one generator; returns an error string, or None on success."""
+    try:
+        proc = subprocess.run(
+            ["bash", "-c", command],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+            timeout=GENERATE_TIMEOUT_SECONDS,
+        )
+    except subprocess.TimeoutExpired:
+        return f"timed out after {GENERATE_TIMEOUT_SECONDS}s"
+    if proc.returncode != 0 or not proc.stdout.strip():
+        return (proc.stderr.strip().splitlines() or [f"exit {proc.returncode}, no output"])[-1]
+    write_atomic(target, lazy_body(tool, command, proc.stdout))
+    return None
+
+
+def load_cache(path: Path) -> dict:
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {"version": CACHE_VERSION, "entries": {}}
+    if cache.get("version") != CACHE_VERSION:
+        return {"version": CACHE_VERSION, "entries": {}}
+    return cache
+
+
+def drop_compdump() -> None:
+    """compinit only notices added/removed files; force a rebuild after changes."""
+    zdotdir = Path(os.environ.get("ZDOTDIR") or Path.home())
+    for dump in zdotdir.glob(".zcompdump*"):
+        dump.unlink(missing_ok=True)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--data", help="JSON object tool -> command ('-' for stdin)")
+    ap.add_argument("--source", type=Path, default=REPO_ROOT, help="chezmoi source dir (without --data)")
+    ap.add_argument("--dir", type=Path, default=DEFAULT_DIR, help="completion dir on fpath")
+    ap.add_argument("--cache", type=Path, default=DEFAULT_CACHE, help="fingerprint cache file")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 4, help="parallel generators")
+    ap.add_argument("--force", action="store_true", help="ignore the cache and regenerate everything")
+    ap.add_argument("--only", action="append", metavar="TOOL", help="limit to TOOL (repeatable)")
+    args = ap.parse_args()
+
+    if args.data:
+        raw = sys.stdin.read() if args.data == "-" else Path(args.data).read_text(encoding="utf-8")
+        commands = json.loads(raw)
+    else:
+        commands = load_source_data(args.source)
+    if args.only:
+        commands = {tool: cmd for tool, cmd in commands.items() if tool in args.only}
+
+    args.dir.mkdir(parents=True, exist_ok=True)
+    cache = load_cache(args.cache)
+    entries: dict = cache["entries"]
+    print(f"🔧 Generating ZSH completions in {args.dir}...")
+
+    stale: list[tuple[str, str, str]] = []
+    cached = skipped = 0
+    for tool, command in sorted(commands.items()):
+        binary = resolve_binary(tool)
+        if binary is None:
+            skipped += 1
+            continue
+        digest = fingerprint(binary, command)
+        target = args.dir / f"_{tool}"
+        if not args.force and entries.get(tool, {}).get("fingerprint") == digest and target.exists():
+            cached += 1
+            continue
+        stale.append((tool, command, digest))
+
+    # Tools dropped from completions.toml: remove only files this script wrote.
+    removed = 0
+    if not args.only:
+        for tool in sorted(set(entries) - set(commands)):
+            (args.dir / f"_{tool}").unlink(missing_ok=True)
+            del entries[tool]
+            removed += 1
+
+    failed: list[str] = []
+
+    def run(item: tuple[str, str, str]) -> None:
+        tool, command, digest = item
+        log(f"📝 Generating completion for {tool}...")
+        error = generate(tool, command, args.dir / f"_{tool}")
+        if error:
+            log(f"⚠️  Failed to generate {tool} completion: {error}")
+            failed.append(tool)
+        else:
+            entries[tool] = {"fingerprint": digest, "command": command}
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+            list(pool.map(run, stale))
+
+    generated = len(stale) - len(failed)
+    if generated or removed:
+        drop_compdump()
+    args.cache.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(args.cache, json.dumps(cache, indent=2, sort_keys=True) + "\n")
+
+    print("✅ ZSH completions generation completed!")
+    print(
+        f"📊 Generated: {generated}, Cached: {cached}, Skipped: {skipped}, "
+        f"Failed: {len(failed)}, Removed: {removed}"
+    )
+    print(f"📁 Completions saved in: {args.dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,483 @@
+# /// script
+# requires-python = ">=3.9"
+# dependencies = []
+# ///
+"""Install the profile package registry concurrently across package managers.
+
+Driven by the ``packages`` data from ``.chezmoidata/packages.toml`` and
+``.chezmoidata/uv_tools.toml``. run_onchange_03-install-packages.sh.tmpl pipes
+chezmoi's merged data in as JSON (``--data -``), so profile overrides in the
+chezmoi config apply. Standalone runs read the TOML files directly
+(Python 3.11+).
+
+1. Resolve: ``core`` plus every enabled ``--profiles`` entry. Each profile's
+   ``brew``, ``brew_<os>`` and ``mise`` lists apply everywhere; ``cask``,
+   ``mas`` and ``vscode`` are macOS-only. uv tools come from
+   ``packages.uv_tools``.
+2. Query installed state with one bulk call per manager, all concurrently
+   (``brew tap``, ``brew list --formula/--cask``, ``mas list``,
+   ``code --list-extensions``, ``uv tool list``, ``mise ls --installed``).
+3. Install only what is missing as a small job graph: taps before formulae and
+   casks; uv / mise / mas jobs wait for the brew formulae job only when their
+   own CLI is not on PATH yet; VS Code extensions likewise wait for the casks.
+   Each manager is a lane with its own parallelism limit (brew holds a global
+   lock, so its lane is 1 and its formulae/casks go in one batched call; if
+   that call fails, whatever did not land is retried one package at a time,
+   so one unavailable formula does not sink the rest).
+
+Bootstrap time is bounded by the slowest lane, not the sum of every install.
+Runs on macOS's stock /usr/bin/python3 (3.9): a fresh machine has nothing else.
+
+Usage:
+    install-packages.py --os darwin|linux [--profiles dev,infra,…]
+        [--data FILE|-] [--source DIR] [--brew PATH] [--jobs uv=8,vscode=2]
+        [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LINUXBREW = "/home/linuxbrew/.linuxbrew/bin/brew"
+
+# Max concurrent jobs per lane. brew serializes on its own lock.
+LANE_LIMITS = {"brew": 1, "mas": 1, "mise": 4, "uv": 4, "vscode": 4}
+FAILURE_TAIL_CHARS = 600
+
+_print_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    with _print_lock:
+        print(message, flush=True)
+
+
+def _run(argv: list[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(argv, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+
+
+def _tail(proc: subprocess.CompletedProcess) -> str:
+    return (proc.stderr or proc.stdout or "").strip()[-FAILURE_TAIL_CHARS:]
+
+
+# --- registry resolution ------------------------------------------------------
+
+
+@dataclass
+class Plan:
+    taps: list[str] = field(default_factory=list)
+    formulae: list[str] = field(default_factory=list)
+    casks: list[str] = field(default_factory=list)
+    services: list[str] = field(default_factory=list)  # formulae restarted after install
+    mise: list[dict] = field(default_factory=list)  # {"name", "pkg"}
+    uv: list[dict] = field(default_factory=list)  # {"package", "spec", "with"}
+    mas: list[dict] = field(default_factory=list)  # {"id", "name"}
+    vscode: list[str] = field(default_factory=list)
+
+
+def _add(target: list, value) -> None:
+    if value not in target:
+        target.append(value)
+
+
+def resolve(packages: dict, os_name: str, profiles: list[str]) -> Plan:
+    """Flatten the profile registry into per-manager lists for this machine."""
+    plan = Plan()
+    taps = packages.get("taps", {})
+    for tap in list(taps.get("common", [])) + list(taps.get(os_name, [])):
+        _add(plan.taps, tap)
+
+    registry = packages.get("profiles", {})
+    for profile in ["core"] + [p for p in profiles if p != "core"]:
+        entries = registry.get(profile, {})
+        for key in ("brew", f"brew_{os_name}"):
+            for entry in entries.get(key, []):
+                _add(plan.formulae, entry["pkg"])
+                if entry.get("restart") == "changed":
+                    _add(plan.services, entry["pkg"])
+        for entry in entries.get("mise", []):
+            _add(plan.mise, {"name": entry.get("name", entry["pkg"]), "pkg": entry["pkg"]})
+        if os_name != "darwin":
+            continue
+        for entry in entries.get("cask", []):
+            _add(plan.casks, entry["pkg"])
+        for entry in entries.get("mas", []):
+            _add(plan.mas, {"id": str(entry["id"]), "name": entry.get("name", str(entry["id"]))})
+        for entry in entries.get("vscode", []):
+            _add(plan.vscode, entry["pkg"])
+
+    uv_tools = packages.get("uv_tools", {})
+    for tool in uv_tools.get("tools", []):
+        _add(plan.uv, {"package": tool, "spec": tool, "with": []})
+    for tool in uv_tools.get("git_tools", []):
+        _add(plan.uv, {"package": tool["package"], "spec": tool["url"], "with": list(tool.get("with", []))})
+    return plan
+
+
+def load_source_data(source: Path) -> dict:
+    """Read the registry straight from .chezmoidata (standalone runs, 3.11+)."""
+    import tomllib  # noqa: PLC0415 - only needed without --data
+
+    packages: dict = {}
+    for name in ("packages.toml", "uv_tools.toml"):
+        path = source / ".chezmoidata" / name
+        if path.exists():
+            packages.update(tomllib.loads(path.read_text(encoding="utf-8")).get("packages", {}))
+    return packages
+
+
+def default_profiles(source: Path) -> list[str]:
+    path = source / ".chezmoidata" / "profiles.toml"
+    if not path.exists():
+        return []
+    import tomllib  # noqa: PLC0415
+
+    flags = tomllib.loads(path.read_text(encoding="utf-8")).get("profiles", {})
+    return [name for name, enabled in flags.items() if enabled]
+
+
+# --- installed state ------------------------------------------------------------
+
+
+def _formula_name(pkg: str) -> str:
+    return pkg.rsplit("/", 1)[-1]
+
+
+def query_installed(brew: str | None, plan: Plan) -> dict[str, set[str]]:
+    """One bulk query per manager, run concurrently. Unavailable managers report empty."""
+    queries = {}
+    if brew:
+        queries["tap"] = [brew, "tap"]
+        queries["formula"] = [brew, "list", "--formula", "-1"]
+        if plan.casks:
+            queries["cask"] = [brew, "list", "--cask", "-1"]
+    if plan.mas and shutil.which("mas"):
+        queries["mas"] = ["mas", "list"]
+    if plan.vscode and shutil.which("code"):
+        queries["vscode"] = ["code", "--list-extensions"]
+    if plan.uv and shutil.which("uv"):
+        queries["uv"] = ["uv", "tool", "list"]
+    if plan.mise and shutil.which("mise"):
+        queries["mise"] = ["mise", "ls", "--installed", "--json"]
+
+    def run_query(kind: str) -> tuple[str, set[str]]:
+        proc = _run(queries[kind])
+        if proc.returncode != 0:
+            return kind, set()
+        out = proc.stdout
+        if kind == "mise":
+            try:
+                return kind, set(json.loads(out or "{}"))
+            except json.JSONDecodeError:
+                return kind, set()
+        lines = [line.strip() for line in out.splitlines() if line.strip()]
+        if kind in ("mas", "uv"):
+            # `mas list`: "<id>  Name (version)"; `uv tool list`: "name vX" + "- entrypoint" lines.
+            return kind, {line.split()[0] for line in lines if not line.startswith("-")}
+        return kind, {line.lower() for line in lines}
+
+    installed = {kind: set() for kind in ("tap", "formula", "cask", "mas", "vscode", "uv", "mise")}
+    if queries:
+        with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+            for kind, names in pool.map(run_query, queries):
+                installed[kind] = names
+    return installed
+
+
+# --- job graph --------------------------------------------------------------------
+
+
+@dataclass
+class Job:
+    key: str
+    lane: str
+    label: str
+    action: object  # () -> list of failed item labels
+    needs: list[str] = field(default_factory=list)
+    cli: str | None = None  # must be on PATH once needs finish, else the job is skipped
+    done: threading.Event = field(default_factory=threading.Event)
+    failed: list[str] = field(default_factory=list)
+    skipped: bool = False
+
+
+def _batch(argv_prefix: list[str], items: list[str], verify) -> object:
+    """A job action installing items in one call, then verifying what landed.
+
+    A failed batch (brew aborts the whole call on one unknown formula) falls
+    back to installing each missing item on its own.
+    """
+
+    def action() -> list[str]:
+        proc = _run(argv_prefix + items)
+        missing = verify(items)
+        if proc.returncode != 0 and missing:
+            log(f"    {' '.join(argv_prefix)} failed, retrying {len(missing)} individually:\n{_tail(proc)}")
+            for item in missing:
+                single = _run(argv_prefix + [item])
+                if single.returncode != 0:
+                    log(f"    Failed: {item}\n{_tail(single)}")
+            missing = verify(missing)
+        return missing
+
+    return action
+
+
+def _single(argv: list[str], label: str) -> object:
+    def action() -> list[str]:
+        proc = _run(argv)
+        if proc.returncode != 0:
+            log(f"    Failed: {label}\n{_tail(proc)}")
+            return [label]
+        return []
+
+    return action
+
+
+def build_jobs(plan: Plan, installed: dict[str, set[str]], brew: str | None) -> tuple[list[Job], list[str]]:
+    """Jobs for everything missing, plus the list of items already installed."""
+    jobs: list[Job] = []
+    present: list[str] = []
+
+    def missing(items: list[str], kind: str, name=lambda item: item.lower()) -> list[str]:
+        todo = [item for item in items if name(item) not in installed[kind]]
+        present.extend(f"{kind}:{item}" for item in items if item not in todo)
+        return todo
+
+    taps = missing(plan.taps, "tap")
+    formulae = missing(plan.formulae, "formula", lambda pkg: _formula_name(pkg).lower())
+    casks = missing(plan.casks, "cask")
+
+    if brew is None and (taps or formulae or casks):
+        log("Homebrew is not installed; skipping taps, formulae and casks.")
+        taps, formulae, casks = [], [], []
+
+    def brew_verify(kind: str, name=lambda item: item.lower()):
+        def verify(items: list[str]) -> list[str]:
+            flag = "--cask" if kind == "cask" else "--formula"
+            proc = _run([brew, "list", flag, "-1"])
+            now = {line.strip().lower() for line in proc.stdout.splitlines()}
+            # `brew list -1` prints canonical names; an entry registered under
+            # an alias or old name only resolves when asked for by name.
+            return [
+                item
+                for item in items
+                if name(item) not in now and _run([brew, "list", flag, item]).returncode != 0
+            ]
+
+        return verify
+
+    if taps:
+
+        def tap_action() -> list[str]:
+            failed = []
+            for tap in taps:
+                if _run([brew, "tap", tap]).returncode != 0:
+                    failed.append(f"tap:{tap}")
+            return failed
+
+        jobs.append(Job("brew:taps", "brew", f"{len(taps)} taps", tap_action))
+    tap_needs = ["brew:taps"] if taps else []
+    if formulae:
+        jobs.append(
+            Job(
+                "brew:formulae",
+                "brew",
+                f"{len(formulae)} formulae: {' '.join(formulae)}",
+                _batch([brew, "install"], formulae, brew_verify("formula", lambda p: _formula_name(p).lower())),
+                tap_needs,
+            )
+        )
+    if casks:
+        jobs.append(
+            Job(
+                "brew:casks",
+                "brew",
+                f"{len(casks)} casks: {' '.join(casks)}",
+                _batch([brew, "install", "--cask"], casks, brew_verify("cask")),
+                tap_needs,
+            )
+        )
+    if plan.services and brew:
+
+        def restart_action() -> list[str]:
+            failed = []
+            for service in plan.services:
+                if _run([brew, "services", "restart", service]).returncode != 0:
+                    log(f"    Service setup for {service} may require sudo")
+                    failed.append(f"service:{service}")
+            return failed
+
+        needs = ["brew:formulae"] if formulae else []
+        jobs.append(Job("brew:services", "brew", f"restart {' '.join(plan.services)}", restart_action, needs))
+
+    def needs_cli(cli: str, job_key: str) -> list[str] | None:
+        """Dependency on the brew job providing cli; None when it can't become available."""
+        if shutil.which(cli):
+            return []
+        if any(job.key == job_key for job in jobs):
+            return [job_key]
+        return None
+
+    uv_todo = [tool for tool in plan.uv if tool["package"] not in installed["uv"]]
+    present.extend(f"uv:{tool['package']}" for tool in plan.uv if tool not in uv_todo)
+    uv_needs = needs_cli("uv", "brew:formulae")
+    if uv_todo and uv_needs is None:
+        log("uv not found, skipping Python tools")
+    elif uv_todo:
+        for tool in uv_todo:
+            argv = ["uv", "tool", "install", tool["spec"], "--force"]
+            if tool["with"]:
+                argv += ["--with", ",".join(tool["with"])]
+            label = f"uv:{tool['package']}"
+            jobs.append(Job(label, "uv", tool["package"], _single(argv, label), uv_needs, "uv"))
+
+    # mise ls keys are whatever the config uses: the backend spec or the short name.
+    mise_todo = [tool["pkg"] for tool in plan.mise if not {tool["pkg"], tool["name"]} & installed["mise"]]
+    present.extend(f"mise:{tool['pkg']}" for tool in plan.mise if tool["pkg"] not in mise_todo)
+    mise_needs = needs_cli("mise", "brew:formulae")
+    if mise_todo and mise_needs is None:
+        log("mise not found, skipping mise tools")
+    elif mise_todo:
+        # Versions come from the mise config; `mise install <tool>` honours it.
+        for pkg in mise_todo:
+            argv = ["mise", "install", pkg]
+            jobs.append(Job(f"mise:{pkg}", "mise", pkg, _single(argv, f"mise:{pkg}"), mise_needs, "mise"))
+
+    mas_todo = [app for app in plan.mas if app["id"] not in installed["mas"]]
+    present.extend(f"mas:{app['name']}" for app in plan.mas if app not in mas_todo)
+    mas_needs = needs_cli("mas", "brew:formulae")
+    if mas_todo and mas_needs is None:
+        log("mas not installed, skipping Mac App Store apps")
+    elif mas_todo:
+        for app in mas_todo:
+            label = f"{app['name']} ({app['id']})"
+            argv = ["mas", "install", app["id"]]
+            jobs.append(Job(f"mas:{app['id']}", "mas", label, _single(argv, f"mas:{app['name']}"), mas_needs, "mas"))
+
+    vscode_todo = missing(plan.vscode, "vscode")
+    code_needs = needs_cli("code", "brew:casks")
+    if vscode_todo and code_needs is None:
+        log("VS Code not found, skipping extensions")
+    elif vscode_todo:
+        for ext in vscode_todo:
+            argv = ["code", "--install-extension", ext, "--force"]
+            jobs.append(Job(f"vscode:{ext}", "vscode", ext, _single(argv, f"vscode:{ext}"), code_needs, "code"))
+    return jobs, present
+
+
+def execute(jobs: list[Job], limits: dict[str, int]) -> None:
+    """Run each job once its dependencies finish, within its lane's limit."""
+    by_key = {job.key: job for job in jobs}
+    lanes = {lane: threading.Semaphore(max(limit, 1)) for lane, limit in limits.items()}
+
+    def run(job: Job) -> None:
+        try:
+            for key in job.needs:
+                by_key[key].done.wait()
+            # A partly failed brew batch still counts if it delivered this CLI.
+            if job.cli and shutil.which(job.cli) is None:
+                job.skipped = True
+                return
+            with lanes.setdefault(job.lane, threading.Semaphore(1)):
+                log(f"[{job.lane}] Installing {job.label}")
+                started = time.monotonic()
+                try:
+                    job.failed = job.action()
+                except OSError as exc:
+                    job.failed = [f"{job.key} ({exc})"]
+                status = f"{len(job.failed)} failed" if job.failed else "done"
+                log(f"[{job.lane}] {job.key}: {status} in {time.monotonic() - started:.1f}s")
+        finally:
+            job.done.set()
+
+    if not jobs:
+        return
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        list(pool.map(run, jobs))
+
+
+def _parse_limits(spec: str | None) -> dict[str, int]:
+    limits = dict(LANE_LIMITS)
+    for part in filter(None, (spec or "").split(",")):
+        lane, _, value = part.partition("=")
+        limits[lane.strip()] = int(value)
+    limits["brew"] = 1  # never parallelize brew: it fails on its own lock
+    return limits
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--os", dest="os_name", default="darwin" if sys.platform == "darwin" else "linux",
+                    help="chezmoi OS name (darwin, linux)")
+    ap.add_argument("--profiles", help="comma-separated enabled profiles (default: .chezmoidata/profiles.toml)")
+    ap.add_argument("--data", help="JSON with the chezmoi `packages` data ('-' for stdin)")
+    ap.add_argument("--source", type=Path, default=REPO_ROOT, help="chezmoi source dir (without --data)")
+    ap.add_argument("--brew", help="brew executable (default: on PATH, else Linuxbrew's)")
+    ap.add_argument("--jobs", help="per-lane parallelism overrides, e.g. uv=8,vscode=2")
+    ap.add_argument("--dry-run", action="store_true", help="print what would be installed and exit")
+    args = ap.parse_args()
+
+    if args.data:
+        raw = sys.stdin.read() if args.data == "-" else Path(args.data).read_text(encoding="utf-8")
+        data = json.loads(raw)
+        packages = data.get("packages", data)
+    else:
+        packages = load_source_data(args.source)
+    if args.profiles is not None:
+        profiles = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    else:
+        profiles = default_profiles(args.source)
+
+    brew = args.brew or shutil.which("brew") or (LINUXBREW if os.access(LINUXBREW, os.X_OK) else None)
+    if brew and not shutil.which(brew) and not os.access(brew, os.X_OK):
+        brew = None
+
+    plan = resolve(packages, args.os_name, profiles)
+    print(f"Profiles: core{''.join(',' + p for p in profiles if p != 'core')} ({args.os_name})")
+    installed = query_installed(brew, plan)
+    jobs, present = build_jobs(plan, installed, brew)
+    print(f"Already installed: {len(present)}; jobs to run: {len(jobs)}")
+
+    if args.dry_run:
+        for job in jobs:
+            after = f"  (after {', '.join(job.needs)})" if job.needs else ""
+            print(f"  [{job.lane}] {job.key}: {job.label}{after}")
+        return 0
+
+    started = time.monotonic()
+    execute(jobs, _parse_limits(args.jobs))
+    if brew and any(job.lane == "brew" for job in jobs):
+        log("Running brew cleanup...")
+        _run([brew, "cleanup"])
+
+    failed = [item for job in jobs for item in job.failed]
+    skipped: dict[str, int] = {}
+    for job in jobs:
+        if job.skipped:
+            skipped[job.cli] = skipped.get(job.cli, 0) + 1
+    print("")
+    print(f"Installation summary ({time.monotonic() - started:.1f}s):")
+    for cli, count in sorted(skipped.items()):
+        print(f"Skipped {count} {cli} installs: {cli} not available")
+    if failed:
+        print("Failed packages:")
+        for item in failed:
+            print(f"  - {item}")
+    else:
+        print("All packages installed successfully.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""Profile interactive zsh startup of the real dot_zshrc.tmpl, per file and line.
+
+Renders ``dot_zshenv.tmpl`` and ``dot_zshrc.tmpl`` with ``chezmoi
+execute-template`` into a sandbox HOME (plus ``aliases.zsh`` and ``dot_zfunc``
+from the source tree, and symlinks to the plugin/tool dirs the zshrc expects in
+the real HOME), then runs ``zsh -i -c exit`` there:
+
+- ``--runs`` untraced runs give the headline wall-clock median;
+- ``--runs`` traced runs load ``zsh/zprof`` and enable ``xtrace`` with a
+  timestamped ``PS4`` (``%D{%s.%6.}`` + ``%x:%I``), so every executed line
+  is attributed to the file and line it came from.
+
+Each trace record's self-time is the gap to the next record; medians are taken
+across runs per line, then rolled up into groups: each ``~/zsh/<plugin>``
+directory, ``compinit`` (compinit/compaudit/compdump), the rendered zshrc and
+zshenv, and any other sourced file. zprof supplies per-function totals. Note
+that xtrace prints a command after expanding it, so the cost of a slow
+``$(…)`` shows up on the line traced just before it.
+
+Output is a ranked report (groups, top lines, top zprof functions) or, with
+``--json FILE``, github-action-benchmark ``customSmallerIsBetter`` entries for
+the total, compinit, and each plugin.
+
+Usage:
+    uv run scripts/profile-zsh-startup.py [--runs N] [--top N]
+        [--zshrc FILE] [--link PATH]... [--json FILE] [--markdown FILE] [--keep]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_RUNS = 10
+DEFAULT_TOP = 25
+WARMUP_RUNS = 1  # first run builds .zcompdump; keep it out of the medians
+MS_PER_S = 1000.0
+
+# Real-HOME paths the zshrc sources or execs from; symlinked into the sandbox.
+DEFAULT_LINKS = ("zsh", ".local", ".config", ".bun", ".api_tokens")
+COMPINIT_FUNCTIONS = ("compinit", "compaudit", "compdump")
+
+TRACE_ENV = "ZSH_PROFILE_TRACE"
+ZPROF_ENV = "ZSH_PROFILE_ZPROF"
+RECORD_SEP = "\x1e"
+FIELD_SEP = "\x1f"
+
+# Runs first thing in .zshenv; inert unless the profiler sets TRACE_ENV.
+PROLOGUE = f"""\
+if [[ -n ${TRACE_ENV} ]]; then
+  zmodload zsh/zprof
+  exec 3>&2 2>"${TRACE_ENV}"
+  PS4=$'{RECORD_SEP}%D{{%s.%6.}}{FIELD_SEP}%x{FIELD_SEP}%I{FIELD_SEP}'
+  setopt xtrace
+fi
+"""
+# Runs last thing in .zshrc.
+EPILOGUE = f"""\
+if [[ -n ${TRACE_ENV} ]]; then
+  unsetopt xtrace
+  exec 2>&3 3>&-
+  zprof >"${ZPROF_ENV}"
+fi
+"""
+
+# First (flat) zprof table: num) calls total-ms total/call total% self-ms self/call self% name
+ZPROF_ROW_RE = re.compile(
+    r"^\s*\d+\)\s+(?P<calls>\d+)\s+(?P<total>[\d.]+)\s+[\d.]+\s+[\d.]+%"
+    r"\s+(?P<self>[\d.]+)\s+[\d.]+\s+[\d.]+%\s+(?P<name>\S+)\s*$"
+)
+PROCESS_SUBST_RE = re.compile(r"^/(?:proc/self|dev)/fd/\d+$")
+
+
+@dataclass(frozen=True)
+class TraceRecord:
+    ts: float
+    file: str
+    line: int
+    text: str
+
+
+def render(template: Path, source: Path) -> str:
+    """Render a chezmoi template against the source tree's data."""
+    result = subprocess.run(
+        ["chezmoi", "--source", str(source), "execute-template"],
+        input=template.read_text(encoding="utf-8"),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"chezmoi execute-template {template.name} failed:\n{result.stderr.strip()}")
+    return result.stdout
+
+
+def build_sandbox(sandbox: Path, source: Path, zshrc: Path | None, links: list[str]) -> None:
+    """Populate a throwaway HOME/ZDOTDIR with the rendered startup files."""
+    real_home = Path.home()
+    for rel in links:
+        target = real_home / rel
+        if target.exists():
+            dest = sandbox / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.symlink_to(target)
+    if not (sandbox / ".api_tokens").exists():
+        (sandbox / ".api_tokens").touch()
+    aliases = source / "aliases.zsh"
+    if aliases.exists():
+        shutil.copyfile(aliases, sandbox / "aliases.zsh")
+    zfunc = source / "dot_zfunc"
+    if zfunc.is_dir():
+        shutil.copytree(zfunc, sandbox / ".zfunc")
+
+    zshrc_text = zshrc.read_text(encoding="utf-8") if zshrc else render(source / "dot_zshrc.tmpl", source)
+    zshenv_tmpl = source / "dot_zshenv.tmpl"
+    zshenv_text = render(zshenv_tmpl, source) if zshrc is None and zshenv_tmpl.exists() else ""
+    (sandbox / ".zshenv").write_text(PROLOGUE + zshenv_text, encoding="utf-8")
+    (sandbox / ".zshrc").write_text(zshrc_text.rstrip("\n") + "\n" + EPILOGUE, encoding="utf-8")
+
+
+def run_zsh(sandbox: Path, trace: Path | None = None, zprof: Path | None = None) -> float:
+    """One ``zsh -i -c exit`` in the sandbox; returns wall seconds."""
+    env = {**os.environ, "HOME": str(sandbox), "ZDOTDIR": str(sandbox)}
+    env.pop(TRACE_ENV, None)
+    if trace is not None and zprof is not None:
+        env[TRACE_ENV], env[ZPROF_ENV] = str(trace), str(zprof)
+    started = time.perf_counter()
+    result = subprocess.run(
+        ["zsh", "-i", "-c", "exit"], env=env, stdin=subprocess.DEVNULL, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"zsh -i exited {result.returncode}:\n{result.stderr.strip()[-500:]}")
+    return elapsed
+
+
+def parse_trace(text: str) -> list[TraceRecord]:
+    """Split an xtrace log written with the PROLOGUE's PS4 into records."""
+    records = []
+    for chunk in text.split(RECORD_SEP)[1:]:
+        fields = chunk.split(FIELD_SEP, 3)
+        if len(fields) < 4:
+            continue
+        try:
+            records.append(TraceRecord(float(fields[0]), fields[1], int(fields[2] or 0), fields[3].strip()))
+        except ValueError:
+            continue
+    return records
+
+
+def line_self_times(records: list[TraceRecord]) -> dict[tuple[str, int], float]:
+    """Self-time (ms) per (file, line): the gap to the next traced command."""
+    per_line: dict[tuple[str, int], float] = {}
+    for current, following in zip(records, records[1:]):
+        key = (current.file, current.line)
+        per_line[key] = per_line.get(key, 0.0) + (following.ts - current.ts) * MS_PER_S
+    return per_line
+
+
+def parse_zprof(text: str) -> dict[str, tuple[float, float]]:
+    """(total ms, self ms) per function from zprof's flat table."""
+    functions: dict[str, tuple[float, float]] = {}
+    for line in text.splitlines():
+        m = ZPROF_ROW_RE.match(line)
+        if m:
+            functions.setdefault(m.group("name"), (float(m.group("total")), float(m.group("self"))))
+        elif functions and not line.strip():
+            break  # the call-graph sections follow the first blank line
+    return functions
+
+
+def group_of(path: str, sandbox: str) -> str:
+    """Attribution bucket for a traced file path."""
+    name = os.path.basename(path)
+    if name in COMPINIT_FUNCTIONS:
+        return "compinit"
+    if PROCESS_SUBST_RE.match(path):
+        return "<process substitution>"
+    if not path.startswith("/"):
+        return path or "<unknown>"
+    prefix = sandbox.rstrip("/") + "/"
+    if path.startswith(prefix):
+        rel = path[len(prefix) :]
+        if rel.startswith("zsh/"):
+            return f"plugin:{rel.split('/')[1]}"
+        return "~/" + rel
+    return path
+
+
+def _median_by_key(samples: list[dict], keys: set) -> dict:
+    return {key: statistics.median(sample.get(key, 0.0) for sample in samples) for key in keys}
+
+
+@dataclass
+class Profile:
+    runs: int
+    total_ms: float
+    traced_ms: float
+    lines: dict[tuple[str, int], float]
+    line_text: dict[tuple[str, int], str]
+    groups: dict[str, float]
+    functions: dict[str, tuple[float, float]]
+
+
+def profile(sandbox: Path, runs: int) -> Profile:
+    for _ in range(WARMUP_RUNS):
+        run_zsh(sandbox)
+    totals = [run_zsh(sandbox) * MS_PER_S for _ in range(runs)]
+
+    line_samples: list[dict[tuple[str, int], float]] = []
+    function_samples: list[dict[str, tuple[float, float]]] = []
+    traced: list[float] = []
+    line_text: dict[tuple[str, int], str] = {}
+    with tempfile.TemporaryDirectory(prefix="zsh-profile-") as tmp:
+        trace, zprof = Path(tmp) / "trace", Path(tmp) / "zprof"
+        for _ in range(runs):
+            traced.append(run_zsh(sandbox, trace, zprof) * MS_PER_S)
+            records = parse_trace(trace.read_text(encoding="utf-8", errors="replace"))
+            for record in records:
+                line_text.setdefault((record.file, record.line), record.text)
+            line_samples.append(line_self_times(records))
+            function_samples.append(parse_zprof(zprof.read_text(encoding="utf-8", errors="replace")))
+
+    lines = _median_by_key(line_samples, {key for sample in line_samples for key in sample})
+    group_samples = []
+    for sample in line_samples:
+        grouped: dict[str, float] = {}
+        for (path, _line), ms in sample.items():
+            group = group_of(path, str(sandbox))
+            grouped[group] = grouped.get(group, 0.0) + ms
+        group_samples.append(grouped)
+    groups = _median_by_key(group_samples, {key for sample in group_samples for key in sample})
+    names = {name for sample in function_samples for name in sample}
+    functions = {
+        name: (
+            statistics.median(sample.get(name, (0.0, 0.0))[0] for sample in function_samples),
+            statistics.median(sample.get(name, (0.0, 0.0))[1] for sample in function_samples),
+        )
+        for name in names
+    }
+    return Profile(
+        runs, statistics.median(totals), statistics.median(traced), lines, line_text, groups, functions
+    )
+
+
+def _ranked(mapping: dict, top: int) -> list:
+    return sorted(mapping.items(), key=lambda item: (-item[1], str(item[0])))[:top]
+
+
+def print_report(result: Profile, sandbox: Path, top: int) -> None:
+    traced_sum = sum(result.groups.values()) or 1.0
+    print(f"zsh -i startup: {result.total_ms:.1f}ms median of {result.runs} runs "
+          f"({result.traced_ms:.1f}ms with xtrace)")
+    print("\nBy group (self-time under xtrace):")
+    for group, ms in _ranked(result.groups, top):
+        print(f"  {ms:>8.2f}ms  {ms / traced_sum:>5.1%}  {group}")
+    print("\nSlowest lines:")
+    for (path, line), ms in _ranked(result.lines, top):
+        where = f"{group_of(path, str(sandbox))}:{line}"
+        text = result.line_text.get((path, line), "").splitlines()[0:1]
+        print(f"  {ms:>8.2f}ms  {where:<40} {(text[0] if text else '')[:80]}")
+    if result.functions:
+        print("\nzprof functions (total / self):")
+        by_total = {name: times[0] for name, times in result.functions.items()}
+        for name, total in _ranked(by_total, top):
+            print(f"  {total:>8.2f}ms  {result.functions[name][1]:>8.2f}ms  {name}")
+
+
+def benchmark_json(result: Profile) -> list[dict[str, object]]:
+    """customSmallerIsBetter entries: total, compinit, and each plugin."""
+    entries: list[dict[str, object]] = [
+        {"name": "zsh -i startup (dot_zshrc)", "unit": "s", "value": round(result.total_ms / MS_PER_S, 6)}
+    ]
+    compinit = result.functions.get("compinit", (result.groups.get("compinit", 0.0), 0.0))[0]
+    entries.append({"name": "zsh compinit", "unit": "s", "value": round(compinit / MS_PER_S, 6)})
+    for group, ms in sorted(result.groups.items()):
+        if group.startswith("plugin:"):
+            plugin = group.split(":", 1)[1]
+            entries.append({"name": f"zsh plugin {plugin}", "unit": "s", "value": round(ms / MS_PER_S, 6)})
+    return entries
+
+
+def markdown_table(result: Profile, top: int) -> str:
+    lines = [
+        "## 🐚 Zsh Startup Profile (dot_zshrc)",
+        "",
+        f"**{result.total_ms:.1f}ms** median of {result.runs} runs ({result.traced_ms:.1f}ms with xtrace)",
+        "",
+        "| Group | Self time |",
+        "|---|---|",
+    ]
+    lines += [f"| {group} | {ms:.2f}ms |" for group, ms in _ranked(result.groups, top)]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="runs per mode (untraced and traced)")
+    ap.add_argument("--top", type=int, default=DEFAULT_TOP, help="rows per report section")
+    ap.add_argument("--source", type=Path, default=REPO_ROOT, help="chezmoi source dir to render from")
+    ap.add_argument("--zshrc", type=Path, help="profile an already-rendered zshrc instead (skips chezmoi)")
+    ap.add_argument("--link", action="append", metavar="PATH",
+                    help=f"HOME-relative path to symlink into the sandbox (default: {', '.join(DEFAULT_LINKS)})")
+    ap.add_argument("--json", type=Path, metavar="FILE", help="write customSmallerIsBetter JSON")
+    ap.add_argument("--markdown", type=Path, metavar="FILE", help="append a markdown summary to FILE")
+    ap.add_argument("--keep", action="store_true", help="keep the sandbox HOME and print its path")
+    args = ap.parse_args()
+    if args.runs < 1:
+        ap.error("--runs must be >= 1")
+
+    missing = [exe for exe in ("zsh", None if args.zshrc else "chezmoi") if exe and shutil.which(exe) is None]
+    if missing:
+        sys.stderr.write(f"not installed: {', '.join(missing)}\n")
+        return 1
+
+    sandbox = Path(tempfile.mkdtemp(prefix="zsh-sandbox-"))
+    try:
+        build_sandbox(sandbox, args.source, args.zshrc, args.link or list(DEFAULT_LINKS))
+        result = profile(sandbox, args.runs)
+    except RuntimeError as exc:
+        sys.stderr.write(f"{exc}\n")
+        return 1
+    finally:
+        if args.keep:
+            sys.stderr.write(f"sandbox kept at {sandbox}\n")
+        else:
+            shutil.rmtree(sandbox, ignore_errors=True)
+
+    print_report(result, sandbox, args.top)
+    if args.json:
+        args.json.write_text(json.dumps(benchmark_json(result), indent=2) + "\n")
+    if args.markdown:
+        with args.markdown.open("a", encoding="utf-8") as f:
+            f.write(markdown_table(result, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,426 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""Benchmark shell/editor startup and the repo's own Python tools.
+
+Replaces the ad-hoc hyperfine + jq steps in .github/workflows/benchmarks.yml so
+tool regressions are tracked next to shell startup in the same
+github-action-benchmark series. Two kinds of benchmark:
+
+- command: an external process (``zsh -c exit``, ``nvim --headless +quit``,
+  ``chezmoi apply --dry-run``), timed end to end. Skipped when the executable
+  is not installed.
+- tool: one of our scripts against a generated local fixture, so the number
+  moves with the code and not with the state of the checkout:
+    check-doc-references   the full CLI over a synthetic markdown corpus
+    perms-sweep transform  claude-perms-sweep ``transform()`` over many
+                           settings.json shapes
+    nvim spec parse        audit-nvim-plugins ``extract_repos`` +
+                           ``extract_spec_triggers`` over a replicated spec dir
+    nvim startuptime parse audit-nvim-plugins ``parse_startuptime`` on a
+                           synthetic ``--startuptime`` log
+
+Every benchmark runs ``--warmup`` untimed iterations, then ``--runs`` timed
+ones. Samples outside Tukey's fences (1.5 x IQR beyond the quartiles) are
+rejected before the median and stddev are computed, so a single CI hiccup does
+not show up as a regression.
+
+Usage:
+    uv run scripts/run-benchmarks.py [--runs N] [--warmup N] [--only GLOB]
+        [--json FILE] [--markdown FILE] [--list]
+
+``--json`` writes github-action-benchmark ``customSmallerIsBetter`` entries;
+``--markdown`` appends a table (e.g. to ``$GITHUB_STEP_SUMMARY``). Exit code 1
+when a benchmark fails (commands marked ignore-failure excepted).
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+NVIM_PLUGIN_DIR = REPO_ROOT / "private_dot_config/nvim/lua/exact_plugins"
+
+DEFAULT_RUNS = 10
+DEFAULT_WARMUP = 2
+MIN_SAMPLES_FOR_OUTLIERS = 4
+IQR_FENCE = 1.5
+
+DOC_CORPUS_FILES = 200
+DOC_CORPUS_SECTIONS = 20
+SETTINGS_FILES = 2000
+SPEC_COPIES = 25
+STARTUPTIME_PLUGINS = 80
+SOURCE_INDEX_COPIES = 50
+STARTUPTIME_LINES_PER_PLUGIN = 40
+
+PERMS_RULES = ("Bash(just:*)", "Bash(uv run:*)", "WebFetch", "Bash(gh pr view:*)", "mcp__context7")
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    description: str
+    # Builds fixtures under the given scratch dir, returns the callable to time.
+    prepare: Callable[[Path], Callable[[], None]]
+    requires: tuple[str, ...] = ()
+    ignore_failure: bool = False
+
+
+@dataclass
+class Result:
+    benchmark: Benchmark
+    samples: list[float] = field(default_factory=list)
+    kept: list[float] = field(default_factory=list)
+    status: str = "OK"
+    error: str = ""
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.kept)
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.kept) if len(self.kept) > 1 else 0.0
+
+    @property
+    def rejected(self) -> int:
+        return len(self.samples) - len(self.kept)
+
+
+def reject_outliers(samples: list[float]) -> list[float]:
+    """Drop samples outside Tukey's fences; small sample sets are kept whole."""
+    if len(samples) < MIN_SAMPLES_FOR_OUTLIERS:
+        return list(samples)
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    spread = (q3 - q1) * IQR_FENCE
+    kept = [s for s in samples if q1 - spread <= s <= q3 + spread]
+    return kept or list(samples)
+
+
+def _load_script(filename: str) -> ModuleType:
+    """Import a hyphenated script from scripts/ as a module."""
+    path = SCRIPTS_DIR / filename
+    spec = importlib.util.spec_from_file_location(path.stem.replace("-", "_"), path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"cannot load {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# --- command benchmarks -----------------------------------------------------
+
+
+def _command(argv: list[str], *, ignore_failure: bool = False) -> Callable[[Path], Callable[[], None]]:
+    def prepare(_scratch: Path) -> Callable[[], None]:
+        def run() -> None:
+            proc = subprocess.run(argv, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+            if proc.returncode != 0 and not ignore_failure:
+                raise RuntimeError(proc.stderr.strip()[-300:] or f"exit {proc.returncode}")
+
+        return run
+
+    return prepare
+
+
+# --- tool fixtures ------------------------------------------------------------
+
+
+DOC_SECTION = """\
+## Section {i}
+
+See [the guide](guide-{j}.md) and [setup](../docs/setup.md#install) for details,
+or the [upstream docs](https://example.invalid/{i}) and [anchor](#section-{i}).
+Run `./cleanup-mcp-servers.sh` then `scripts/tool-{j}.sh`; the hook lives at
+`exact_dot_claude/hooks/hook-{j}.sh` and config at `private_dot_config/app/config.toml`.
+Dead reference: `scripts/removed-{i}.sh` and [gone](missing/{i}.md).
+Not paths: `/configure:mcp`, `github.com/owner/repo`, `docs/adrs/NNNN-title.md`.
+
+```bash
+cat scripts/not-checked-{i}.sh
+```
+"""
+
+
+def _doc_corpus(scratch: Path) -> Path:
+    """A throwaway git repo shaped like this one: chezmoi source names + markdown."""
+    root = scratch / "doc-corpus"
+    files = {
+        "executable_cleanup-mcp-servers.sh.tmpl": "",
+        "docs/setup.md": "# Setup\n",
+        "private_dot_config/app/config.toml": "",
+    }
+    for j in range(DOC_CORPUS_SECTIONS):
+        files[f"scripts/tool-{j}.sh"] = ""
+        files[f"exact_dot_claude/hooks/executable_hook-{j}.sh"] = ""
+        files[f"docs/guide-{j}.md"] = f"# Guide {j}\n"
+    for n in range(DOC_CORPUS_FILES):
+        body = "".join(DOC_SECTION.format(i=i, j=(n + i) % DOC_CORPUS_SECTIONS) for i in range(DOC_CORPUS_SECTIONS))
+        files[f"docs/topic-{n}/README.md"] = f"# Topic {n}\n\n{body}"
+    for rel, text in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    for argv in (["git", "init", "-q"], ["git", "add", "-A"]):
+        subprocess.run(argv, cwd=root, check=True, capture_output=True)
+    return root
+
+
+def _check_doc_references(scratch: Path) -> Callable[[], None]:
+    root = _doc_corpus(scratch)
+    argv = [sys.executable, str(SCRIPTS_DIR / "check-doc-references.py")]
+
+    def run() -> None:
+        proc = subprocess.run(argv, cwd=root, capture_output=True, text=True)
+        if proc.returncode != 0 or "STATUS=FAIL" not in proc.stdout:
+            raise RuntimeError(proc.stderr.strip()[-300:] or "corpus produced no findings")
+
+    return run
+
+
+SETTINGS_SHAPES = (
+    '{{\n  "permissions": {{\n    "allow": [\n{allow}\n    ]\n  }}\n}}\n',
+    '{{\n  "$schema": "https://json.schemastore.org/claude-code-settings.json",\n'
+    '  "permissions": {{\n    "allow": [{inline}],\n    "deny": []\n  }}\n}}\n',
+    '{{\n  "$schema": "https://json.schemastore.org/claude-code-settings.json",\n  "env": {{"N": "{n}"}}\n}}\n',
+    '{{\n  "hooks": {{}},\n  "model": "m{n}"\n}}\n',
+)
+
+
+def _settings_corpus() -> list[str]:
+    texts = []
+    for n in range(SETTINGS_FILES):
+        existing = [f"Bash(tool-{n}-{k}:*)" for k in range(n % 12)] + list(PERMS_RULES[: n % len(PERMS_RULES)])
+        allow = ",\n".join(f'      "{rule}"' for rule in existing)
+        inline = ", ".join(f'"{rule}"' for rule in existing)
+        texts.append(SETTINGS_SHAPES[n % len(SETTINGS_SHAPES)].format(allow=allow, inline=inline, n=n))
+    return texts
+
+
+def _perms_transform(_scratch: Path) -> Callable[[], None]:
+    transform = _load_script("claude-perms-sweep.py").transform
+    texts = _settings_corpus()
+    rules = list(PERMS_RULES)
+
+    def run() -> None:
+        for text in texts:
+            transform(text, rules)
+
+    return run
+
+
+def _nvim_spec_parse(scratch: Path) -> Callable[[], None]:
+    audit = _load_script("audit-nvim-plugins.py")
+    spec_dir = scratch / "nvim-specs"
+    spec_dir.mkdir()
+    sources = sorted(NVIM_PLUGIN_DIR.glob("*.lua"))
+    if not sources:
+        raise RuntimeError(f"no plugin specs under {NVIM_PLUGIN_DIR}")
+    for copy in range(SPEC_COPIES):
+        for source in sources:
+            shutil.copyfile(source, spec_dir / f"{source.stem}-{copy}.lua")
+
+    def run() -> None:
+        audit.extract_repos(spec_dir)
+        audit.extract_spec_triggers(spec_dir)
+
+    return run
+
+
+def _startuptime_log() -> tuple[str, dict[str, str]]:
+    lines = ["times in msec", " clock   self+sourced   self:  sourced script", ""]
+    module_index = {}
+    clock = 0.0
+    for p in range(STARTUPTIME_PLUGINS):
+        module_index[f"mod{p}"] = f"plugin-{p}.nvim"
+        for k in range(STARTUPTIME_LINES_PER_PLUGIN):
+            clock += 0.05
+            if k % 2:
+                label = f"sourcing /home/u/.local/share/nvim/lazy/plugin-{p}.nvim/plugin/p{k}.lua"
+            else:
+                label = f"require('mod{p}.sub{k}')"
+            lines.append(f"{clock:09.3f}  000.040  000.030: {label}")
+    return "\n".join(lines) + "\n", module_index
+
+
+def _nvim_startuptime_parse(_scratch: Path) -> Callable[[], None]:
+    audit = _load_script("audit-nvim-plugins.py")
+    text, module_index = _startuptime_log()
+
+    def run() -> None:
+        audit.parse_startuptime(text, module_index)
+
+    return run
+
+
+def _source_index(_scratch: Path) -> Callable[[], None]:
+    chezmoi_source = _load_script("chezmoi_source.py")
+    listing = subprocess.run(
+        ["git", "ls-files"], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    ).stdout.splitlines()
+    tracked = [f"exact_copy-{k}/{path}" for k in range(SOURCE_INDEX_COPIES) for path in listing]
+    targets = [f"copy-{k}/.claude/settings.json" for k in range(SOURCE_INDEX_COPIES)]
+
+    def run() -> None:
+        chezmoi_source.parse_name.cache_clear()
+        index = chezmoi_source.SourceIndex(tracked)
+        for target in targets:
+            index.source_for(target)
+
+    return run
+
+
+def benchmarks() -> list[Benchmark]:
+    # Command names match the series already recorded by github-action-benchmark.
+    return [
+        Benchmark(
+            "chezmoi apply --dry-run",
+            "chezmoi apply --dry-run",
+            # May exit non-zero in CI on missing external deps; timing still counts.
+            _command(["chezmoi", "apply", "--dry-run"], ignore_failure=True),
+            requires=("chezmoi",),
+            ignore_failure=True,
+        ),
+        Benchmark("zsh startup", "zsh -c exit", _command(["zsh", "-c", "exit"]), requires=("zsh",)),
+        Benchmark("bash startup", "bash -c exit", _command(["bash", "-c", "exit"]), requires=("bash",)),
+        Benchmark("nvim startup", "nvim --headless +quit", _command(["nvim", "--headless", "+quit"]), requires=("nvim",)),
+        Benchmark(
+            "check-doc-references",
+            f"CLI over {DOC_CORPUS_FILES} synthetic docs",
+            _check_doc_references,
+            requires=("git",),
+        ),
+        Benchmark("perms-sweep transform", f"transform() over {SETTINGS_FILES} settings files", _perms_transform),
+        Benchmark("nvim spec parse", f"spec extraction over {SPEC_COPIES}x the plugin dir", _nvim_spec_parse),
+        Benchmark(
+            "chezmoi source index",
+            f"SourceIndex over {SOURCE_INDEX_COPIES}x the tracked tree",
+            _source_index,
+            requires=("git",),
+        ),
+        Benchmark(
+            "nvim startuptime parse",
+            f"parse_startuptime on {STARTUPTIME_PLUGINS * STARTUPTIME_LINES_PER_PLUGIN} log lines",
+            _nvim_startuptime_parse,
+        ),
+    ]
+
+
+def run_benchmark(benchmark: Benchmark, runs: int, warmup: int) -> Result:
+    result = Result(benchmark)
+    missing = [exe for exe in benchmark.requires if shutil.which(exe) is None]
+    if missing:
+        result.status, result.error = "SKIPPED", f"not installed: {', '.join(missing)}"
+        return result
+    with tempfile.TemporaryDirectory(prefix="bench-") as scratch:
+        try:
+            run = benchmark.prepare(Path(scratch))
+            for _ in range(warmup):
+                run()
+            for _ in range(runs):
+                started = time.perf_counter()
+                run()
+                result.samples.append(time.perf_counter() - started)
+        except Exception as exc:  # noqa: BLE001 - reported per benchmark, the rest still run
+            result.status, result.error = "FAILED", str(exc) or type(exc).__name__
+            return result
+    result.kept = reject_outliers(result.samples)
+    return result
+
+
+def benchmark_json(results: list[Result]) -> list[dict[str, object]]:
+    """Entries in github-action-benchmark's customSmallerIsBetter format."""
+    return [
+        {
+            "name": r.benchmark.name,
+            "unit": "s",
+            "value": round(r.median, 6),
+            "range": f"± {r.stddev:.6f}",
+            "extra": f"median of {len(r.kept)} runs ({r.rejected} outliers rejected)",
+        }
+        for r in results
+        if r.status == "OK"
+    ]
+
+
+def _fmt(result: Result) -> tuple[str, str, str, str]:
+    if result.status != "OK":
+        return result.status, "", "", result.error
+    return (
+        f"{result.median * 1000:.1f} ms",
+        f"± {result.stddev * 1000:.1f}",
+        f"{len(result.kept)}/{len(result.samples)}",
+        result.benchmark.description,
+    )
+
+
+def print_table(results: list[Result]) -> None:
+    print(f"{'benchmark':<24} {'median':>10} {'stddev':>10}  {'kept':<6} description")
+    for r in results:
+        median, stddev, kept, note = _fmt(r)
+        print(f"{r.benchmark.name:<24} {median:>10} {stddev:>10}  {kept:<6} {note}")
+
+
+def markdown_table(results: list[Result]) -> str:
+    lines = ["## ⚡ Benchmarks", "", "| Benchmark | Median | Std dev | Runs kept | |", "|---|---|---|---|---|"]
+    for r in results:
+        median, stddev, kept, note = _fmt(r)
+        lines.append(f"| {r.benchmark.name} | {median} | {stddev} | {kept} | {note} |")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="timed runs per benchmark")
+    ap.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="untimed runs before timing")
+    ap.add_argument("--only", action="append", metavar="GLOB", help="run benchmarks matching GLOB (repeatable)")
+    ap.add_argument("--json", type=Path, metavar="FILE", help="write customSmallerIsBetter JSON")
+    ap.add_argument("--markdown", type=Path, metavar="FILE", help="append a markdown table to FILE")
+    ap.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = ap.parse_args()
+    if args.runs < 1 or args.warmup < 0:
+        ap.error("--runs must be >= 1 and --warmup >= 0")
+
+    selected = [b for b in benchmarks() if not args.only or any(fnmatch(b.name, pat) for pat in args.only)]
+    if args.list:
+        for b in selected:
+            print(f"{b.name:<24} {b.description}")
+        return 0
+    if not selected:
+        ap.error(f"no benchmark matches {args.only}")
+
+    results = []
+    for b in selected:
+        print(f"  {b.name} ...", file=sys.stderr, flush=True)
+        results.append(run_benchmark(b, args.runs, args.warmup))
+
+    print_table(results)
+    if args.json:
+        args.json.write_text(json.dumps(benchmark_json(results), indent=2, ensure_ascii=False) + "\n")
+    if args.markdown:
+        with args.markdown.open("a", encoding="utf-8") as f:
+            f.write(markdown_table(results))
+
+    failed = [r for r in results if r.status == "FAILED" and not r.benchmark.ignore_failure]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
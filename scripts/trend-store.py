@@ -0,0 +1,453 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""Time-series store and regression detector for benchmark and health data.
+
+github-action-benchmark only compares each run to the previous one against a
+flat ``alert-threshold`` (150%), so a tool that gets 10% slower per week never
+alerts. This keeps every observation in one local store and compares new
+values to a rolling baseline instead.
+
+Store (``--store DIR``, default ``.github/benchmarks/trends``):
+
+- ``series.jsonl``: one observation per line, append-only, never rewritten.
+- ``index.json``: byte offsets of each series' lines, the ingested source keys
+  (so re-ingesting a file is a no-op) and the JSONL size it covers. A missing
+  or short index is caught up by scanning only the bytes past that size.
+
+Sources:
+
+- ``.github/benchmarks/results-*.json`` (``{run_id, timestamp, commit,
+  benchmarks: {name: {value, unit, range}}}``) and ``run-benchmarks.py --json``
+  output (github-action-benchmark entries). Time units are normalised to ms;
+  lower is better.
+- ``docs/health-history.json`` snapshots: ``overall_score`` and each
+  ``category_scores`` entry; higher is better.
+
+Detection (``check``): for each series the latest value, or each value of a
+``--candidate`` run that is not stored, is compared with the median of the
+previous ``--window`` points. Noise is a robust sigma, 1.4826 x the MAD of the
+window, combined with the candidate's own ``range`` (± stddev) and floored at
+``--noise-floor`` of the baseline. A point is a REGRESSION when it is worse by
+at least ``--threshold`` (default 10%) and by at least ``--z`` sigmas. The
+same test on the median of the last ``--recent`` points, with sigma scaled by
+1/sqrt(n), flags a DRIFT: a sustained shift that no single point makes
+significant.
+
+Structured KEY=VALUE / STATUS= output. Exit code:
+- default (advisory): always 0 — the STATUS line is the signal.
+- ``--strict``: exit 1 when any regression or drift is found.
+
+Usage:
+    trend-store.py ingest [--results GLOB]... [--benchmark-json FILE
+        [--commit SHA] [--run-id ID] [--timestamp ISO]] [--health FILE]
+    trend-store.py check [--candidate FILE] [--series GLOB] [--window N]
+        [--recent N] [--threshold PCT] [--z Z] [--strict] [--markdown FILE]
+    trend-store.py list
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import math
+import os
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_STORE = REPO_ROOT / ".github/benchmarks/trends"
+DEFAULT_RESULTS = str(REPO_ROOT / ".github/benchmarks/results-*.json")
+DEFAULT_HEALTH = REPO_ROOT / "docs/health-history.json"
+INDEX_VERSION = 1
+
+DEFAULT_WINDOW = 20
+DEFAULT_RECENT = 3
+DEFAULT_THRESHOLD = 10.0            # percent, in the worse direction
+DEFAULT_Z = 3.0
+DEFAULT_NOISE_FLOOR = 1.0           # percent of baseline; stops MAD=0 alarms
+MIN_BASELINE = 5
+MAD_TO_SIGMA = 1.4826
+
+TIME_UNITS_MS = {"ns": 1e-6, "us": 1e-3, "µs": 1e-3, "ms": 1.0, "s": 1000.0}
+RANGE_RE = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+
+
+@dataclass
+class Point:
+    series: str
+    ts: str
+    value: float
+    unit: str
+    better: str                     # "lower" | "higher"
+    source: str                     # ingest key, e.g. "results:123"
+    commit: str = ""
+    stddev: float = 0.0
+
+    def as_json(self) -> dict:
+        return dict(vars(self))
+
+
+@dataclass
+class Finding:
+    series: str
+    kind: str                       # REGRESSION | DRIFT | IMPROVED | OK | INSUFFICIENT
+    value: float
+    baseline: float
+    unit: str
+    change_pct: float = 0.0
+    z: float = 0.0
+    history: int = 0
+
+
+# --- store ------------------------------------------------------------------
+
+
+class Store:
+    """Append-only JSONL of Points plus a byte-offset index per series."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.data = root / "series.jsonl"
+        self.index_path = root / "index.json"
+        self.index = self._load_index()
+        self._catch_up()
+
+    def _load_index(self) -> dict:
+        try:
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            index = {}
+        if index.get("version") != INDEX_VERSION:
+            index = {"version": INDEX_VERSION, "bytes": 0, "sources": [], "series": {}}
+        return index
+
+    def _catch_up(self) -> None:
+        """Index lines appended after the index was last written."""
+        size = self.data.stat().st_size if self.data.exists() else 0
+        if size < self.index["bytes"]:         # store replaced: start over
+            self.index = {"version": INDEX_VERSION, "bytes": 0, "sources": [], "series": {}}
+        if size == self.index["bytes"]:
+            return
+        sources = set(self.index["sources"])
+        with self.data.open("rb") as f:
+            f.seek(self.index["bytes"])
+            offset = self.index["bytes"]
+            for raw in f:
+                if raw.endswith(b"\n"):
+                    record = json.loads(raw)
+                    self._index_point(record, offset)
+                    sources.add(record["source"])
+                    offset += len(raw)
+                else:                           # torn final write; overwritten next append
+                    break
+        self.index["sources"] = sorted(sources)
+        self.index["bytes"] = offset
+
+    def _index_point(self, record: dict, offset: int) -> None:
+        meta = self.index["series"].setdefault(
+            record["series"], {"unit": record["unit"], "better": record["better"], "offsets": []},
+        )
+        meta["offsets"].append(offset)
+
+    def has_source(self, key: str) -> bool:
+        return key in self.index["sources"]
+
+    def append(self, points: list[Point]) -> None:
+        if not points:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self.data.open("ab") as f:
+            f.truncate(self.index["bytes"])
+            offset = self.index["bytes"]
+            sources = set(self.index["sources"])
+            for point in points:
+                line = (json.dumps(point.as_json(), sort_keys=True) + "\n").encode()
+                f.write(line)
+                self._index_point(point.as_json(), offset)
+                sources.add(point.source)
+                offset += len(line)
+        self.index["sources"] = sorted(sources)
+        self.index["bytes"] = offset
+        self.save_index()
+
+    def save_index(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.index, separators=(",", ":")) + "\n", encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    def series(self, name: str) -> list[Point]:
+        """Points of one series oldest first, read by offset."""
+        offsets = self.index["series"].get(name, {}).get("offsets", [])
+        if not offsets or not self.data.exists():
+            return []
+        points = []
+        with self.data.open("rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                points.append(Point(**json.loads(f.readline())))
+        points.sort(key=lambda p: p.ts)        # stable: ingest order breaks ties
+        return points
+
+    def names(self) -> list[str]:
+        return sorted(self.index["series"])
+
+
+# --- sources ----------------------------------------------------------------
+
+
+def _stddev(range_text: object) -> float:
+    match = RANGE_RE.search(str(range_text or ""))
+    return abs(float(match.group())) if match else 0.0
+
+
+def _benchmark_point(name: str, entry: dict, ts: str, source: str, commit: str) -> Point:
+    unit = entry.get("unit", "")
+    scale = TIME_UNITS_MS.get(unit)
+    value, stddev = float(entry["value"]), _stddev(entry.get("range"))
+    if scale is not None:
+        value, stddev, unit = value * scale, stddev * scale, "ms"
+    return Point(name, ts, value, unit, "lower", source, commit, stddev)
+
+
+def results_points(path: Path) -> tuple[str, list[Point]]:
+    """Points from one .github/benchmarks/results-<run_id>.json."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    source = f"results:{data.get('run_id') or path.stem}"
+    ts, commit = data.get("timestamp", ""), data.get("commit", "")
+    return source, [
+        _benchmark_point(name, entry, ts, source, commit)
+        for name, entry in sorted(data.get("benchmarks", {}).items())
+    ]
+
+
+def benchmark_json_points(path: Path, run_id: str, ts: str, commit: str) -> tuple[str, list[Point]]:
+    """Points from run-benchmarks.py --json (github-action-benchmark entries)."""
+    source = f"results:{run_id}"
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    return source, [_benchmark_point(e["name"], e, ts, source, commit) for e in entries]
+
+
+def health_points(path: Path) -> list[tuple[str, list[Point]]]:
+    """One (source, points) per docs/health-history.json snapshot."""
+    snapshots = json.loads(path.read_text(encoding="utf-8")).get("snapshots", [])
+    out = []
+    for snap in snapshots:
+        date = snap.get("date", "")
+        source = f"health:{date}"
+        points = []
+        if isinstance(snap.get("overall_score"), (int, float)):
+            points.append(Point("health overall", date, float(snap["overall_score"]), "score", "higher", source))
+        for category, score in sorted(snap.get("category_scores", {}).items()):
+            if isinstance(score, (int, float)):
+                points.append(Point(f"health {category}", date, float(score), "score", "higher", source))
+        out.append((source, points))
+    return out
+
+
+def _git_head() -> str:
+    proc = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True)
+    return proc.stdout.strip() if proc.returncode == 0 else ""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+# --- detection --------------------------------------------------------------
+
+
+def _worse_pct(value: float, baseline: float, better: str) -> float:
+    if baseline == 0:
+        return 0.0
+    change = (value - baseline) / abs(baseline) * 100
+    return change if better == "lower" else -change
+
+
+def _robust_sigma(values: list[float], baseline: float, floor_pct: float) -> float:
+    mad = statistics.median(abs(v - baseline) for v in values)
+    return max(MAD_TO_SIGMA * mad, abs(baseline) * floor_pct / 100)
+
+
+def _shift(value: float, baseline: float, sigma: float, better: str) -> tuple[float, float]:
+    """(% worse, z) of value against baseline; negative means better."""
+    worse = _worse_pct(value, baseline, better)
+    return worse, (worse / 100 * abs(baseline) / sigma if sigma else 0.0)
+
+
+def assess(history: list[Point], candidate: Point, args: argparse.Namespace) -> Finding:
+    """Classify candidate against the rolling baseline of history."""
+    window = history[-args.window:]
+    if len(window) < MIN_BASELINE:
+        return Finding(candidate.series, "INSUFFICIENT", candidate.value, math.nan, candidate.unit, history=len(window))
+    values = [p.value for p in window]
+    baseline = statistics.median(values)
+    sigma = math.hypot(_robust_sigma(values, baseline, args.noise_floor), candidate.stddev)
+    worse, z = _shift(candidate.value, baseline, sigma, candidate.better)
+    finding = Finding(candidate.series, "OK", candidate.value, baseline, candidate.unit, worse, z, len(window))
+    if worse >= args.threshold and z >= args.z:
+        finding.kind = "REGRESSION"
+        return finding
+
+    # Drift: the median of the last --recent points (candidate included)
+    # against the window that precedes them, with sigma shrunk by sqrt(n).
+    n_recent = min(args.recent, len(history) + 1)
+    earlier = history[: len(history) + 1 - n_recent][-args.window:]
+    if n_recent >= 2 and len(earlier) >= MIN_BASELINE:
+        recent = history[len(history) + 1 - n_recent:] + [candidate]
+        earlier_values = [p.value for p in earlier]
+        drift_base = statistics.median(earlier_values)
+        drift_sigma = math.hypot(
+            _robust_sigma(earlier_values, drift_base, args.noise_floor),
+            statistics.median(p.stddev for p in recent),
+        ) / math.sqrt(len(recent))
+        shifted = statistics.median(p.value for p in recent)
+        d_worse, d_z = _shift(shifted, drift_base, drift_sigma, candidate.better)
+        if d_worse >= args.threshold and d_z >= args.z:
+            return Finding(candidate.series, "DRIFT", shifted, drift_base, candidate.unit, d_worse, d_z, len(earlier))
+
+    if worse <= -args.threshold and z <= -args.z:
+        finding.kind = "IMPROVED"
+    return finding
+
+
+def check(store: Store, args: argparse.Namespace) -> list[Finding]:
+    if args.candidate:
+        _, candidates = benchmark_json_points(Path(args.candidate), "candidate", _now(), "")
+        pairs = [(store.series(c.series), c) for c in candidates]
+    else:
+        pairs = []
+        for name in store.names():
+            points = store.series(name)
+            if points:
+                pairs.append((points[:-1], points[-1]))
+    return [
+        assess(history, candidate, args)
+        for history, candidate in pairs
+        if not args.series or any(fnmatch(candidate.series, g) for g in args.series)
+    ]
+
+
+def _fmt(value: float, unit: str) -> str:
+    return "n/a" if math.isnan(value) else f"{value:.1f} {unit}" if unit == "ms" else f"{value:g} {unit}"
+
+
+def markdown_table(findings: list[Finding]) -> str:
+    lines = [
+        "## 📈 Benchmark trends", "",
+        "| Series | Status | Value | Baseline | Change | z |",
+        "|---|---|---:|---:|---:|---:|",
+    ]
+    for f in findings:
+        lines.append(
+            f"| {f.series} | {f.kind} | {_fmt(f.value, f.unit)} | {_fmt(f.baseline, f.unit)} "
+            f"| {f.change_pct:+.1f}% | {f.z:.1f} |",
+        )
+    return "\n".join(lines) + "\n"
+
+
+# --- commands ---------------------------------------------------------------
+
+
+def cmd_ingest(store: Store, args: argparse.Namespace) -> int:
+    batches: list[tuple[str, list[Point]]] = []
+    for pattern in args.results or []:
+        for path in sorted(glob.glob(pattern)):
+            batches.append(results_points(Path(path)))
+    if args.benchmark_json:
+        run_id = args.run_id or os.environ.get("GITHUB_RUN_ID") or _now()
+        batches.append(benchmark_json_points(
+            Path(args.benchmark_json), run_id, args.timestamp or _now(), args.commit or _git_head(),
+        ))
+    if args.health and args.health.exists():
+        batches.extend(health_points(args.health))
+
+    new = [(key, points) for key, points in batches if not store.has_source(key)]
+    store.append([p for _, points in new for p in points])
+    store.save_index()
+    print("=== TREND INGEST ===")
+    print(f"SOURCES_SEEN={len(batches)}")
+    print(f"SOURCES_NEW={len(new)}")
+    print(f"POINTS_ADDED={sum(len(points) for _, points in new)}")
+    print(f"SERIES={len(store.names())}")
+    print("=== END TREND INGEST ===")
+    return 0
+
+
+def cmd_check(store: Store, args: argparse.Namespace) -> int:
+    findings = check(store, args)
+    flagged = [f for f in findings if f.kind in ("REGRESSION", "DRIFT")]
+    print("=== TREND CHECK ===")
+    print(f"SERIES_CHECKED={len(findings)}")
+    print(f"INSUFFICIENT_HISTORY={sum(f.kind == 'INSUFFICIENT' for f in findings)}")
+    print(f"REGRESSION_COUNT={len(flagged)}")
+    print(f"STATUS={'FAIL' if flagged else 'OK'}")
+    for f in findings:
+        if f.kind in ("OK", "INSUFFICIENT"):
+            continue
+        print(
+            f"{f.kind} {f.series}: {_fmt(f.value, f.unit)} vs baseline {_fmt(f.baseline, f.unit)} "
+            f"({f.change_pct:+.1f}% worse, z={f.z:.1f}, n={f.history})",
+        )
+    print("=== END TREND CHECK ===")
+    if args.markdown:
+        with open(args.markdown, "a", encoding="utf-8") as f:
+            f.write(markdown_table(findings))
+    return 1 if (flagged and args.strict) else 0
+
+
+def cmd_list(store: Store, _args: argparse.Namespace) -> int:
+    for name in store.names():
+        meta = store.index["series"][name]
+        points = store.series(name)
+        print(f"{name}: {len(points)} points, latest {_fmt(points[-1].value, meta['unit'])} ({meta['better']} is better)")
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--store", type=Path, default=DEFAULT_STORE, help="store directory")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="append new observations")
+    ingest.add_argument("--results", action="append", metavar="GLOB",
+                        help=f"results-*.json files (default: {os.path.relpath(DEFAULT_RESULTS, REPO_ROOT)})")
+    ingest.add_argument("--benchmark-json", metavar="FILE", help="run-benchmarks.py --json output")
+    ingest.add_argument("--run-id", help="source key for --benchmark-json (default: $GITHUB_RUN_ID)")
+    ingest.add_argument("--commit", help="commit for --benchmark-json (default: HEAD)")
+    ingest.add_argument("--timestamp", help="ISO timestamp for --benchmark-json (default: now)")
+    ingest.add_argument("--health", type=Path, default=DEFAULT_HEALTH, help="health-history.json")
+
+    chk = sub.add_parser("check", help="flag regressions against rolling baselines")
+    chk.add_argument("--candidate", metavar="FILE",
+                     help="compare a run-benchmarks.py --json file without storing it")
+    chk.add_argument("--series", action="append", metavar="GLOB", help="limit to matching series")
+    chk.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="baseline points")
+    chk.add_argument("--recent", type=int, default=DEFAULT_RECENT, help="points for drift (1 = off)")
+    chk.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="minimum %% worse")
+    chk.add_argument("--z", type=float, default=DEFAULT_Z, help="minimum robust z-score")
+    chk.add_argument("--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR,
+                     help="sigma floor as %% of baseline")
+    chk.add_argument("--strict", action="store_true", help="exit 1 on regressions")
+    chk.add_argument("--markdown", metavar="FILE", help="append a table (e.g. $GITHUB_STEP_SUMMARY)")
+
+    sub.add_parser("list", help="series in the store")
+    args = ap.parse_args()
+
+    if args.command == "ingest" and not (args.results or args.benchmark_json):
+        args.results = [DEFAULT_RESULTS]
+    store = Store(args.store)
+    return {"ingest": cmd_ingest, "check": cmd_check, "list": cmd_list}[args.command](store, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())